@@ -9,11 +9,20 @@
 ################################################################################
 # Python Imports
 ################################################################################
+import asyncio
+import collections
+import concurrent.futures
+import json
 import logging
+import os
+import random
+import select
+import socket
 import time
 import queue
-import copy
+import threading
 import datetime
+import zlib
 
 ################################################################################
 # Local Imports
@@ -25,7 +34,6 @@ import indigo
 # Globals
 ################################################################################
 panelFirmware = ""						# used as a comm alive flag on initiate comms
-keypadDisplayName = " "					# used to store temporary zoneDisplayName for Keypad Display Name used in creating zone devices
 
 # Simple Requests and Commands		message format[0x7e, msg_length, msg_number, {msg_contents}, checksum1, checksum2,]
 ACK = "011d"
@@ -83,6 +91,493 @@ sayActivateMedical = "A medical emergency has been activated. An Ambulance has b
 sayActivatePolice = "A duress alert has been activated. The police have been called"
 
 
+# Protocol catalog, built once at import.  Each table is a tuple indexed directly by the byte received from (or sent
+# to) the panel, with the fallback for codes the protocol does not define already filled in.
+
+# Message number (with the acknowledge required bit where the panel may set it) -> message description
+messageDescriptions = tuple({
+	0x01: "Interface Configuration Message",
+	0x03: "Zone Name Message",
+	0x04: "Zone Status Message",
+	0x05: "Zones Snapshot Message",
+	0x06: "Partition Status Message",
+	0x07: "Partitions Snapshot Message",
+	0x08: "System Status Message",
+	0x09: "X-10 Message Received",
+	0x0a: "Log Event Message",
+	0x0b: "Keypad Message Received",
+	0x10: "Program Data Reply",
+	0x12: "User Information Reply",
+	0x1c: "Command / Request Failed",
+	0x1d: "ACK",
+	0x1e: "NAK",
+	0x1f: "CAN",
+	0x21: "Interface Configuration Request",
+	0x23: "Zone Name Request",
+	0x24: "Zone Status Request",
+	0x25: "Zones Snapshot Request",
+	0x26: "Partition Status Request",
+	0x27: "Partitions Snapshot Request",
+	0x28: "System Status Request",
+	0x29: "Send X-10 Message",
+	0x2a: "Log Event Request",
+	0x2b: "Send Keypad Text Message",
+	0x2c: "Keypad Terminal Mode Request",
+	0x30: "Program Data Request",
+	0x31: "Program Data Command",
+	0x32: "User Information Request with Pin",
+	0x33: "User Information Request without Pin",
+	0x34: "Set User Code Command with Pin",
+	0x35: "Set User Code Command without Pin",
+	0x36: "Set User Authorisation Command with Pin",
+	0x37: "Set User Authorisation Command without Pin",
+	0x3a: "Store Communication Event Command",
+	0x3b: "Set Date / Time Command",
+	0x3c: "Primary Keypad Function with Pin",
+	0x3d: "Primary Keypad Function without Pin",
+	0x3e: "Secondary Keypad Function",
+	0x3f: "Zone Bypass Toggle",
+	0x81: "Interface Configuration Message",
+	0x83: "Zone Name Message",
+	0x84: "Zone Status Message",
+	0x85: "Zones Snapshot Message",
+	0x86: "Partition Status Message",
+	0x87: "Partitions Snapshot Message",
+	0x88: "System Status Message",
+	0x89: "X-10 Message Received",
+	0x8a: "Log Event Message",
+	0x8b: "Keypad Message Received",
+	0xa9: "Send X-10 Message",
+	0xab: "Send Keypad Text Message",
+	0xac: "Keypad Terminal Mode Request",
+	0xb1: "Program Data Command",
+	0xb4: "Set User Code Command with Pin",
+	0xb5: "Set User Code Command without Pin",
+	0xb6: "Set User Authorisation Command with Pin",
+	0xb7: "Set User Authorisation Command without Pin",
+	0xba: "Store Communication Event Command",
+	0xbb: "Set Clock / Calender Command",
+	0xbc: "Primary Keypad Function with Pin",
+	0xbd: "Primary Keypad Function without Pin",
+	0xbe: "Secondary Keypad Function",
+	0xbf: "Zone Bypass Toggle",
+	0xff: "end of file"
+}.get(messageNumber, "Program Error: No such message") for messageNumber in range(256))
+
+# Log event type -> (description, what byte 5 refers to: "zone", "user", "device" or "none", whether byte 6 is a
+# partition number).  Types 128 and up are special events, handled individually by _logEventMessage().
+logEventTypes = tuple({
+	0: ("Alarm", "zone", True),
+	1: ("Alarm Restore", "zone", True),
+	2: ("Bypass", "zone", True),
+	3: ("Bypass Restore", "zone", True),
+	4: ("Tamper", "zone", True),
+	5: ("Tamper Restore", "zone", True),
+	6: ("Trouble", "zone", True),
+	7: ("Trouble Restore", "zone", True),
+	8: ("Tx Low Battery", "zone", True),
+	9: ("Tx Low Battery Restore", "zone", True),
+	10: ("Zone Lost", "zone", True),
+	11: ("Zone Lost Restore", "zone", True),
+	12: ("Not Used", "zone", True),
+	13: ("Not Used", "none", False),
+	14: ("Not Used", "none", False),
+	15: ("Not Used", "none", False),
+	16: ("Not Used", "none", False),
+	17: ("Special Expansion Event", "none", False),
+	18: ("Duress", "none", True),
+	19: ("Fire Alert (Manual)", "none", True),
+	20: ("Medical Alert", "none", True),
+	21: ("Not Used", "none", False),
+	22: ("Police Panic", "none", True),
+	23: ("Keypad Tamper", "none", True),
+	24: ("Control Box Tamper", "device", False),
+	25: ("Control Box Tamper Restore", "device", False),
+	26: ("AC Failure", "device", False),
+	27: ("AC Failure Restore", "device", False),
+	28: ("Low Battery", "device", False),
+	29: ("Low Battery Restore", "device", False),
+	30: ("Over-current", "device", False),
+	31: ("Over-current Restore", "device", False),
+	32: ("Siren Tamper", "device", False),
+	33: ("Siren Tamper Restore", "device", False),
+	34: ("Telephone Fault", "none", False),
+	35: ("Telephone Fault Restore", "none", False),
+	36: ("Expander Trouble", "device", False),
+	37: ("Expander Trouble Restore", "device", False),
+	38: ("Fail To Communicate", "none", False),
+	39: ("Log Full", "none", False),
+	40: ("Opening", "user", True),
+	41: ("Closing", "user", True),
+	42: ("Exit Error", "user", True),
+	43: ("Recent Closing", "user", True),
+	44: ("Auto Test", "none", False),
+	45: ("Start Program", "none", False),
+	46: ("End Program", "none", False),
+	47: ("Start Download", "none", False),
+	48: ("End Download", "none", False),
+	49: ("Cancel", "user", True),
+	50: ("Ground Fault", "none", False),
+	51: ("Ground Fault Restore", "none", False),
+	52: ("Manual Test", "none", False),
+	53: ("Closed with Zones Bypassed", "user", True),
+	54: ("Start of Listen In", "none", False),
+	55: ("Technician On Site", "none", False),
+	56: ("Technician Left", "none", False),
+	57: ("Control Power Up", "none", False),
+	119: ("Not Used", "none", False),
+	120: ("First To Open", "user", True),
+	121: ("Last to Close", "user", True),
+	122: ("Pin Entered with Bit 7 Set", "user", True),
+	123: ("Begin Walk Test", "none", False),
+	124: ("End Walk Test", "none", False),
+	125: ("Re-Exit", "none", True),
+	126: ("Output Trip", "user", False),
+	127: ("Data Lost", "none", False)
+}.get(eventType, ("Program Error: No such event", None, False)) for eventType in range(128))
+
+# Log event device address -> module description
+logEventDevices = tuple({
+	0: "Security Panel",
+	**{address: f"Hardwired Expander NX-216E (start zone {17 + (address - 16) * 8})" for address in range(16, 22)},
+	23: "Hardwired Expander NX-216E (start zone 09)",
+	**{address: f"Relay Expander NX-507E or Output Expander NX-508E (module {address - 23})" for address in range(24, 32)},
+	32: "Wireless Receiver NX-448E (module 6)",
+	33: "Wireless Receiver NX-448E (module 7)",
+	34: "Wireless Receiver NX-448E (module 8)",
+	35: "Wireless Receiver NX-448E (module 1)",
+	36: "Wireless Receiver NX-448E (module 2)",
+	37: "Wireless Receiver NX-448E (module 3)",
+	38: "Wireless Receiver NX-448E (module 4)",
+	39: "Wireless Receiver NX-448E (module 5)",
+	**{address: f"Remote Power Supply NX-320E (module {address - 83})" for address in range(84, 92)},
+	**{address: f"Hardwired Expander NX-216E (start zone {65 + (address - 96) * 8})" for address in range(96, 112)},
+	**{address: f"Keypad ({(address - 192) // 8 + 1})" for address in range(192, 256)}
+}.get(address, "Program Error: No such device") for address in range(256))
+
+
+def bitTable(names: tuple) -> tuple:
+	"""
+	Decoding table for one message byte (or nibble) of bit flags.
+
+	:param names: The state name of each bit, most significant bit first.  None marks a bit that is not stored.
+	:return: Tuple indexed by the byte value, of the (state name, "0" or "1") pairs for that value.
+	"""
+	masks = [(name, 1 << bit) for bit, name in zip(range(len(names) - 1, -1, -1), names) if name is not None]
+	return tuple(tuple((name, "1" if value & mask else "0") for name, mask in masks) for value in range(1 << len(names)))
+
+
+def valueTable(name: str, enum: dict | None = None, default=None) -> tuple:
+	"""
+	Decoding table for one message byte stored as a single value, in the same form as a bitTable().
+
+	:param name: The state name.
+	:param enum: Optional mapping of byte value to stored value.  Without it the byte value itself is stored.
+	:param default: Stored for byte values not in *enum*.
+	:return: Tuple indexed by the byte value, of the single (state name, value) pair for that value.
+	"""
+	return tuple(((name, value if enum is None else enum.get(value, default)),) for value in range(256))
+
+
+def compileDecoder(fields: tuple):
+	"""
+	Build the decoder for a set of message bytes.
+
+	:param fields: The (frame offset, bitTable() or valueTable()) of each byte.
+	:return: Function taking a received frame, and returning the (name, value) pairs of all the bytes in order.
+	"""
+	if not fields:
+		return lambda dataDict: ()
+	if len(fields) == 1:
+		((offset, table),) = fields
+		return lambda dataDict: table[dataDict[offset]]
+
+	def decode(dataDict: bytes) -> list:
+		pairs = []
+		for offset, table in fields:
+			pairs += table[dataDict[offset]]
+		return pairs
+	return decode
+
+
+# Bit-flag tables, built once at import.  A handler looks up each received byte in its table instead of formatting
+# and slicing bit strings.
+
+# Interface Configuration Message, bytes 6 - 11
+transitionMessageFlags1Bits = bitTable((
+	"partitionSnapshotMessage", "partitionStatusMessage", "zoneSnapshotMessage", "zoneStatusMessage",
+	"zreservedBit3TransitionMessageFlags1", "zreservedBit2TransitionMessageFlags1",
+	"interfaceConfigurationMessage", "zreservedBit0TransitionMessageFlags1"
+))
+transitionMessageFlags2Bits = bitTable((
+	"zreservedBit7TransitionMessageFlags2", "zreservedBit6TransitionMessageFlags2",
+	"zreservedBit5TransitionMessageFlags2", "zreservedBit4TransitionMessageFlags2", "keypadMessageReceived",
+	"logEventReceived", "receivedX10Message", "systemStatusMessage"
+))
+requestCommandFlags1Bits = bitTable((
+	"partitionSnapshotRequest", "partitionStatusRequest", "zoneSnapshotRequest", "zoneStatusRequest",
+	"zoneNameRequest", "zreservedBit2RequestCommandFlags1", "interfaceConfigurationRequest",
+	"zreservedBit0RequestCommandFlags1"
+))
+requestCommandFlags2Bits = bitTable((
+	"zreservedBit7RequestCommandFlags2", "zreservedBit6RequestCommandFlags2", "zreservedBit5RequestCommandFlags2",
+	"keypadTerminalModeRequest", "sendKeypadTextMessage", "logEventRequest", "sendX10Message",
+	"systemStatusRequest"
+))
+requestCommandFlags3Bits = bitTable((
+	"setUserAuthorisationCommandWithoutPin", "setUserAuthorisationCommandWithPin", "setUserCodeCommandWithoutPin",
+	"setUserCodeCommandWithPin", "userInformationRequestWithoutPin", "userInformationRequestWithPin",
+	"programDataCommand", "programDataRequest"
+))
+requestCommandFlags4Bits = bitTable((
+	"zoneBypassToggle", "secondaryKeypadFunction", "primaryKeypadFunctionWithoutPin",
+	"primaryKeypadFunctionWithPin", "setClockCalenderCommand", "storeCommunicationEventCommand",
+	"zreservedBit1RequestCommandFlags4", "zreservedBit0RequestCommandFlags4"
+))
+
+# Zone Status Message, bytes 3 - 8; unnamed condition bits are reserved and not stored
+zonePartitionMaskBits = bitTable((
+	"partition8", "partition7", "partition6", "partition5", "partition4", "partition3", "partition2", "partition1"
+))
+zoneTypeFlag1Bits = bitTable((
+	"localOnly", "interior", "entryExitDelay2", "entryExitDelay1", "follower", "keySwitch", "in24HourFormat",
+	"fire"
+))
+zoneTypeFlag2Bits = bitTable((
+	"entryGuard", "forceArmable", "groupBypassable", "bypassableType", "chime", "steadySiren", "yelpingSiren",
+	"keypadSounder"
+))
+zoneTypeFlag3Bits = bitTable((
+	"listenIn", "restorable", "swingerShutdown", "dialerDelay", "crossZone", "troubleZoneType", "doubleEOLTamper",
+	"fastLoopResponse"
+))
+
+# Zone group type number and description, by zone type flag bytes 1 - 3 as one 24-bit integer (byte 1 most
+# significant).  Types 22 - 24, 29 and 30 use the same flags as earlier types, so cannot be told apart from them.
+zoneGroups = {
+	0x0013f4: ("01", "Day/Night Alarm"),
+	0x0213c0: ("02", "Panic Alarm"),
+	0x101bf0: ("03", "Entry/Exit (delay1)"),
+	0x1813f0: ("04", "Interior Alarm"),
+	0x5813f0: ("05", "Interior Alarm"),
+	0x001bf0: ("06", "Perimeter Alarm"),
+	0x0200c0: ("07", "Silent Panic"),
+	0x0105c4: ("08", "Fire Alarm"),
+	0x201bf0: ("09", "Entry/Exit (delay2)"),
+	0x0a10c0: ("10", "Tamper Alarm"),
+	0x040000: ("11", "Arm/Disarm (momentary keyswitch)"),
+	0x5813f8: ("12", "Interior Alarm (cross zone)"),
+	0x009bf0: ("13", "Perimeter Alarm (entry guard)"),
+	0x103bf0: ("14", "Entry/Exit (delay1, group bypass)"),
+	0x5833f0: ("15", "Interior Alarm (group bypass)"),
+	0x003bf0: ("16", "Perimeter Alarm (group bypass)"),
+	0x101bf2: ("17", "Arm/Disarm (maintained keyswitch)"),
+	0x5813f2: ("18", "Entry/Exit (delay1, force armable)"),
+	0x001bf2: ("19", "Entry/Exit (delay2, force armable)"),
+	0x201bf2: ("20", "Entry/Exit (delay2, chime enabled)"),
+	0x0a11c0: ("21", "Gas Detected or Low/High Temp"),
+	0x8a1800: ("25", "Interior Alarm"),
+	0x6813f0: ("26", "Burglary Alarm (supervised local)"),
+	0x5853f0: ("27", "Perimeter Alarm (activity monitor)"),
+	0x205bf0: ("28", "Perimeter Alarm (request to exit)"),
+}
+unknownZoneGroup = ("no zone group match", "no zone group match")
+
+
+def zoneGroup(zoneTypeMask: int) -> tuple[str, str]:
+	"""
+	Classify a zone by its type flags.
+
+	:param zoneTypeMask: Zone type flag bytes 1 - 3 of the Zone Status Message (frame offsets 4 - 6) as one integer.
+	:return: The zone group type number and description, both "no zone group match" for any other combination.
+	"""
+	return zoneGroups.get(zoneTypeMask, unknownZoneGroup)
+
+
+zoneConditionFlag1Bits = bitTable((
+	None, "lossOfSupervision", "lowBattery", "inhibitedForceArmed", "bypassedCondition", "troubleCondition",
+	"tampered", "faultedOrDelayedTrip"
+))
+zoneConditionFlag2Bits = bitTable((
+	None, None, None, None, None, None, "bypassMemory", "alarmMemoryCondition"
+))
+
+# zoneState for each zone condition flags 1 byte.  When several conditions are present the first one in this order
+# wins: a tamper is always reported, a bypassed or inhibited zone is out of service so its faults are not triggers,
+# then an active trip, then the maintenance conditions.
+zoneStatePriority = (
+	(0x02, "tampered"), (0x08, "bypassed"), (0x10, "inhibited"), (0x01, "triggered"), (0x40, "supervisionLoss"),
+	(0x04, "trouble"), (0x20, "lowBattery")
+)
+zoneStateNames = tuple(
+	next((name for mask, name in zoneStatePriority if condition & mask), "normal") for condition in range(256)
+)
+
+# Zones Snapshot Message, one nibble per zone
+zoneSnapshotBits = bitTable((
+	"alarmMemoryCondition", "troubleCondition", "bypassedCondition", "faultedOrDelayedTrip"
+))
+
+# Partition Status Message, bytes 3 - 6, 8 and 9
+partitionConditionFlag1Bits = bitTable((
+	"instant", "armedSystem", "reservedbit5ConditionFlag1", "tLMFaultMemory", "firePulsingBuzzer", "fire",
+	"fireTrouble", "bypassCodeRequired"
+))
+partitionConditionFlag2Bits = bitTable((
+	"cancelPending", "codeEntered", "cancelCommandEntered", "tamper", "alarmMemoryCondition", "steadySirenOn",
+	"sirenOn", "previousAlarm"
+))
+partitionConditionFlag3Bits = bitTable((
+	"exit2", "exit1", "delayExpirationWarning", "entry", "chimeModeOn", "entryGuardStayMode", "silentExitEnabled",
+	"reservedbit0ConditionFlag3"
+))
+partitionConditionFlag4Bits = bitTable((
+	"sensorLostSupervision", "sensorLowBattery", "autoHomeInhibited", "exitErrorTriggered",
+	"reservedbit3ConditionFlag4", "recentClosingBeingTimed", "crossTiming", "ledExtinguish"
+))
+partitionConditionFlag5Bits = bitTable((
+	"toneOnActivationTone", "errorBeepTripleBeep", "chimeOnSounding", "validPinAccepted", "readyToForceArm",
+	"readyToArm", "forceArmTriggeredByAutoArm", "zoneBypass"
+))
+partitionConditionFlag6Bits = bitTable((
+	"delayTripInProgressCommonZone", "keySwitchArmed", "cancelReportIsInTheStack", "alarmSendUsingPhoneNumber3",
+	"alarmSendUsingPhoneNumber2", "alarmSendUsingPhoneNumber1", "openPeriod", "entry1"
+))
+
+# Partition Snapshot Message, one byte per partition
+partitionSnapshotBits = bitTable((
+	"partitionPreviousAlarm", "anyExitDelay", "anyEntryDelay", "chimeMode", "stayArm", "exitArm", "securityReady",
+	"validPartition"
+))
+
+# System Status Message, bytes 3 - 11
+panelByte03Bits = bitTable((
+	"twoWayLockout", "listenInActive", "usingBackupPhone", "dialerDelayInProgress", "downloadInProgress",
+	"initialHandshakeReceived", "offHook", "lineSeizure"
+))
+panelByte04Bits = bitTable((
+	"acFail", "lowBattery", "sirenTamper", "boxTamper", "fuseFault", "failToCommunicate", "phoneFault",
+	"groundFault"
+))
+panelByte05Bits = bitTable((
+	"zreservedbit7PanelByte5", "expanderBellFault", "auxiliaryCommChannelFailure", "expanderAuxOverCurrent",
+	"expanderLossOffSupervision", "expanderLowBattery", "expanderACFailure", "expanderBoxTamper"
+))
+panelByte06Bits = bitTable((
+	"busDeviceRequestedSniffMode", "busDeviceHasLineSeized", "globalSteadySiren", "globalSirenOn",
+	"globalPulsingBuzzer", "pinRequiredForLocalDownload", "programmingTokenInUse", "enable6DigitPin"
+))
+panelByte07Bits = bitTable((
+	"timingHighVoltageBatteryCharge", "linePowerDetected50Hz", "smokePowerReset",
+	"fireAlarmVerificationBeingTimed", "groundFaultMemory", "lowBatteryMemory", "acPowerOn", "dynamicBatteryTest"
+))
+panelByte08Bits = bitTable((
+	"timingACancelWindow", "controlShutdownMode", "testFixtureMode", "enrollRequested", "lossOfSystemTime",
+	"walkTestMode", "powerUpDelayInProgress", "communicationSinceLastAutoTest"
+))
+panelByte09Bits = bitTable((
+	"callBackInProgress", "zreservedbit6PanelByte9", "zreservedbit5PanelByte9", "zreservedbit4PanelByte9",
+	"zreservedbit3PanelByte9", "zreservedbit2PanelByte9", "zreservedbit1PanelByte9", "zreservedbit0PanelByte9"
+))
+panelByte10Bits = bitTable((
+	"listenInTrigger", "listenInRequested", "lastReadWasOffHook", "sniffing", "phoneLineMonitorEnabled",
+	"housePhoneOffHook", "voltagePresentInterruptActive", "phoneLineFaulted"
+))
+panelByte11Bits = bitTable((
+	"validPartition8", "validPartition7", "validPartition6", "validPartition5", "validPartition4",
+	"validPartition3", "validPartition2", "validPartition1"
+))
+
+# User Information Reply, bytes 6 and 7
+userAuthorityFlag1Bits = bitTable((
+	"mustBe0", "openCloseReportEnabled", "bypassEnabled", "armDisarmEnabled", "masterProgram",
+	"armOnlyDuringCloseWindow", "armOnly", "reservedbit0UserAuthorityFlag1"
+))
+userAuthorisedPartitionBits = bitTable((
+	"authorisedForPartition8", "authorisedForPartition7", "authorisedForPartition6", "authorisedForPartition5",
+	"authorisedForPartition4", "authorisedForPartition3", "authorisedForPartition2", "authorisedForPartition1"
+))
+
+# System Status Message, byte 2
+panelModels = {0: "None", 1: "NX-4", 2: "NX-6", 3: "NX-8", 4: "NX-8e", 10: "NX-6v2", 12: "NX-8v2"}
+
+
+class CaddxMessageType(object):
+	"""
+	One row of the received message schema.
+
+	The fixed-layout bytes of the message are described as (frame offset, table) fields, grouped by where the decoded
+	values are stored: plugin preferences, device states or device pluginProps.  Each group is compiled once into a
+	decoder function returning the (name, value) pairs for a frame.  Anything that is not a plain byte lookup (names,
+	PINs, multi-record snapshots) is left to the handler.
+	"""
+	__slots__ = ("name", "handler", "length", "decodePrefs", "decodeStates", "decodeProps")
+
+	def __init__(self, name: str, handler: str, length: int, prefs: tuple = (), states: tuple = (), props: tuple = ()):
+		"""
+		:param name: Message description.
+		:param handler: Name of the Caddx method processing the message.
+		:param length: Minimum frame length (including the length byte) the handler needs.
+		:param prefs: Fields stored in plugin preferences.
+		:param states: Fields stored as device states.
+		:param props: Fields stored in device pluginProps.
+		"""
+		self.name = name
+		self.handler = handler
+		self.length = length
+		self.decodePrefs = compileDecoder(prefs)
+		self.decodeStates = compileDecoder(states)
+		self.decodeProps = compileDecoder(props)
+
+
+interfaceConfigurationFields = (
+	(6, transitionMessageFlags1Bits), (7, transitionMessageFlags2Bits), (8, requestCommandFlags1Bits),
+	(9, requestCommandFlags2Bits), (10, requestCommandFlags3Bits), (11, requestCommandFlags4Bits)
+)
+systemStatusFields = (
+	(3, panelByte03Bits), (4, panelByte04Bits), (5, panelByte05Bits), (6, panelByte06Bits), (7, panelByte07Bits),
+	(8, panelByte08Bits), (9, panelByte09Bits), (10, panelByte10Bits), (11, panelByte11Bits),
+	(12, valueTable("communicatorStackPointer"))
+)
+userInformationFields = ((6, userAuthorityFlag1Bits), (7, userAuthorisedPartitionBits))
+
+# Received message schema, by message number.  decodeReceivedData() dispatches on it, and the handlers decode with
+# its compiled decoders.
+messageSchema = {
+	0x01: CaddxMessageType(
+		"Interface Configuration Message", "_interfaceConfigurationMessage", 12,
+		prefs=interfaceConfigurationFields, states=interfaceConfigurationFields),
+	0x03: CaddxMessageType("Zone Name Message", "_zoneNameMessage", 19),
+	0x04: CaddxMessageType(
+		"Zone Status Message", "_zoneStatusMessage", 9,
+		props=((3, zonePartitionMaskBits), (4, zoneTypeFlag1Bits), (5, zoneTypeFlag2Bits), (6, zoneTypeFlag3Bits)),
+		states=((7, zoneConditionFlag1Bits), (8, zoneConditionFlag2Bits))),
+	0x05: CaddxMessageType("Zones Snapshot Message", "_zoneSnapshotMessage", 11),
+	0x06: CaddxMessageType(
+		"Partition Status Message", "_partitionStatusMessage", 10,
+		states=(
+			(3, partitionConditionFlag1Bits), (4, partitionConditionFlag2Bits), (5, partitionConditionFlag3Bits),
+			(6, partitionConditionFlag4Bits), (7, valueTable("lastUserNumber")), (8, partitionConditionFlag5Bits),
+			(9, partitionConditionFlag6Bits))),
+	0x07: CaddxMessageType("Partitions Snapshot Message", "_partitionSnapshotMessage", 10),
+	0x08: CaddxMessageType(
+		"System Status Message", "_systemStatusMessage", 13,
+		prefs=systemStatusFields,
+		states=((2, valueTable("systemNumber")), (2, valueTable("model", panelModels, "Other"))) + systemStatusFields),
+	0x09: CaddxMessageType("X-10 Message Received", "_x10MessageReceived", 5),
+	0x0a: CaddxMessageType("Log Event Message", "_logEventMessage", 7),
+	0x0b: CaddxMessageType("Keypad Message Received", "_keypadMessageReceived", 4),
+	0x10: CaddxMessageType("Program Data Reply", "_programDataReply", 14),
+	0x12: CaddxMessageType(
+		"User Information Reply", "_userInformationReply", 8,
+		props=userInformationFields, states=userInformationFields),
+	0x1c: CaddxMessageType("Command / Request Failed", "_acknowledgeMessage", 2),
+	0x1d: CaddxMessageType("ACK", "_acknowledgeMessage", 2),
+	0x1e: CaddxMessageType("NAK", "_acknowledgeMessage", 2),
+	0x1f: CaddxMessageType("Message Rejected", "_acknowledgeMessage", 2),
+}
+
+
 class CaddxException(Exception):
 	pass
 
@@ -95,6 +590,1177 @@ class CaddxProgramError(CaddxException):
 	pass
 
 
+class CaddxFrameError(CaddxException):
+	pass
+
+
+class CaddxChecksumError(CaddxFrameError):
+	pass
+
+
+class CaddxCommandFailed(CaddxException):
+	pass
+
+
+class CaddxFrameDecoder(object):
+	"""
+	Incremental decoder for the NX-584 binary serial stream.
+
+	Received bytes are appended with feed() in whatever sized chunks the port delivers, and partial frames are kept
+	in the buffer across reads.  nextFrame() hands back each complete, un-stuffed, checksum-verified frame in turn.
+
+	With *resync* set, a framing error does not stop decoding.  The decoder instead scans forward to the next start
+	character and carries on from there, so good frames queued behind a corrupted byte are not lost.  Every byte
+	thrown away this way (or as part of a frame that failed its checksum) is counted in *bytesSkipped*.
+	"""
+
+	def __init__(self, resync: bool = False):
+		self.buffer = bytearray()
+		self.resync = resync
+		self.bytesSkipped = 0
+
+	def feed(self, data: bytes) -> None:
+		"""
+		Append received bytes to the decode buffer.
+
+		:param data: Raw (still byte stuffed) bytes as read from the port.
+		:return: None
+		"""
+		self.buffer += data
+
+	def reset(self) -> None:
+		"""
+		Discard everything buffered, including any partial frame.
+
+		:return: None
+		"""
+		del self.buffer[:]
+
+	def frames(self):
+		"""
+		Generator yielding every complete frame currently buffered.  Stops at the first partial frame.
+		Frame errors are raised exactly as for nextFrame().
+		"""
+		frame = self.nextFrame()
+		while frame is not None:
+			yield frame
+			frame = self.nextFrame()
+
+	def nextFrame(self) -> bytes | None:
+		"""
+		Extract the next complete frame from the buffer.
+
+		:return: None if no complete frame is buffered yet.  Otherwise the frame (length byte, message number and
+			message data) with the checksum removed.
+		:raises CaddxChecksumError: A complete frame failed the checksum.  The frame has been consumed.
+		:raises CaddxFrameError: The stream is out of sync and resync is off.  Nothing has been consumed; caller
+			should flush.
+		"""
+		while True:
+			try:
+				return self._decodeFrame()
+			except CaddxChecksumError:
+				raise
+			except CaddxFrameError:
+				if not self.resync:
+					raise
+				self._skipToNextStart()
+
+	def _skipToNextStart(self) -> None:
+		"""
+		Drop bytes up to (not including) the next start character after the head of the buffer.
+
+		:return: None
+		"""
+		buffer = self.buffer
+		nextStart = buffer.find(b'\x7e', 1)
+		if nextStart == -1:
+			nextStart = len(buffer)
+		self.bytesSkipped += nextStart
+		del buffer[:nextStart]
+
+	def _decodeFrame(self) -> bytes | None:
+		"""
+		Decode the frame at the head of the buffer.
+
+		A start character (0x7e) never occurs inside a stuffed frame, so a frame runs from its start character up to
+		the next one (or the end of the buffer).  Un-stuffing and validation are done on that whole slice at once.
+
+		:return: As nextFrame().
+		:raises CaddxChecksumError: As nextFrame().
+		:raises CaddxFrameError: Head of the buffer is not a valid frame.  Nothing has been consumed.
+		"""
+		buffer = self.buffer
+		if not buffer:
+			return None
+		if buffer[0] != 0x7e:
+			raise CaddxFrameError("Message buffer out of sync.  Missing start character.")
+		end = buffer.find(b'\x7e', 1)
+		if end == -1:
+			stuffed = bytes(buffer[1:])
+			if stuffed.endswith(b'\x7d'):
+				stuffed = stuffed[:-1]  # Second half of the escape sequence not received yet.
+		else:
+			stuffed = bytes(buffer[1:end])
+
+		escapes = stuffed.count(b'\x7d')
+		if escapes:
+			if escapes != stuffed.count(b'\x7d\x5e') + stuffed.count(b'\x7d\x5d'):
+				raise CaddxFrameError("Bad byte stuffing.")
+			# 0x7d5e must be replaced first, so that an escaped 0x7d followed by a literal 0x5e survives intact.
+			msgData = stuffed.replace(b'\x7d\x5e', b'\x7e').replace(b'\x7d\x5d', b'\x7d')
+		else:
+			msgData = stuffed
+
+		if not msgData:
+			if end == -1:
+				return None
+			raise CaddxFrameError("Missing length.")
+		msgLengthFull = msgData[0] + 3  # Full message length includes length byte and 2 byte checksum
+		if len(msgData) < msgLengthFull:
+			if end == -1:
+				return None
+			raise CaddxFrameError(f"Message data wrong length ({len(msgData)} != {msgLengthFull}).")
+		if len(msgData) == msgLengthFull:
+			consumed = len(stuffed)
+		else:
+			# Trailing bytes that belong to no frame.  Only consume the frame itself and leave the rest to be
+			# reported as out of sync on the next call.
+			consumed = self._stuffedLength(stuffed, msgLengthFull)
+			msgData = msgData[:msgLengthFull]
+		del buffer[:consumed + 1]
+
+		offeredChecksum = msgData[-2] | (msgData[-1] << 8)
+		frame = msgData[:-2]
+		if offeredChecksum != fletcher16(frame):
+			self.bytesSkipped += consumed + 1
+			raise CaddxChecksumError("Checksum failed.")
+		return frame
+
+	@staticmethod
+	def _stuffedLength(stuffed: bytes, length: int) -> int:
+		"""
+		Number of stuffed bytes needed to produce *length* un-stuffed bytes.
+
+		:param stuffed: Byte stuffed data, already known to be well-formed.
+		:param length: Number of un-stuffed bytes wanted.
+		:return: Length of the matching stuffed prefix.
+		"""
+		index = 0
+		for i in range(length):
+			index += 2 if stuffed[index] == 0x7d else 1
+		return index
+
+
+def fletcher16(data: bytes | bytearray) -> int:
+	"""
+	Returns the Fletcher16 checksum value in integer format.
+	Eight-bit implementation.
+
+	Both sums are reduced modulo 255 once at the end rather than per byte; the result is identical.
+
+	:param data: The data message to be checksummed.
+	:return: 16-bit checksum.
+	"""
+	sum1 = 0
+	sum2 = 0
+	for byte in data:
+		sum1 += byte
+		sum2 += sum1
+	return ((sum2 % 255) << 8) | (sum1 % 255)
+
+
+def _encodeMessage(transmitDataHex: str) -> bytes:
+	"""
+	Build the complete wire frame for a message: start character, byte stuffed message and checksum.
+
+	:param transmitDataHex: Hex-encoded message (length byte, message number and data).
+	:return: Encoded frame ready to write to the port.
+	"""
+	transmitMessage = bytes.fromhex(transmitDataHex)
+	transmitMessage += fletcher16(transmitMessage).to_bytes(2, byteorder="little")
+	# Escape 0x7d before 0x7e, otherwise the 0x7d of every new 0x7d5e sequence would be escaped a second time.
+	return b'\x7e' + transmitMessage.replace(b'\x7d', b'\x7d\x5d').replace(b'\x7e', b'\x7d\x5e')
+
+
+def encodeMessage(transmitDataHex: str) -> bytes:
+	"""
+	Return the wire frame for a message.  Fixed commands come straight from the precomputed frame cache.
+
+	:param transmitDataHex: Hex-encoded message (length byte, message number and data).
+	:return: Encoded frame ready to write to the port.
+	"""
+	encodedMessage = encodedFrameCache.get(transmitDataHex)
+	if encodedMessage is None:
+		encodedMessage = _encodeMessage(transmitDataHex)
+	return encodedMessage
+
+
+# Wire frames for every command that never carries a variable argument.
+encodedFrameCache = {
+	command: _encodeMessage(command) for command in (
+		ACK, NAK, CAN, cmdArmStay, cmdArmAway, cmdDisarm, cmdFirePanic, cmdMedicalPanic, cmdPolicePanic,
+		cmdTurnOffSounderOrAlarm, cmdCancel, cmdInitiateAutoArm, cmdStartWalkTestMode, cmdStopWalkTestMode,
+		cmdStay1ButtonArmToggleInteriors, cmdChimeToggleChimeMode, cmdExitButtonArmToggleInstant, cmdBypassInteriors,
+		cmdSmokeDetectorReset, cmdAutoCallbackDownload, cmdManualPickupDownload, cmdEnableSilentExitForThisArmCycle,
+		cmdPerformTest, cmdGroupBypass, cmdAuxiliaryFunction1, cmdAuxiliaryFunction2, cmdStartKeypadSounder,
+		cmdInterfaceConfigurationRequest, cmdPartitionSnapshotRequest, cmdSystemStatusRequest
+	)
+}
+
+
+def expectedReplies(messageNumber: int) -> tuple[int, ...]:
+	"""
+	Message numbers the panel may answer a command or request with.  A request (0x21 - 0x33) is answered by the
+	message 0x20 below it, e.g. Zone Status Request 0x24 by Zone Status Message 0x04, except that both User
+	Information Requests (0x32 with PIN, 0x33 without) are answered by User Information Reply 0x12.  Everything may be
+	answered by ACK, NAK, Command / Request Failed or Message Rejected.
+
+	:param messageNumber: Message number of the command or request, without the acknowledge bit.
+	:return: Acceptable reply message numbers.
+	"""
+	if messageNumber in (0x32, 0x33):
+		return 0x12, 0x1c, 0x1d, 0x1e, 0x1f
+	if 0x21 <= messageNumber <= 0x31:
+		return messageNumber - 0x20, 0x1c, 0x1d, 0x1e, 0x1f
+	return 0x1c, 0x1d, 0x1e, 0x1f
+
+
+class CaddxCommand(object):
+	"""
+	A command or request in the command queue, with the replies that complete it.
+
+	Zone Name, Zone Status, Zones Snapshot, Partition Status and User Information replies also carry the zone, zone
+	block, partition or user number the request asked for, so an unsolicited message for another one is not taken as
+	the reply.
+	"""
+	__slots__ = ("transmitDataHex", "messageNumber", "replyTypes", "replyIndex", "reply", "callbacks")
+
+	retryReplies = (0x1c, 0x1e)		# Command / Request Failed, NAK: send again
+	failReplies = (0x1f,)			# Message Rejected: sending again will not help
+	# request message number -> offset in transmitDataHex of the number its reply repeats in byte 2
+	replySelectors = {0x23: 4, 0x24: 4, 0x25: 4, 0x26: 4, 0x32: 10, 0x33: 4}
+
+	def __init__(self, transmitDataHex: str):
+		self.transmitDataHex = transmitDataHex
+		self.messageNumber = int(transmitDataHex[2:4], 16) & 0x3f
+		self.replyTypes = expectedReplies(self.messageNumber)
+		selector = self.replySelectors.get(self.messageNumber)
+		if selector is not None and len(transmitDataHex) >= selector + 2:
+			self.replyIndex = int(transmitDataHex[selector:selector + 2], 16)
+		else:
+			self.replyIndex = None
+		self.reply = None							# the reply frame, once received
+		self.callbacks = []							# called as callback(command, succeeded) when finished
+
+	def isReply(self, msgData: bytes) -> bool:
+		"""
+		Is a received frame the reply to this command?
+
+		:param msgData: Received message frame (length, message number and data).
+		:return: True if it is.
+		"""
+		messageNumber = msgData[1] & 0x3f
+		if messageNumber not in self.replyTypes:
+			return False
+		if self.replyIndex is not None and messageNumber == self.replyTypes[0]:
+			return len(msgData) > 2 and msgData[2] == self.replyIndex
+		return True
+
+	def finish(self, succeeded: bool) -> None:
+		"""
+		Called by the communication loop once the command has been answered, has failed or has been dropped.
+
+		:param succeeded: True if the panel answered with a reply that completes the command.
+		:return: None
+		"""
+		for callback in self.callbacks:
+			callback(self, succeeded)
+
+	def __str__(self) -> str:
+		return self.transmitDataHex
+
+
+class CaddxCommandQueue(object):
+	"""
+	Command queue that sends arming, disarming and panic commands ahead of status polling, such as the zone status
+	requests queued by a database sync or the watchdog.
+
+	Commands wait in one FIFO per class: keypad functions (arm, disarm, panic), other commands and single requests,
+	and bulk per-zone or per-user requests.  get() takes from the highest priority class with commands waiting,
+	except that a waiting class is served as soon as it has been passed over shareInterval times, so lower classes
+	still get a share of the link under a steady stream of commands.  Provides the part of the queue.Queue interface
+	the communication loops use.
+
+	A read request identical to one still waiting (same message number and argument) is merged into it rather than
+	queued again, so the panel answers it once however often the watchdog, a sync or the user asks.  Only the
+	idempotent requests in coalescedMessages are merged; never keypad functions or other commands.
+	"""
+	classNames = ("keypad", "control", "bulk")
+	keypadMessages = (0x3c, 0x3d, 0x3e)
+	bulkMessages = (0x23, 0x24, 0x30, 0x32, 0x33)
+	coalescedMessages = (0x21, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x2a, 0x33)
+
+	def __init__(self, shareInterval: int = 4):
+		self.shareInterval = shareInterval
+		self.queues = tuple(collections.deque() for _ in self.classNames)
+		self.passedOver = [0] * len(self.classNames)
+		self.dispatched = [0] * len(self.classNames)
+		self.totalWait = [0.0] * len(self.classNames)
+		self.maxWait = [0.0] * len(self.classNames)
+		self.coalesced = [0] * len(self.classNames)
+		self.waitingRequests = {}						# transmitDataHex -> waiting command, coalesced requests only
+		self.unfinished_tasks = 0
+		self.mutex = threading.Lock()
+		self.notEmpty = threading.Condition(self.mutex)
+		self.allTasksDone = threading.Condition(self.mutex)
+
+	def commandClass(self, command: CaddxCommand) -> int:
+		"""
+		:param command: A queued command.
+		:return: Index of the command's class in classNames.  Lower is more urgent.
+		"""
+		if command.messageNumber in self.keypadMessages:
+			return 0
+		if command.messageNumber in self.bulkMessages:
+			return 2
+		return 1
+
+	def put(self, command: CaddxCommand, onQueued=None) -> CaddxCommand:
+		"""
+		Queue a command behind others of its class, or merge it into an identical waiting request.
+
+		:param command: The command to queue.
+		:param onQueued: Called as onQueued(queuedCommand) with the command that will be sent, before a communication
+			loop can take it, so callbacks it adds to the command cannot miss the command finishing.
+		:return: The command that will be sent: *command*, or the waiting request it was merged into.
+		"""
+		with self.mutex:
+			commandClass = self.commandClass(command)
+			if command.messageNumber in self.coalescedMessages:
+				waitingRequest = self.waitingRequests.get(command.transmitDataHex)
+				if waitingRequest is not None:
+					self.coalesced[commandClass] += 1
+					if onQueued is not None:
+						onQueued(waitingRequest)
+					return waitingRequest
+				self.waitingRequests[command.transmitDataHex] = command
+			if onQueued is not None:
+				onQueued(command)
+			self.queues[commandClass].append((time.monotonic(), command))
+			self.unfinished_tasks += 1
+			self.notEmpty.notify()
+			return command
+
+	def get(self, block: bool = True, timeout: float | None = None) -> CaddxCommand:
+		"""
+		Remove and return the next command to send.
+
+		:param block: Wait for a command if none is queued.
+		:param timeout: Longest wait, in seconds, if blocking.  None waits indefinitely.
+		:return: The command.
+		:raises queue.Empty: If no command is queued (in time).
+		"""
+		with self.notEmpty:
+			if not self.notEmpty.wait_for(self._qsize, timeout if block else 0):
+				raise queue.Empty
+			waiting = [index for index, commands in enumerate(self.queues) if commands]
+			chosen = max(waiting, key=lambda index: self.passedOver[index])
+			if self.passedOver[chosen] < self.shareInterval:
+				chosen = waiting[0]
+			for index in waiting:
+				self.passedOver[index] = 0 if index == chosen else self.passedOver[index] + 1
+			queuedAt, command = self.queues[chosen].popleft()
+			if self.waitingRequests.get(command.transmitDataHex) is command:
+				del self.waitingRequests[command.transmitDataHex]
+			wait = time.monotonic() - queuedAt
+			self.dispatched[chosen] += 1
+			self.totalWait[chosen] += wait
+			self.maxWait[chosen] = max(self.maxWait[chosen], wait)
+			return command
+
+	def get_nowait(self) -> CaddxCommand:
+		return self.get(block=False)
+
+	def task_done(self) -> None:
+		"""
+		Mark a command taken with get() as finished.
+
+		:return: None
+		"""
+		with self.allTasksDone:
+			self.unfinished_tasks -= 1
+			if self.unfinished_tasks <= 0:
+				self.unfinished_tasks = 0
+				self.allTasksDone.notify_all()
+
+	def join(self) -> None:
+		"""
+		Wait until every queued command has been taken and marked finished.
+
+		:return: None
+		"""
+		with self.allTasksDone:
+			self.allTasksDone.wait_for(lambda: not self.unfinished_tasks)
+
+	def qsize(self) -> int:
+		with self.mutex:
+			return self._qsize()
+
+	def empty(self) -> bool:
+		return not self.qsize()
+
+	def _qsize(self) -> int:
+		return sum(len(commands) for commands in self.queues)
+
+	def stats(self) -> list[tuple[str, int, int, int, float, float]]:
+		"""
+		Queue wait metrics per class.
+
+		:return: (class name, commands waiting, commands sent, requests coalesced, average wait in seconds, longest
+			wait in seconds) for each class, most urgent first.
+		"""
+		with self.mutex:
+			return [
+				(name, len(self.queues[index]), self.dispatched[index], self.coalesced[index],
+				self.totalWait[index] / self.dispatched[index] if self.dispatched[index] else 0.0, self.maxWait[index])
+				for index, name in enumerate(self.classNames)
+			]
+
+
+class CaddxPacing(object):
+	"""
+	Spacing between queued commands, adapted to how fast the panel answers.
+
+	The round-trip time of each exchange, from sending a command to its reply, is folded into an exponentially
+	weighted moving average.  The next command goes out a quarter of that average after the previous exchange
+	ended, capped at the "Max Spacing Between Commands" preference (sleepBetweenComm), the longest gap left between
+	queued commands: a busy panel gets a longer breather, an idle one hardly any.  After a timeout, NAK or failure the
+	full preference value is used once.
+	"""
+
+	def __init__(self, plugin, fraction: float = 0.25, alpha: float = 0.2):
+		self.plugin = plugin
+		self.fraction = fraction
+		self.alpha = alpha
+		self.roundTrip = None							# EWMA of reply times in seconds, None until the first reply
+		self.lastExchangeEnd = 0.0
+		self.lastExchangeFailed = False
+
+	def delay(self) -> float:
+		"""
+		:return: Seconds to wait before sending the next command.
+		"""
+		maximum = self.plugin.sleepBetweenComm
+		if self.lastExchangeFailed:
+			gap = maximum
+		elif self.roundTrip is None:
+			gap = 0.0
+		else:
+			gap = min(self.roundTrip * self.fraction, maximum)
+		return max(self.lastExchangeEnd + gap - time.monotonic(), 0.0)
+
+	def exchanged(self, sentAt: float, succeeded: bool) -> None:
+		"""
+		Record the end of an exchange with the panel.
+
+		:param sentAt: time.monotonic() when the command was sent.
+		:param succeeded: True if the panel answered with a reply that completes the command.
+		:return: None
+		"""
+		self.lastExchangeEnd = time.monotonic()
+		self.lastExchangeFailed = not succeeded
+		if succeeded:
+			roundTrip = self.lastExchangeEnd - sentAt
+			if self.roundTrip is None:
+				self.roundTrip = roundTrip
+			else:
+				self.roundTrip += self.alpha * (roundTrip - self.roundTrip)
+
+
+class CaddxSyncTracker(object):
+	"""
+	Follows the requests queued by a database sync until each has been answered or has failed, so the sync ends when
+	the panel is done instead of after a guessed delay, and can report progress and what failed.
+	"""
+
+	def __init__(self):
+		self.condition = threading.Condition()
+		self.commands = set()
+		self.total = 0
+		self.completed = 0
+		self.failed = []
+		self.startTime = time.monotonic()
+		self.lastProgress = self.startTime
+
+	def track(self, command: CaddxCommand) -> None:
+		"""
+		Count *command* in the sync.  A command already tracked (a coalesced request) is counted once.
+
+		:param command: A queued command.
+		:return: None
+		"""
+		with self.condition:
+			if command in self.commands:
+				return
+			self.commands.add(command)
+			self.total += 1
+		command.callbacks.append(self._finished)
+
+	def _finished(self, command: CaddxCommand, succeeded: bool) -> None:
+		with self.condition:
+			self.completed += 1
+			if not succeeded:
+				self.failed.append(command)
+			self.lastProgress = time.monotonic()
+			self.condition.notify_all()
+
+	def wait(self, timeout: float) -> bool:
+		"""
+		Wait until every tracked command has finished.
+
+		:param timeout: Longest wait in seconds.
+		:return: True if all have finished.
+		"""
+		with self.condition:
+			return self.condition.wait_for(lambda: self.completed >= self.total, timeout)
+
+	def progress(self) -> int:
+		"""
+		:return: Percentage of tracked commands finished.
+		"""
+		return 100 * self.completed // self.total if self.total else 100
+
+	def timeRemaining(self) -> float | None:
+		"""
+		:return: Estimated seconds until the last command finishes, at the rate so far.  None before the first finishes.
+		"""
+		if not self.completed:
+			return None
+		return (time.monotonic() - self.startTime) / self.completed * (self.total - self.completed)
+
+	def stalledFor(self) -> float:
+		"""
+		:return: Seconds since a command last finished (or since the sync started).
+		"""
+		return time.monotonic() - self.lastProgress
+
+	def failedItems(self) -> list[str]:
+		"""
+		:return: Readable names of the failed requests, e.g. "zone 12 name", "user 3".
+		"""
+		items = []
+		for command in self.failed:
+			index = int(command.transmitDataHex[4:6], 16) if len(command.transmitDataHex) >= 6 else None
+			match command.messageNumber:
+				case 0x23:
+					items.append(f"zone {index + 1} name")
+				case 0x24:
+					items.append(f"zone {index + 1} status")
+				case 0x25:
+					items.append(f"zones snapshot block {index}")
+				case 0x26:
+					items.append(f"partition {index + 1} status")
+				case 0x33:
+					items.append(f"user {index}")
+				case _:
+					items.append(f"request '{command}'")
+		return items
+
+
+class CaddxPanelCache(object):
+	"""
+	Panel configuration learnt from configuration replies -- zone names, zone partition masks and type flags, and
+	user information -- kept as JSON in the Indigo preferences folder and keyed by panel model and firmware.  After a
+	restart the cache is trusted once a sample of zones re-read from the panel still matches it, so a full database
+	sync is only needed when the panel has changed.
+
+	The cache is only written once it has been validated, or filled by a successful sync, so an unverified or
+	partial copy never replaces a good one.
+	"""
+
+	version = 1
+	sampleSize = 4
+
+	def __init__(self, path: str):
+		self.path = path
+		self.lock = threading.Lock()
+		self.model = None									# panel id from the System Status Message
+		self.firmware = None								# from the Interface Configuration Message
+		self.zoneNames = {}									# zone number -> Zone Name Message frame, hex
+		self.zoneConfig = {}								# zone number -> partition mask and type flag bytes, hex
+		self.users = {}										# user number -> User Information Reply frame without PIN, hex
+		self.validated = False
+
+	def record(self, dataDict: bytes) -> None:
+		"""
+		Remember the configuration carried by a received message.  Other messages are ignored.
+
+		:param dataDict: Received message frame (length, message number and data).
+		:return: None
+		"""
+		with self.lock:
+			match dataDict[1] & 0x3f:
+				case 0x01:										# Interface Configuration Message
+					self.firmware = dataDict[2:6].decode("latin-1")
+				case 0x03:										# Zone Name Message
+					self.zoneNames[dataDict[2] + 1] = dataDict.hex()
+				case 0x04:										# Zone Status Message
+					self.zoneConfig[dataDict[2] + 1] = dataDict[3:7].hex()
+				case 0x08:										# System Status Message
+					self.model = dataDict[2]
+				case 0x12:										# User Information Reply
+					self.users[dataDict[2]] = self.withoutPin(dataDict)
+
+	@staticmethod
+	def withoutPin(dataDict: bytes) -> str:
+		"""
+		:param dataDict: User Information Reply frame.
+		:return: The frame, hex, with the PIN (frame bytes 3 - 5) blanked: user PINs are never written to the cache.
+		"""
+		frame = bytearray(dataDict)
+		frame[3:6] = bytes(len(frame[3:6]))
+		return frame.hex()
+
+	def load(self) -> tuple[int, str] | None:
+		"""
+		Read the cache file.
+
+		:return: The (model, firmware) the cache was recorded for, or None if there is no usable cache.
+		"""
+		try:
+			with open(self.path, "r", encoding="utf-8") as cacheFile:
+				contents = json.load(cacheFile)
+			if contents.get("version") != self.version:
+				return None
+			with self.lock:
+				self.model = contents["model"]
+				self.firmware = contents["firmware"]
+				self.zoneNames = {int(zone): frame for zone, frame in contents["zoneNames"].items()}
+				self.zoneConfig = {int(zone): config for zone, config in contents["zoneConfig"].items()}
+				self.users = {int(user): self.withoutPin(bytes.fromhex(frame)) for user, frame in contents["users"].items()}
+				self.validated = False
+		except FileNotFoundError:
+			return None
+		except (OSError, ValueError, KeyError, TypeError) as err:
+			indigo.server.log(f"Panel configuration cache {self.path} could not be read: {err}", level=logging.WARNING)
+			return None
+		if self.model is None or self.firmware is None:
+			return None
+		return self.model, self.firmware
+
+	def save(self) -> None:
+		"""
+		Write the cache file if the cache has been validated.
+
+		:return: None
+		"""
+		with self.lock:
+			if not self.validated:
+				return
+			contents = {
+				"version": self.version, "model": self.model, "firmware": self.firmware,
+				"zoneNames": self.zoneNames, "zoneConfig": self.zoneConfig, "users": self.users
+			}
+			try:
+				# owner read and write only, like the preferences file next to it
+				with open(os.open(self.path + ".tmp", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w", encoding="utf-8") as cacheFile:
+					os.fchmod(cacheFile.fileno(), 0o600)
+					json.dump(contents, cacheFile, indent=1)
+				os.replace(self.path + ".tmp", self.path)
+			except OSError as err:
+				indigo.server.log(f"Panel configuration cache {self.path} could not be written: {err}", level=logging.WARNING)
+
+	def reset(self) -> None:
+		"""
+		Forget everything recorded, ready to be filled by a full sync.
+
+		:return: None
+		"""
+		with self.lock:
+			self.zoneNames.clear()
+			self.zoneConfig.clear()
+			self.users.clear()
+			self.validated = False
+
+	def sample(self) -> dict[int, str]:
+		"""
+		Choose zones to re-read from the panel to validate the cache.
+
+		:return: Zone number -> cached Zone Name Message frame, hex, for up to sampleSize random zones.
+		"""
+		with self.lock:
+			zones = random.sample(sorted(self.zoneNames), min(self.sampleSize, len(self.zoneNames)))
+			return {zone: self.zoneNames[zone] for zone in zones}
+
+	@staticmethod
+	def checksum(frames) -> int:
+		"""
+		:param frames: Zone Name Message frames, hex.
+		:return: CRC-32 over the zone names in *frames*.
+		"""
+		return zlib.crc32(b"".join(bytes.fromhex(frame)[2:19] for frame in frames))
+
+
+class CaddxZoneState(object):
+	"""
+	Last known condition of one zone, used to publish zoneState only when it actually changes.
+	"""
+	__slots__ = ("condition", "state")
+
+	def __init__(self, state: str | None = None):
+		self.condition = None								# zone condition flags 1, as last received
+		self.state = state									# zoneState last published
+
+	def update(self, condition: int) -> bool:
+		"""
+		Record a received condition.
+
+		:param condition: Zone condition flags 1.
+		:return: True if the resulting zoneState differs from the last one published.
+		"""
+		self.condition = condition
+		state = zoneStateNames[condition]
+		if state == self.state:
+			return False
+		self.state = state
+		return True
+
+
+def backoffDelays(initial: float = 0.5, maximum: float = 60.0):
+	"""
+	Endless series of reconnect delays: exponential backoff from *initial* up to *maximum* seconds, each delay
+	jittered down by up to half so that several clients do not retry in lock step.
+
+	:param initial: First delay in seconds.
+	:param maximum: Cap on the delay in seconds.
+	:return: Generator of delays in seconds.
+	"""
+	delay = initial
+	while True:
+		yield random.uniform(delay / 2, delay)
+		delay = min(delay * 2, maximum)
+
+
+class CaddxSocketTransport(object):
+	"""
+	TCP connection to a serial-over-IP bridge (ser2net or similar) with the subset of the pySerial API the plugin uses:
+	read(), write(), in_waiting, timeout, reset_input_buffer(), cancel_read(), close() and fileno().
+
+	Nagle is disabled so short command frames leave at once, and TCP keep-alive probes detect a dead bridge while
+	the link is quiet.  Everything the socket has waiting is received in one call and buffered.  If the connection
+	drops it is re-established inside read() and write(), first at once and then with jittered exponential backoff,
+	so the communication loop and its command queue carry on as if the port had simply timed out.
+	"""
+
+	def __init__(self, plugin, host: str, port: int, timeout: float = 3, writeTimeout: float = 1, keepAlive: int = 30):
+		self.plugin = plugin
+		self.host = host
+		self.port = port
+		self.timeout = timeout
+		self.writeTimeout = writeTimeout
+		self.keepAlive = keepAlive
+		self.sock = None
+		self.lock = threading.Lock()						# reader and writer threads may both find the link down
+		self.buffer = bytearray()
+		self.closed = False
+		self.reconnectCount = 0
+		self.backoff = backoffDelays()
+		self.nextAttempt = 0.0
+		self.cancelReceive, self.cancelSend = os.pipe()
+		os.set_blocking(self.cancelReceive, False)
+
+	def __del__(self):
+		os.close(self.cancelReceive)
+		os.close(self.cancelSend)
+
+	def __str__(self):
+		return f"socket://{self.host}:{self.port}"
+
+	def open(self) -> None:
+		"""
+		Connect to the bridge.
+
+		:return: None
+		:raises OSError: If the connection cannot be made.
+		"""
+		sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+		sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+		if self.keepAlive > 0:
+			sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+			if hasattr(socket, "TCP_KEEPIDLE"):
+				sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.keepAlive)
+			elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS
+				sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, self.keepAlive)
+			if hasattr(socket, "TCP_KEEPINTVL"):
+				sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, max(self.keepAlive // 3, 1))
+			if hasattr(socket, "TCP_KEEPCNT"):
+				sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+		sock.setblocking(False)
+		self.sock = sock
+		self.closed = False
+		self.backoff = backoffDelays()
+
+	def close(self) -> None:
+		self.closed = True
+		self.cancel_read()
+		if self.sock is not None:
+			self.sock.close()
+			self.sock = None
+
+	def fileno(self) -> int:
+		if self.sock is None:
+			raise OSError(f"Not connected to {self}.")
+		return self.sock.fileno()
+
+	@property
+	def in_waiting(self) -> int:
+		if self.sock is None:
+			self.reconnect(time.monotonic())  # Only if the backoff delay is up.  Never waits.
+		if self.sock is not None:
+			self._receive()
+		return len(self.buffer)
+
+	def read(self, size: int = 1) -> bytes:
+		"""
+		Read up to *size* bytes, waiting up to the timeout for them to arrive.
+
+		:param size: Number of bytes wanted.
+		:return: The bytes read.  Fewer than *size*, possibly none, on timeout, cancel_read() or while reconnecting.
+		"""
+		deadline = time.monotonic() + self.timeout
+		while len(self.buffer) < size and not self.closed:
+			if self.sock is None and not self.reconnect(deadline):
+				break
+			remaining = deadline - time.monotonic()
+			if remaining <= 0:
+				break
+			ready, _, _ = select.select([self.sock, self.cancelReceive], [], [], remaining)
+			if self.cancelReceive in ready:
+				self._clearCancel()
+				break
+			if not ready:
+				break
+			self._receive()
+		receivedData = bytes(self.buffer[:size])
+		del self.buffer[:size]
+		return receivedData
+
+	def write(self, data: bytes) -> int:
+		"""
+		Send *data* to the bridge.  A frame that cannot be sent because the link is down is dropped; the command then
+		times out and is retried once the connection is back.
+
+		:param data: Bytes to send.
+		:return: Number of bytes sent.
+		"""
+		if self.sock is None and not self.reconnect(time.monotonic() + self.writeTimeout):
+			self.plugin.errorLog(f"socketTransport: Not connected to {self}.  Frame not sent.")
+			return 0
+		# the reader thread shares the socket, so it stays non-blocking: wait for it to become writable with select()
+		sock = self.sock
+		unsent = memoryview(data)
+		deadline = time.monotonic() + self.writeTimeout
+		try:
+			while unsent:
+				try:
+					unsent = unsent[sock.send(unsent):]
+				except BlockingIOError:
+					pass
+				if unsent:
+					remaining = deadline - time.monotonic()
+					if remaining <= 0 or not select.select([], [sock], [], remaining)[1]:
+						raise TimeoutError(f"Frame not sent within {self.writeTimeout} seconds.")
+		except OSError as err:
+			self._dropConnection(sock, err)
+			return 0
+		return len(data)
+
+	def cancel_read(self) -> None:
+		os.write(self.cancelSend, b"x")
+
+	def reset_input_buffer(self) -> None:
+		if self.sock is not None:
+			self._receive()
+		self.buffer.clear()
+
+	def reconnect(self, deadline: float) -> bool:
+		"""
+		Re-establish a dropped connection, waiting out the backoff delay between attempts but not beyond *deadline*.
+
+		:param deadline: time.monotonic() value after which to give up for now.
+		:return: True if connected.
+		"""
+		while not self.closed:
+			wait = min(self.nextAttempt, deadline) - time.monotonic()
+			if wait > 0:
+				ready, _, _ = select.select([self.cancelReceive], [], [], wait)
+				if ready:
+					self._clearCancel()
+					return False
+			if time.monotonic() < self.nextAttempt:
+				return False
+			with self.lock:
+				if self.sock is not None:
+					return True  # Reconnected by the other thread.
+				try:
+					self.open()
+				except OSError as err:
+					delay = next(self.backoff)
+					self.nextAttempt = time.monotonic() + delay
+					self.plugin.errorLog(f"socketTransport: Reconnect to {self} failed: {err}.  Retrying in {delay:.1f} seconds.")
+					continue
+				self.reconnectCount += 1
+			indigo.server.log(f"Reconnected to Caddx NetworX Security Panel on {self}.")
+			return True
+		return False
+
+	def _receive(self) -> None:
+		sock = self.sock
+		try:
+			while True:
+				chunk = sock.recv(4096)
+				if not chunk:
+					self._dropConnection(sock, ConnectionError("Connection closed by the bridge."))
+					return
+				self.buffer += chunk
+		except BlockingIOError:
+			pass
+		except OSError as err:
+			self._dropConnection(sock, err)
+
+	def _dropConnection(self, sock, err: Exception) -> None:
+		with self.lock:
+			if self.closed or sock is not self.sock:
+				return  # Already closed, or already dropped and reconnected by the other thread.
+			self.plugin.errorLog(f"socketTransport: Lost connection to {self}: {err}")
+			sock.close()
+			self.sock = None
+			self.nextAttempt = 0.0
+
+	def _clearCancel(self) -> None:
+		try:
+			while os.read(self.cancelReceive, 512):
+				pass
+		except BlockingIOError:
+			pass
+
+
+class CaddxAsyncEngine(object):
+	"""
+	asyncio engine for the panel link, used when the communication loop preference is "asyncio".
+
+	Reads are driven by the event loop watching the port's file descriptor in non-blocking mode, so anything with
+	a fileno() works: a serial port, a pty or a socket.  Received frames go through the Caddx frame decoder straight
+	into decodeReceivedData().  Queued commands are sent one at a time; a reply is matched to the outstanding command
+	by CaddxCommand.isReply(), and a command is resent on timeout, NAK or Command / Request Failed.  The watchdog runs
+	as a timer on the same loop.
+	Nothing is paced with sleeps.
+	"""
+
+	def __init__(self, caddx, conn):
+		self.caddx = caddx
+		self.plugin = caddx.plugin
+		self.conn = conn
+		self.fd = conn.fileno()
+		self.replyTimeout = conn.timeout or 3
+		self.retries = 3
+		self.loop = None
+		self.threadId = None
+		self.stopEvent = asyncio.Event()
+		self.commandReady = asyncio.Event()
+		self.pendingCommand = None
+		self.pendingReply = None
+		self.writeBuffer = bytearray()
+		self.error = None
+
+	def run(self) -> None:
+		"""
+		Run the engine until stop() is called or the link fails.
+
+		:return: None
+		:raises: The read or write error that stopped the engine, if any.
+		"""
+		asyncio.run(self._main())
+		if self.error is not None:
+			raise self.error
+
+	def stop(self) -> None:
+		"""
+		Stop the engine.  Safe to call from any thread.
+
+		:return: None
+		"""
+		if self.loop is not None and not self.loop.is_closed():
+			self.loop.call_soon_threadsafe(self.stopEvent.set)
+
+	def notify(self) -> None:
+		"""
+		Tell the engine a command has been queued.  Safe to call from any thread.
+
+		:return: None
+		"""
+		if self.loop is not None and not self.loop.is_closed():
+			self.loop.call_soon_threadsafe(self.commandReady.set)
+
+	def write(self, data: bytes) -> None:
+		"""
+		Write an encoded frame to the port.  Safe to call from any thread.
+
+		:param data: Encoded frame.
+		:return: None
+		"""
+		if self.loop is None:
+			self.conn.write(data)
+			return
+		if threading.get_ident() != self.threadId:
+			self.loop.call_soon_threadsafe(self.write, data)
+			return
+		if self.writeBuffer:
+			self.writeBuffer += data
+			return
+		try:
+			written = os.write(self.fd, data)
+		except BlockingIOError:
+			written = 0
+		except OSError as err:
+			self._fail(err)
+			return
+		if written < len(data):
+			self.writeBuffer += data[written:]
+			self.loop.add_writer(self.fd, self._onWritable)
+
+	async def _main(self) -> None:
+		self.loop = asyncio.get_running_loop()
+		self.threadId = threading.get_ident()
+		if self.caddx.shutdown:
+			return
+		self.commandReady.set()  # Anything queued before the engine started.
+		os.set_blocking(self.fd, False)
+		self.loop.add_reader(self.fd, self._onReadable)
+		tasks = [asyncio.create_task(self._commandWorker()), asyncio.create_task(self._watchdog())]
+		try:
+			await self.stopEvent.wait()
+		finally:
+			for task in tasks:
+				task.cancel()
+			await asyncio.gather(*tasks, return_exceptions=True)
+			self.loop.remove_reader(self.fd)
+			self.loop.remove_writer(self.fd)
+			os.set_blocking(self.fd, True)
+
+	def _fail(self, err: Exception) -> None:
+		if not self.caddx.shutdown:
+			self.plugin.errorLog(f"asyncEngine: Port I/O failed: {err}")
+			self.error = err
+		self.stopEvent.set()
+
+	def _onWritable(self) -> None:
+		try:
+			written = os.write(self.fd, self.writeBuffer)
+		except BlockingIOError:
+			return
+		except OSError as err:
+			self._fail(err)
+			return
+		del self.writeBuffer[:written]
+		if not self.writeBuffer:
+			self.loop.remove_writer(self.fd)
+
+	def _onReadable(self) -> None:
+		try:
+			receivedData = os.read(self.fd, 4096)
+		except BlockingIOError:
+			return
+		except OSError as err:
+			self._fail(err)
+			return
+		if not receivedData:
+			self._fail(ConnectionError("Connection closed by the other end."))
+			return
+
+		decoder = self.caddx.frameDecoder
+		bytesSkipped = decoder.bytesSkipped
+		decoder.feed(receivedData)
+		while True:
+			try:
+				msgData = decoder.nextFrame()
+			except CaddxChecksumError:
+				self.plugin.errorLog("asyncEngine: Checksum failed.  Discarding.")
+				continue
+			except CaddxFrameError as err:
+				self.plugin.errorLog(f"asyncEngine: {err}  Discarding buffered data.")
+				decoder.reset()
+				break
+			if msgData is None:
+				break
+			self._dispatch(msgData)
+		if decoder.bytesSkipped != bytesSkipped:
+			self.caddx.reportSkippedBytes(decoder.bytesSkipped - bytesSkipped)
+
+	def _dispatch(self, msgData: bytes) -> None:
+		pendingReply = self.pendingReply
+		if pendingReply is not None and not pendingReply.done() and self.pendingCommand.isReply(msgData):
+			self.pendingCommand.reply = msgData
+			pendingReply.set_result(msgData[1] & 0x3f)
+		try:
+			self.caddx.decodeReceivedData(msgData, 0)
+		except Exception as err:
+			self.plugin.errorLog(f"asyncEngine: Error processing message {msgData.hex()}: {err}")
+
+	async def _commandWorker(self) -> None:
+		commandQueue = self.caddx.commandQueue
+		while True:
+			await self.commandReady.wait()
+			self.commandReady.clear()
+			while not commandQueue.empty():
+				command = commandQueue.get_nowait()
+				self.plugin.debugLog(f"asyncEngine: Processing command: {command}")
+				succeeded = False
+				try:
+					succeeded = await self._sendCommand(command)
+					if succeeded:
+						self.plugin.debugLog(f"asyncEngine: Command completed: {command}")
+					else:
+						self.plugin.errorLog(f"asyncEngine: Command failed: '{command}'")
+				finally:
+					command.finish(succeeded)
+					commandQueue.task_done()
+
+	async def _sendCommand(self, command: CaddxCommand) -> bool:
+		self.pendingCommand = command
+		try:
+			for attempt in range(self.retries):
+				pacing = self.caddx.pacing
+				delay = pacing.delay()
+				if delay:
+					await asyncio.sleep(delay)
+				self.pendingReply = self.loop.create_future()
+				sentAt = time.monotonic()
+				self.caddx.sendMsg(command.transmitDataHex)
+				try:
+					reply = await asyncio.wait_for(self.pendingReply, self.replyTimeout)
+				except asyncio.TimeoutError:
+					pacing.exchanged(sentAt, False)
+					self.plugin.errorLog(f"asyncEngine: No reply to '{command}'.  Retrying.")
+					continue
+				pacing.exchanged(sentAt, reply not in command.retryReplies)
+				if reply in command.retryReplies:
+					self.plugin.errorLog(f"asyncEngine: '{messageDescriptions[reply]}' for '{command}'.  Retrying.")
+					continue
+				return reply not in command.failReplies
+			return False
+		finally:
+			self.pendingReply = None
+			self.pendingCommand = None
+
+	async def _watchdog(self) -> None:
+		while True:
+			self.caddx.commContinuityCheck()
+			timeout = self.caddx.idleWakeTimeout()
+			await asyncio.sleep(1.0 if timeout is None else timeout)
+
+
 class Caddx(object):
 
 	def __init__(self, plugin):
@@ -108,7 +1774,26 @@ class Caddx(object):
 		self.panelList = {}
 		self.systemStatusList = {}
 		
-		self.commandQueue = queue.Queue()
+		self.commandQueue = CaddxCommandQueue()
+		self.pacing = CaddxPacing(plugin)
+		self.syncTracker = None								# set by syncDatabase() while it queues its requests
+		self.panelCache = CaddxPanelCache(os.path.join(indigo.server.getInstallFolderPath(), "Preferences", "Plugins", f"{plugin.pluginId}.panelCache.json"))
+		self.frameDecoder = CaddxFrameDecoder()
+		self.frameQueue = queue.Queue()						# frames from readerThread, event mode only
+		self.wakeEvent = threading.Event()					# wakes activeCommLoop in event mode
+		self.readerThread = None
+		self.readerError = None
+		self.asyncEngine = None
+		self.stopRequested = threading.Event()				# set by stopComm() to end startComm() for good
+		self.linkDownSince = None
+		self.linkRecovered = False
+		self.synchronisedBeforeDrop = False					# pluginPrefs['synchronised'] when the link last dropped
+		self.reconnectCount = 0
+		self.lastDowntime = 0.0
+		self.totalDowntime = 0.0
+		self.zoneSnapshotCache = {}							# zone number -> last Zones Snapshot nibble
+		self.zoneStates = {}								# zone number -> CaddxZoneState
+		self.messageHandlers = {number: (messageType, getattr(self, messageType.handler)) for number, messageType in messageSchema.items()}
 		self.shutdown: bool = True
 		self.devicePort = None
 		self.conn = None
@@ -122,7 +1807,10 @@ class Caddx(object):
 		self.watchdogTimer = (time.time()) + 5
 		self.suspendInterfaceConfigMessageDisplay = True
 		self.errorCountComm = 0
-		self.devStateChangeList = {}
+		self.devStateChangeList = {}						# device id -> {state key: value} not yet written
+		self.devStateChangeLock = threading.Lock()			# comm and Indigo action threads both collect changes
+		self.publishedStates = {}							# device id -> {state key: value} last seen on the server
+		self.publishLock = threading.Lock()					# one thread at a time takes and publishes collected changes
 		self.repeatAlarmTripped = False
 
 	def __del__(self):
@@ -341,7 +2029,6 @@ class Caddx(object):
 		if self.plugin.commandActInfo or self.plugin.debug:
 			indigo.server.log("Execute action:        Interface Configuration Request")
 		self.sendMsgToQueue(cmdInterfaceConfigurationRequest)
-		time.sleep(self.plugin.sleepBetweenComm)
 		
 	def actionZoneNameRequest(self, action):
 		for key in range(0, action):
@@ -350,7 +2037,6 @@ class Caddx(object):
 			if self.plugin.commandActInfo or self.plugin.debug:
 				indigo.server.log("Execute action:        Zone Name Request: %s,   %s  (zone %s)" % (zone, zoneNameRequest, (key + 1)))
 			self.sendMsgToQueue(zoneNameRequest)
-			time.sleep(self.plugin.sleepBetweenComm)
 
 	def actionZoneStatusRequest(self, action):
 		for key in range(0, action):
@@ -359,7 +2045,6 @@ class Caddx(object):
 			if self.plugin.commandActInfo or self.plugin.debug:
 				indigo.server.log("Execute action:        Zone Status Request: %s,  %s  (zone %s)" % (zone, zoneStatusRequest, (key + 1)))
 			self.sendMsgToQueue(zoneStatusRequest)
-			time.sleep(self.plugin.sleepBetweenComm)
 									
 	def actionZonesSnapshotRequest(self, action):
 		for key in range(0, action):
@@ -368,7 +2053,6 @@ class Caddx(object):
 			if self.plugin.commandActInfo or self.plugin.debug:
 				indigo.server.log("Execute action:        Zones Snapshot Request: %s,  %s  (block %s)" % (kzoneOffSet, zonesSnapshotRequest, key))
 			self.sendMsgToQueue(zonesSnapshotRequest)
-			time.sleep(self.plugin.sleepBetweenComm)
 		
 	def actionPartitionStatusRequest(self, action):
 		for key in range(0, action):
@@ -377,21 +2061,18 @@ class Caddx(object):
 			if self.plugin.commandActInfo or self.plugin.debug:
 				indigo.server.log("Execute action:        Partition Status Request: %s  %s  (partition %s)" % (kpartition, partitionStatusRequest, (key + 1)))
 			self.sendMsgToQueue(partitionStatusRequest)
-			time.sleep(self.plugin.sleepBetweenComm)
 
 	# noinspection PyUnusedLocal
 	def actionPartitionSnapshotRequest(self, action):
 		if self.plugin.commandActInfo or self.plugin.debug:
 			indigo.server.log("Execute action:        Partition Snapshot Request: Partition 1 - 8")
 		self.sendMsgToQueue(cmdPartitionSnapshotRequest)
-		time.sleep(self.plugin.sleepBetweenComm)
 
 	# noinspection PyUnusedLocal
 	def actionSystemStatusRequest(self, action):
 		if self.plugin.commandActInfo or self.plugin.debug:
 			indigo.server.log("Execute action:        System Status Request")
 		self.sendMsgToQueue(cmdSystemStatusRequest)
-		time.sleep(self.plugin.sleepBetweenComm)		
 
 	# noinspection PyUnusedLocal
 	def actionLogEventRequest(self, action):
@@ -403,7 +2084,6 @@ class Caddx(object):
 			if self.plugin.commandActInfo or self.plugin.debug:
 				indigo.server.log("Execute action:        Log Event Request: %s,  %s" % (keventNumber, logEventRequest))
 			self.sendMsgToQueue(logEventRequest)
-			time.sleep(self.plugin.sleepBetweenComm)
 		
 	def actionUserInformationRequestWithoutPin(self, action):
 		for key in range(0, action):
@@ -412,7 +2092,6 @@ class Caddx(object):
 			if self.plugin.commandActInfo or self.plugin.debug:
 				indigo.server.log("Execute action:        User Information Request without Pin: %s,  %s  (user %s)" % (user, userInformationRequestWithoutPin, (key + 1)))
 			self.sendMsgToQueue(userInformationRequestWithoutPin)
-			time.sleep(self.plugin.sleepBetweenComm)					
 
 	# noinspection PyUnusedLocal
 	def actionSetClockCalenderCommand(self, action):
@@ -424,16 +2103,14 @@ class Caddx(object):
 		kday = f"{correctedWDay:02x}"
 		kSetClockCalenderCommand = cmdSetClockCalendar + kdate + ktime + kday
 		self.sendMsgToQueue(kSetClockCalenderCommand)
-		time.sleep(self.plugin.sleepBetweenComm)
 
-	# Poll each zone for Keypad Display Name to use in Create Zone Device name
-	# Todo: singleZoneNameRequest() is used incorrectly by callers.  Figure out what to do?
-	def singleZoneNameRequest(self, zoneKey: int) -> None:
+	# Poll a zone for Keypad Display Name to use in Create Zone Device name.  Returns a future for the Zone Name
+	# Message; decodeZoneName() extracts the name from it.
+	def singleZoneNameRequest(self, zoneKey: int) -> concurrent.futures.Future:
 		zone = f"{zoneKey:02x}"  # 0 = zone 1
 		zoneNameRequest = cmdZoneNameRequest + zone
 		self.plugin.debugLog("Execute action:        Zone Name Request: %s,  %s" % (zone, zoneNameRequest))
-		self.sendMsg(zoneNameRequest)
-		time.sleep(self.plugin.sleepBetweenCreateZone)
+		return self.sendMsgToQueue(zoneNameRequest, wantReply=True)
 											
 	################################################################################
 	# Routines for Serial Communication Process methods 
@@ -445,6 +2122,11 @@ class Caddx(object):
 	
 	def deviceStart(self, dev):
 		self.plugin.debugLog("deviceStart:        starting device %s." % dev.name)
+		# executeUpdateStatesList() diffs against this copy.  Read it from the server: the dev passed in predates
+		# stateListOrDisplayStateIdChanged() and lacks states added by a plugin upgrade.
+		states = dict(indigo.devices[dev.id].states)
+		with self.publishLock:
+			self.publishedStates[dev.id] = states
 			
 		if dev.deviceTypeId == 'zone':
 			zone = int(dev.pluginProps['address'])
@@ -485,6 +2167,7 @@ class Caddx(object):
 			zone = int(dev.pluginProps['address'])
 			if zone in self.zoneList.keys():
 				del self.zoneList[zone]
+			self.zoneStates.pop(zone, None)					# a restarted device starts again from its stored zoneState
 		elif dev.deviceTypeId == 'partition':
 			partition = int(dev.pluginProps['address'])
 			if partition in self.partitionList.keys():
@@ -507,6 +2190,8 @@ class Caddx(object):
 				del self.systemStatusList[system]
 		# Todo: Since no states were changed, this seems superfluous.
 		self.executeUpdateStatesList()
+		with self.publishLock:
+			self.publishedStates.pop(dev.id, None)
 
 	########################################
 	# Communication Start and Stop methods
@@ -514,30 +2199,184 @@ class Caddx(object):
 	
 	def startComm(self) -> None:
 		"""
-		Activates activeCommLoop()
+		Activates activeCommLoop(), and keeps it running: if the port cannot be opened or the loop fails, the port is
+		reopened with exponential backoff until stopComm() is called.
 
-		:return: None.  Does not return until activeCommLoop() returns.
+		:return: None.  Does not return until stopComm() is called.
 		"""
 		self.plugin.debugLog("startComm:        entering process")
-		
-		devicePort = self.plugin.devicePort
+		self.stopRequested.clear()
+		backoff = backoffDelays(1.0, 60.0)
+		while not self.stopRequested.is_set():
+			conn = self.openComm()
+			if conn:
+				self.linkUp()
+				sessionStart = time.time()
+				try:
+					self.activeCommLoop(self.devicePort, conn, self.commandQueue)
+				except Exception as err:
+					if not self.stopRequested.is_set():
+						self.plugin.errorLog(f"startComm: Communication with {self.devicePort} failed: {err}")
+				if self.stopRequested.is_set():
+					break
+				self.synchronisedBeforeDrop = self.plugin.pluginPrefs.get('synchronised', False)
+				self.commStatusDown()
+				if time.time() - sessionStart > 60:
+					backoff = backoffDelays(1.0, 60.0)  # Link was healthy for a while.  Start again from a short delay.
+			self.linkDown()
+			delay = next(backoff)
+			self.plugin.errorLog(f"startComm: Reconnecting to {self.devicePort} in {delay:.1f} seconds.")
+			self.stopRequested.wait(delay)
+
+	def openComm(self):
+		"""
+		Open the serial port, or connect to the serial bridge, as configured in plugin preferences.
+
+		:return: The connection object, or None if it could not be opened.
+		"""
 		baudRate = int(self.plugin.pluginPrefs['serialBaudRate'])
 		serialTimeout = 3  # Hard coded to 3 seconds to reflect worst-case panel processing time for a command.
+		if self.plugin.transportType == "socket":
+			devicePort = f"socket://{self.plugin.bridgeHost}:{self.plugin.bridgePort}"
+		else:
+			devicePort = self.plugin.devicePort
 		
 		self.devicePort = devicePort
+		self.frameDecoder.resync = self.plugin.resyncOnFrameError
 		indigo.server.log("initialing connection to Caddx NetworX security devices . . .")
 		
-		# open serial communication port
-		conn = self.plugin.openSerial("Caddx Security System", devicePort, baudRate, timeout=serialTimeout, writeTimeout=1)
+		# open serial communication port, or TCP connection to a serial bridge
+		if self.plugin.transportType == "socket":
+			conn = self.openSocket(serialTimeout)
+			connectionInfo = f"Keep-alive: {self.plugin.socketKeepAlive} seconds"
+		else:
+			conn = self.plugin.openSerial("Caddx Security System", devicePort, baudRate, timeout=serialTimeout, writeTimeout=1)
+			connectionInfo = f"Bit Rate: {baudRate} bps"
 		if conn:
 			self.commStatusUp()
 			indigo.server.log(
-				f"Connection initialised to Caddx NetworX Security Panel on {devicePort} - Bit Rate: {baudRate} bps, Timeout: {serialTimeout} seconds.")
+				f"Connection initialised to Caddx NetworX Security Panel on {devicePort} - {connectionInfo}, Timeout: {serialTimeout} seconds.")
 			self.conn = conn
 			self.plugin.debugLog(f"startComm: connection: {devicePort}")
-			self.activeCommLoop(devicePort, conn, self.commandQueue)
 		else:
 			self.plugin.errorLog(f"startComm: connection failure to Caddx NetworX Security device on {devicePort}")
+		return conn
+
+	def linkUp(self) -> None:
+		"""
+		Record that the link to the panel is up, and how long it was down if this is a reconnection.
+
+		:return: None
+		"""
+		if self.linkDownSince is not None:
+			self.lastDowntime = time.time() - self.linkDownSince
+			self.totalDowntime += self.lastDowntime
+			self.reconnectCount += 1
+			self.linkDownSince = None
+			self.linkRecovered = True
+			indigo.server.log(f"Link to Caddx NetworX Security Panel restored after {self.lastDowntime:.1f} seconds (reconnect {self.reconnectCount}).")
+		self.updateLinkStatus("up")
+
+	def linkDown(self) -> None:
+		"""
+		Record that the link to the panel is down.
+
+		:return: None
+		"""
+		if self.linkDownSince is None:
+			self.linkDownSince = time.time()
+		self.updateLinkStatus("down")
+
+	def updateLinkStatus(self, linkState: str) -> None:
+		"""
+		Publish link state, reconnect count and downtime on the Status Info device.
+
+		:param linkState: "up" or "down".
+		:return: None
+		"""
+		system = int(self.systemId)
+		if system in self.systemStatusList.keys():
+			dev = self.systemStatusList[system]
+			self.addToStatesUpdateList(dev, key="linkState", value=linkState)
+			self.addToStatesUpdateList(dev, key="reconnectCount", value=self.reconnectCount)
+			self.addToStatesUpdateList(dev, key="lastDowntime", value=round(self.lastDowntime, 1))
+			self.addToStatesUpdateList(dev, key="totalDowntime", value=round(self.totalDowntime, 1))
+			self.executeUpdateStatesList()
+
+	def updateSyncStatus(self, tracker: CaddxSyncTracker) -> None:
+		"""
+		Publish database sync progress, time remaining and failures on the Status Info device.
+
+		:param tracker: The sync in progress.
+		:return: None
+		"""
+		system = int(self.systemId)
+		if system in self.systemStatusList.keys():
+			dev = self.systemStatusList[system]
+			timeRemaining = tracker.timeRemaining()
+			self.addToStatesUpdateList(dev, key="syncProgress", value=tracker.progress())
+			self.addToStatesUpdateList(dev, key="syncTimeRemaining", value=0 if timeRemaining is None else round(timeRemaining))
+			self.addToStatesUpdateList(dev, key="syncFailures", value=", ".join(tracker.failedItems()))
+			self.executeUpdateStatesList()
+
+	def reconcileState(self) -> None:
+		"""
+		Catch up on anything missed while the link was down, on top of the snapshots requestLiveState() has just asked
+		for: the status of every partition that has a device.  Zones are not polled; the Zones Snapshots are compared
+		with the ones from before the outage, and a Zone Status Request follows for each zone that changed.  An outage
+		does not change the panel configuration, so the database is synchronised again if it was before the drop.
+
+		:return: None
+		"""
+		if self.plugin.messageProcessInfo or self.plugin.debug:
+			indigo.server.log("reconcile state:        requesting partition status after reconnect.")
+		for partition in self.partitionList.keys():
+			self.sendMsgToQueue(cmdPartitionStatusRequest + f"{partition - 1:02x}")
+		self.plugin.pluginPrefs['synchronised'] = self.synchronisedBeforeDrop
+
+	def requestLiveState(self) -> None:
+		"""
+		Ask for the live state of the system: the Partition Snapshot, a Zones Snapshot for each block of 16 zones that
+		has a device, and the System Status.  These go ahead of bulk requests (zone names and status, user information),
+		so the arm state of every partition and the trip state of every zone arrive within about 14 round trips.
+
+		:return: None
+		"""
+		self.sendMsgToQueue(cmdPartitionSnapshotRequest)
+		for block in sorted({(zone - 1) // 16 for zone in self.zoneList.keys()}):
+			self.sendMsgToQueue(cmdZonesSnapshotRequest + f"{block:02x}")
+		self.sendMsgToQueue(cmdSystemStatusRequest)
+
+	def pollZones(self) -> None:
+		"""
+		Refresh zone device states, as set by the watchdog poll mode preference.  "snapshot" sends a Zones Snapshot
+		Request for each block of 16 zones that has a device, and the Partition Snapshot Request; a Zone Status Request
+		follows only for zones whose snapshot changed.  Otherwise a Zone Status Request is sent for every zone.
+
+		:return: None
+		"""
+		if self.plugin.watchdogPollMode == "snapshot":
+			for block in sorted({(zone - 1) // 16 for zone in self.zoneList.keys()}):
+				self.sendMsgToQueue(cmdZonesSnapshotRequest + f"{block:02x}")
+			self.sendMsgToQueue(cmdPartitionSnapshotRequest)
+		else:
+			self.actionCmdMessage("", "Zone Status Request ALL")
+
+	def openSocket(self, timeout: float) -> CaddxSocketTransport | None:
+		"""
+		Connect to the serial bridge configured in plugin preferences.
+
+		:param timeout: Read and connect timeout in seconds.
+		:return: The connected transport, or None if the connection failed.
+		"""
+		conn = CaddxSocketTransport(
+			self.plugin, self.plugin.bridgeHost, self.plugin.bridgePort, timeout=timeout, keepAlive=self.plugin.socketKeepAlive)
+		try:
+			conn.open()
+		except OSError as err:
+			self.plugin.errorLog(f"startComm: {conn}: {err}")
+			return None
+		return conn
 
 	def stopComm(self) -> None:
 		"""
@@ -545,10 +2384,15 @@ class Caddx(object):
 		:return: None
 		"""
 		self.plugin.debugLog("stopComm:        entering process")
+		self.stopRequested.set()
 		self.plugin.debugLog("stopComm:        initiating stop looping communication to device %s" % self.devicePort)
 		self.commStatusDown()
 		self.shutdown = True
-		self.conn.cancel_read()
+		self.wakeEvent.set()
+		if self.asyncEngine is not None:
+			self.asyncEngine.stop()
+		if self.conn:
+			self.conn.cancel_read()
 
 	def activeCommLoop(self, devicePort: str, conn, commandQueue: queue) -> None:
 		"""
@@ -566,49 +2410,208 @@ class Caddx(object):
 			self.suspendInterfaceConfigMessageDisplay = False
 			self.flushCommPort(conn)
 
-			# Start things rolling.
-			self.actionSystemStatusRequest("")
+			# Start things rolling: live state first, then the configuration.
+			self.requestLiveState()
 			self.sendMsgToQueue(cmdInterfaceConfigurationRequest)
+			if self.linkRecovered:
+				self.linkRecovered = False
+				self.reconcileState()
 
 			# Start active serial communication loop
 			self.shutdown = False
-			while not self.shutdown:
-				time.sleep(self.plugin.sleepBetweenIdlePoll)
-
-				# trigger to periodically poll data and keep alive
-				self.commContinuityCheck()
-
-				# These messages are usually async events from panel.  Request/response handled below.
-				receivedMessageDict = self.readMsg(conn, waitForResponse=False)
-				if receivedMessageDict:
-					self.decodeReceivedData(receivedMessageDict, 0)
-
-				# Process the command queue
-				retries = 3
-				while not commandQueue.empty() and not self.shutdown:
-					self.plugin.debugLog(f"activeCommLoop: Queue has {commandQueue.qsize()} command(s) waiting.")
-					command = str(commandQueue.get())
-							
-					self.plugin.debugLog(f"activeCommLoop: Processing command: {command}")
-					if self.processMessageFromQueue(conn, command):
-						self.plugin.debugLog(f"activeCommLoop:Command completed: {command}")
-						self.commandQueue.task_done()
-					else:
-						self.plugin.errorLog(f"activeCommLoop: Message send failed.  Retrying '{command}'")
-						retries -= 1
-						if not retries:
-							self.plugin.errorLog("activeCommLoop: Retries exceeded.  Command failed.")
-							retries = 3
-							self.commandQueue.task_done()
+			if self.plugin.commLoopMode == "asyncio" and hasattr(conn, "fileno"):
+				self.asyncioCommLoop(conn)
+			elif self.plugin.commLoopMode in ("event", "asyncio"):
+				if self.plugin.commLoopMode == "asyncio":
+					self.plugin.errorLog(f"activeCommLoop: {devicePort} has no file descriptor for asyncio.  Using the event driven loop.")
+				self.eventCommLoop(conn)
+			else:
+				self.pollCommLoop(conn)
 
 		finally:
+			self.stopReaderThread(conn)
 			while not self.commandQueue.empty():
 				command = self.commandQueue.get()
 				self.plugin.debugLog(f"activeCommLoop: Removing command '{command}' from queue.")
+				command.finish(False)
 				self.commandQueue.task_done()
 			conn.close()
 			indigo.server.log(f"Closed connection to conn device {devicePort} (finally).")
 
+	def pollCommLoop(self, conn) -> None:
+		"""
+		Poll the port for panel messages and the command queue every sleepBetweenIdlePoll seconds.
+
+		:param conn: The pyserial connection object.
+		:return: None.  Returns on shutdown.
+		"""
+		while not self.shutdown:
+			time.sleep(self.plugin.sleepBetweenIdlePoll)
+
+			# trigger to periodically poll data and keep alive
+			self.commContinuityCheck()
+
+			# These messages are usually async events from panel.  Request/response handled below.
+			receivedMessageDict = self.readMsg(conn, waitForResponse=False)
+			if receivedMessageDict:
+				self.decodeReceivedData(receivedMessageDict, 0)
+
+			self.processCommandQueue(conn)
+
+	def eventCommLoop(self, conn) -> None:
+		"""
+		Sleep until the reader thread delivers a frame or a command is queued, then handle it at once.
+		Still wakes for the watchdog when it is enabled.
+
+		:param conn: The pyserial connection object.
+		:return: None.  Returns on shutdown.
+		"""
+		self.startReaderThread(conn)
+		while not self.shutdown:
+			self.wakeEvent.wait(self.idleWakeTimeout())
+			self.wakeEvent.clear()
+			if self.readerError is not None:
+				raise self.readerError
+
+			self.commContinuityCheck()
+
+			receivedMessageDict = self.readMsg(conn, waitForResponse=False)
+			while receivedMessageDict and not self.shutdown:
+				self.decodeReceivedData(receivedMessageDict, 0)
+				receivedMessageDict = self.readMsg(conn, waitForResponse=False)
+
+			self.processCommandQueue(conn)
+
+	def asyncioCommLoop(self, conn) -> None:
+		"""
+		Hand the port to a CaddxAsyncEngine until shutdown.
+
+		:param conn: The pyserial connection object.  Must have a file descriptor.
+		:return: None.  Returns on shutdown.
+		"""
+		self.asyncEngine = CaddxAsyncEngine(self, conn)
+		try:
+			self.asyncEngine.run()
+		finally:
+			self.asyncEngine = None
+
+	def idleWakeTimeout(self) -> float | None:
+		"""
+		Time eventCommLoop may sleep with nothing to do.
+
+		:return: Seconds until the watchdog is due (at least one second), or None if the watchdog is disabled.
+		"""
+		if self.plugin.watchdogTimerPeriod > 0:
+			return max(self.watchdogTimer - time.time(), 1.0)
+		return None
+
+	def processCommandQueue(self, conn) -> None:
+		"""
+		Send every queued command in turn and wait for its reply.
+
+		:param conn: The pyserial connection object.
+		:return: None
+		"""
+		commandQueue = self.commandQueue
+		retries = 3
+		while not commandQueue.empty() and not self.shutdown:
+			self.plugin.debugLog(f"activeCommLoop: Queue has {commandQueue.qsize()} command(s) waiting.")
+			command = commandQueue.get()
+
+			self.plugin.debugLog(f"activeCommLoop: Processing command: {command}")
+			succeeded = False
+			try:
+				for attempt in range(1, retries + 1):
+					delay = self.pacing.delay()
+					if delay:
+						time.sleep(delay)
+					sentAt = time.monotonic()
+					reply = self.processMessageFromQueue(conn, command)
+					self.pacing.exchanged(sentAt, reply is not None and reply not in command.retryReplies)
+					if reply is not None and reply not in command.retryReplies:
+						if reply in command.failReplies:
+							self.plugin.errorLog(f"activeCommLoop: Message rejected by panel.  Command failed: '{command}'")
+						else:
+							self.plugin.debugLog(f"activeCommLoop: Command completed: {command}")
+							succeeded = True
+						break
+					if self.shutdown:
+						break
+					if attempt < retries:
+						self.plugin.errorLog(f"activeCommLoop: Message send failed.  Retrying '{command}'")
+					else:
+						self.plugin.errorLog(f"activeCommLoop: Retries exceeded.  Command failed: '{command}'")
+			finally:
+				command.finish(succeeded)
+				commandQueue.task_done()
+
+	def startReaderThread(self, conn) -> None:
+		"""
+		Start the thread that blocks on the port and hands complete frames to eventCommLoop.
+
+		:param conn: The pyserial connection object.
+		:return: None
+		"""
+		self.readerError = None
+		while not self.frameQueue.empty():
+			self.frameQueue.get()
+		self.readerThread = threading.Thread(target=self.readerLoop, args=(conn,), name="caddxReader", daemon=True)
+		self.readerThread.start()
+
+	def stopReaderThread(self, conn) -> None:
+		"""
+		Stop the reader thread, if running.
+
+		:param conn: The pyserial connection object.
+		:return: None
+		"""
+		readerThread = self.readerThread
+		if readerThread is None:
+			return
+		self.shutdown = True
+		conn.cancel_read()
+		readerThread.join(conn.timeout + 1)
+		self.readerThread = None
+
+	def readerLoop(self, conn) -> None:
+		"""
+		Reader thread body.  Blocks in conn.read() until data arrives (cancel_read() wakes it for shutdown), feeds the
+		frame decoder and queues each complete frame for eventCommLoop.
+
+		:param conn: The pyserial connection object.
+		:return: None
+		"""
+		decoder = self.frameDecoder
+		try:
+			while not self.shutdown:
+				receivedData = conn.read(max(conn.in_waiting, 1))
+				if not receivedData:
+					continue
+				decoder.feed(receivedData)
+				bytesSkipped = decoder.bytesSkipped
+				while True:
+					try:
+						msgData = decoder.nextFrame()
+					except CaddxChecksumError:
+						self.plugin.errorLog("readerLoop: Checksum failed.  Discarding.")
+						continue
+					except CaddxFrameError as err:
+						self.plugin.errorLog(f"readerLoop: {err}  Flushing and discarding.")
+						self.flushCommPort(conn)
+						break
+					if msgData is None:
+						break
+					self.frameQueue.put(msgData)
+					self.wakeEvent.set()
+				if decoder.bytesSkipped != bytesSkipped:
+					self.reportSkippedBytes(decoder.bytesSkipped - bytesSkipped)
+		except Exception as err:
+			if not self.shutdown:
+				self.plugin.errorLog(f"readerLoop: Read from port failed: {err}")
+				self.readerError = err
+		finally:
+			self.wakeEvent.set()
+
 	def compute_fletcher16(self, data: bytearray) -> int:
 		"""
 		Returns the Fletcher16 checksum value in integer format.
@@ -617,105 +2620,141 @@ class Caddx(object):
 		:param data: The data message to be checksummed.
 		:return: 16-bit checksum.
 		"""
+		return fletcher16(data)
 
-		sum1, sum2 = int(), int()
-		for index in range(len(data)):
-			sum1 = (sum1 + data[index]) % 255
-			sum2 = (sum2 + sum1) % 255
-		return (sum2 << 8) | sum1
-
-	def sendMsgToQueue(self, transmitDataHex: str) -> None:
+	def sendMsgToQueue(self, transmitDataHex: str, wantReply: bool = False) -> concurrent.futures.Future | None:
 		"""
-		Add new command to queue, which is polled and emptied by activeCommLoop() and passed to processMessageFromQueue()
+		Add new command to queue, which is emptied by activeCommLoop() and passed to processMessageFromQueue()
 
 		:param transmitDataHex: The command message in hex-encoded ASCII.
-		:return: None.
+		:param wantReply: Return a future for the reply.
+		:return: If wantReply, a future resolved with the reply frame once the reply has been processed, or with
+			CaddxCommandFailed if the command failed or was dropped.  Wait on it with result(timeout).  None otherwise.
 		"""
 		messageNumber = transmitDataHex[2:4]
-		alarmMessage = self.messageAlarmDict(messageNumber)
+		alarmMessage = messageDescriptions[int(messageNumber, 16)]
 		if self.plugin.messageActInfo or self.plugin.debug:
 			indigo.server.log("sendCmdToQueue:          || queue send message: %s  " % str(transmitDataHex))
-		self.commandQueue.put(transmitDataHex)
+		command = CaddxCommand(transmitDataHex)
+		tracker = self.syncTracker
+		future = concurrent.futures.Future() if wantReply else None
+
+		# register with the tracker and the reply future before the communication loop can send the command, or it may
+		# finish before anyone is listening
+		def onQueued(queuedCommand: CaddxCommand) -> None:
+			if tracker is not None:
+				tracker.track(queuedCommand)
+			if future is not None:
+				queuedCommand.callbacks.append(lambda command, succeeded: self.resolveReply(future, command, succeeded))
+
+		queuedCommand = self.commandQueue.put(command, onQueued)
+		if queuedCommand is not command:
+			self.plugin.debugLog(f"sendMsgToQueue: '{transmitDataHex}' is already waiting in the queue.  Coalesced.")
+		self.wakeEvent.set()
+		if self.asyncEngine is not None:
+			self.asyncEngine.notify()
 
 		partition = 1  # update partition device state - lastFunction with the last transmitted message
 		if partition in self.partitionList.keys():
 			dev = self.partitionList[partition]
 			self.addToStatesUpdateList(dev, key="lastFunction", value=f"{alarmMessage}  >> {messageNumber}  ** {self.timestamp()} ")
 		self.updateVariable("sendingMessage", f" >> {messageNumber} --  {alarmMessage}     {transmitDataHex} ")
+		return future
+
+	@staticmethod
+	def resolveReply(future: concurrent.futures.Future, command: CaddxCommand, succeeded: bool) -> None:
+		"""
+		Complete the future returned by sendMsgToQueue() for a finished command.
+
+		:param future: The future.
+		:param command: The finished command.
+		:param succeeded: True if the panel answered with a reply that completes the command.
+		:return: None
+		"""
+		if succeeded:
+			future.set_result(command.reply)
+		elif command.reply is not None:
+			future.set_exception(CaddxCommandFailed(f"'{command}' answered with message {command.reply[1] & 0x3f:02x}."))
+		else:
+			future.set_exception(CaddxCommandFailed(f"No reply to '{command}'."))
 
-	def processMessageFromQueue(self, conn, transmitDataHex: str) -> bool:
+	def processMessageFromQueue(self, conn, command: CaddxCommand) -> int | None:
 		"""Send a message in binary format. Wait for reply if necessary.
 
 		:param conn: Handle for serial port.
-		:param transmitDataHex: Hex-formatted message.
-		:return: True if message sent and reply received.  False otherwise.
+		:param command: The queued command.
+		:return: Message number of the reply, or None if no reply arrived in time.
 		"""
-		self.sendMsg(transmitDataHex)
-		# Todo:  Extract message type so we can check for correct reply.
-		return self.waitForResponse(conn, 0)
+		self.sendMsg(command.transmitDataHex)
+		return self.waitForResponse(conn, command)
 	
-	def readMsg(self, conn, waitForResponse: bool) -> None | list[str]:
+	def readMsg(self, conn, waitForResponse: bool, timeout: float | None = None) -> None | bytes:
 		"""
 		Read complete message from serial port.
+		Everything the port has waiting is read in one call and handed to the frame decoder, which keeps any partial
+		frame until the rest arrives.
 		**Note**:  Serial port timeout should be set to 3 seconds to reflect worst-case processing time.
 
 		:param conn: pySerial object.
 		:param waitForResponse: If True, wait up to port timeout until message received,
 			otherwise return immediately if no message.
-		:return: None if no message.   Valid message list object otherwise.
+		:param timeout: Wait this long instead of the port timeout.  Only honoured in event mode: reads straight from
+			the port are bounded by the port timeout.
+		:return: None if no message.   Valid message frame (length, message number and data) otherwise.
 		"""
-		if not waitForResponse and conn.in_waiting == 0:
-			return None
-
-		startCharacter = conn.read()
-		if not startCharacter:
-			self.plugin.errorLog("readMsg: No data when reply was expected.  Probably timeout.")
-			return None
-		if startCharacter != b'\x7e':
-			self.plugin.errorLog("readMsg: Message buffer out of sync.  Missing start character.  Flushing and discarding.")
-			self.flushCommPort(conn)
-			return None
-		msgLengthByte = conn.read()
-		if not msgLengthByte:
-			self.plugin.errorLog("readMsg: Missing length.  Flushing and discarding.")
-			self.flushCommPort(conn)
-			return None
-		msgData = bytearray()
-		msgData.extend(msgLengthByte)
-		msgLength = int.from_bytes(msgLengthByte, "little")
-		msgLengthFull = msgLength + 3   # Full message length includes length byte and 2 byte checksum
-		for i in range(msgLength + 2):  # Message checksum included.  Already read length.
-			nextChar = conn.read()
-			if nextChar == b'\x7d':
-				nextChar = conn.read()
-				if nextChar == b'\x5e':
-					self.plugin.debugLog("readMsg: Escape sequence 0x7d5e")
-					nextChar = b'\x7e'
-				elif nextChar == b'\x5d':
-					self.plugin.debugLog("readMsg: Escape sequence 0x7d5d")
-					nextChar = b'\x7d'
-				else:
-					self.plugin.errorLog("readMsg: Bad byte stuffing. Flushing and discarding.")
+		if self.readerThread is not None:
+			try:
+				return self.frameQueue.get(block=waitForResponse, timeout=conn.timeout if timeout is None else timeout)
+			except queue.Empty:
+				if waitForResponse:
+					self.plugin.errorLog("readMsg: No data when reply was expected.  Probably timeout.")
+				return None
+
+		decoder = self.frameDecoder
+		bytesSkipped = decoder.bytesSkipped
+		try:
+			while True:
+				try:
+					msgData = decoder.nextFrame()
+				except CaddxChecksumError:
+					self.plugin.errorLog("readMsg: Checksum failed.  Discarding.")
+					return None
+				except CaddxFrameError as err:
+					self.plugin.errorLog(f"readMsg: {err}  Flushing and discarding.")
 					self.flushCommPort(conn)
 					return None
-			msgData.extend(nextChar)
-		if len(msgData) != msgLengthFull:  # The actual data plus the length byte and 2 byte checksum.
-			self.plugin.errorLog(f"readMsg: Message data wrong length ({len(msgData)} != {msgLengthFull}). Flushing and discarding.")
-			self.flushCommPort(conn)
-			return None
+				if msgData is not None:
+					break
 
-		offeredChecksum = int.from_bytes(msgData[-2:], byteorder="little")
-		del msgData[-2:]
-		computedChecksum = self.compute_fletcher16(msgData)
-		if offeredChecksum != computedChecksum:
-			self.plugin.errorLog("readMsg: Checksum failed.  Discarding.")
-			return None
+				waiting = conn.in_waiting
+				if not waiting and not waitForResponse:
+					return None
+				receivedData = conn.read(max(waiting, 1))  # Blocks up to port timeout for the first byte.
+				if not receivedData:
+					if decoder.buffer and not decoder.resync:
+						self.plugin.errorLog("readMsg: Message incomplete when port timed out.  Discarding.")
+						decoder.reset()
+					else:
+						self.plugin.errorLog("readMsg: No data when reply was expected.  Probably timeout.")
+					return None
+				decoder.feed(receivedData)
+		finally:
+			if decoder.bytesSkipped != bytesSkipped:
+				self.reportSkippedBytes(decoder.bytesSkipped - bytesSkipped)
+
+		return msgData
 
-		# Convert to the ASCII Hex message list used by upstream parsing.
-		messageList = []
-		for i in msgData:
-			messageList.append(f"{i:02x}")
-		return messageList
+	def reportSkippedBytes(self, count: int) -> None:
+		"""
+		Log bytes dropped from the receive stream (resynchronising or failed checksum), and keep the running total in
+		plugin prefs.
+
+		:param count: Number of bytes just skipped.
+		:return: None
+		"""
+		total = self.frameDecoder.bytesSkipped
+		self.plugin.errorLog(f"readMsg: Skipped {count} unusable byte(s) in receive stream, {total} in total.")
+		self.plugin.pluginPrefs['framingBytesSkipped'] = total
 
 	def flushCommPort(self, conn) -> None:
 		"""
@@ -724,24 +2763,36 @@ class Caddx(object):
 		:param conn: pySerial object.  Used for all serial I/O
 		:return: None
 		"""
+		self.frameDecoder.reset()
 		while conn.in_waiting and conn.read(100):
 			self.plugin.debugLog("flushCommPort: throwing away data.")
 		conn.reset_input_buffer()
 
-	def waitForResponse(self, conn, requestMessageType: int) -> bool:
+	def waitForResponse(self, conn, command: CaddxCommand) -> int | None:
 		"""
-		Wait for reply to sent queued command.
+		Wait up to the port timeout for the reply to a sent queued command.  Anything else the panel sends meanwhile
+		(zone status, log events and so on) is processed as an unsolicited message and the wait goes on.
 
 		:param conn: pySerial object.  Used for all serial I/O
-		:param requestMessageType: Command/message type of original message.  Used to determine correct reply.
-		:return: True if reply received.  False otherwise.
+		:param command: The command that was sent.  Used to determine correct reply.
+		:return: Message number of the reply, or None if no reply arrived in time.
 		"""
-		responseMessage = self.readMsg(conn, waitForResponse=True)
-		if not responseMessage:
-			return False
-		# Todo: Ensure that response matches request.  Might not be if a random event happens while waiting.
-		self.decodeReceivedData(responseMessage, requestMessageType)
-		return True
+		deadline = time.monotonic() + conn.timeout
+		while not self.shutdown:
+			remaining = deadline - time.monotonic()
+			if remaining <= 0:
+				self.plugin.errorLog(f"waitForResponse: No reply to '{command}' within {conn.timeout} seconds.")
+				return None
+			responseMessage = self.readMsg(conn, waitForResponse=True, timeout=remaining)
+			if not responseMessage:
+				return None
+			if command.isReply(responseMessage):
+				command.reply = responseMessage
+				self.decodeReceivedData(responseMessage, command.messageNumber)
+				return responseMessage[1] & 0x3f
+			self.plugin.debugLog(f"waitForResponse: Message {responseMessage[1] & 0x3f:02x} is not a reply to '{command}'.")
+			self.decodeReceivedData(responseMessage, 0)
+		return None
 
 	def sendMsg(self, transmitDataHex: str) -> None:
 		"""
@@ -751,22 +2802,14 @@ class Caddx(object):
 		:return: None
 		"""
 
-		transmitMessage = bytearray.fromhex(transmitDataHex)
-		checksum = self.compute_fletcher16(transmitMessage)
-		transmitMessage.extend(checksum.to_bytes(2, byteorder="little"))
-		transmitMessageStuffed = bytearray()
-		for i in transmitMessage:
-			if i == '0x7e':
-				transmitMessageStuffed.extend(b"\x7d\x5e")
-			elif i == '0x7d':
-				transmitMessageStuffed.extend(b"\x7d\x5d")
-			else:
-				transmitMessageStuffed.append(i)
-		transmitMessageStuffed[0:0] = b'\x7e'
-		self.conn.write(transmitMessageStuffed)
+		transmitMessageStuffed = encodeMessage(transmitDataHex)
+		if self.asyncEngine is not None:
+			self.asyncEngine.write(transmitMessageStuffed)
+		else:
+			self.conn.write(transmitMessageStuffed)
 		messageNumber = transmitDataHex[2:4]
-		alarmMessage = self.messageAlarmDict(messageNumber)
-		self.plugin.debugLog(f"sendMsg:           >> sent message: {messageNumber},  {alarmMessage},  {transmitMessage.hex()}")
+		alarmMessage = messageDescriptions[int(messageNumber, 16)]
+		self.plugin.debugLog(f"sendMsg:           >> sent message: {messageNumber},  {alarmMessage},  {transmitMessageStuffed.hex()}")
 
 	def timestamp(self) -> str:
 		"""
@@ -785,12 +2828,11 @@ class Caddx(object):
 	###############################################################################
 
 	# noinspection PyUnusedLocal
-	def updateAlarmDisplay(self, varList, newByte) -> None:
+	def updateAlarmDisplay(self, newByte) -> None:
 		"""
 		Update Alarm Display from received "Partition Snapshot Message" method
 
-		:param varList: ???
-		:param newByte: ???
+		:param newByte: Partition Snapshot bytes, partition 1 first.
 		:return: None
 		"""
 		partition = 1								# assumes control keypad is always in partition 1
@@ -798,7 +2840,7 @@ class Caddx(object):
 			dev = self.partitionList[partition]
 			
 			partition1 = newByte[0]
-			self.plugin.debugLog("updateAlarmDisplay:        display message byte: %s" % partition1)
+			self.plugin.debugLog("updateAlarmDisplay:        display message byte: %s" % f"{partition1:08b}")
 			timestamp = self.timestamp()
 			partitionState = 0
 							
@@ -818,111 +2860,111 @@ class Caddx(object):
 			displayLCDLine2 = " "
 		
 			# analyze partition state conditions for Common Mode  (Chime Mode Off)
-			if partition1 == '00000011':  												# Disarmed, System Ready, Chime Off
+			if partition1 == 0b00000011:  												# Disarmed, System Ready, Chime Off
 				partitionState = 1
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]
 				self.breachedZone = " "													# Reset breached zone on disarm cycle		
-			elif partition1 == '00000001':												# Disarmed, System Not Ready, Chime Off
+			elif partition1 == 0b00000001:												# Disarmed, System Not Ready, Chime Off
 				partitionState = 2
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]			
 			
 			# analyze partition state conditions for Stay Mode
-			elif partition1 == '01001111':												# Arming Stay Mode, System Ready, Chime Off
+			elif partition1 == 0b01001111:												# Arming Stay Mode, System Ready, Chime Off
 				partitionState = 3
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]		
-			elif partition1 == '11001111':												# Arming Stay Mode (exit delay timed), Security Alert Parameter, Chime Off
+			elif partition1 == 0b11001111:												# Arming Stay Mode (exit delay timed), Security Alert Parameter, Chime Off
 				partitionState = 4
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = self.breachedZone		
-			elif partition1 == '00001111':												# Armed Stay Mode , System Secure, Chime Off
+			elif partition1 == 0b00001111:												# Armed Stay Mode , System Secure, Chime Off
 				partitionState = 5
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]	
-			elif partition1 == '00101101' or partition1 == '00101111':					# Armed Stay Mode (entry delay timed), Security Alert (entry zone), Chime Off
+			elif partition1 == 0b00101101 or partition1 == 0b00101111:					# Armed Stay Mode (entry delay timed), Security Alert (entry zone), Chime Off
 				partitionState = 6
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]	
-			elif partition1 == '10001111':												# Armed Stay Mode , Security Alert Parameter, Chime Off
+			elif partition1 == 0b10001111:												# Armed Stay Mode , Security Alert Parameter, Chime Off
 				partitionState = 7
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = self.breachedZone	
 			
 			# analyze partition state conditions for Away Mode
-			elif partition1 == '01000111':												# Arming Away Mode , System Ready, Chime Off
+			elif partition1 == 0b01000111:												# Arming Away Mode , System Ready, Chime Off
 				partitionState = 8
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]
-			elif partition1 == '11000101' or partition1 == '11000111':					# Arming Away Mode (exit delay timed), Security Alert Parameter, Chime Off
+			elif partition1 == 0b11000101 or partition1 == 0b11000111:					# Arming Away Mode (exit delay timed), Security Alert Parameter, Chime Off
 				partitionState = 9
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = self.breachedZone
-			elif partition1 == '00000111':												# Armed Away Mode, System Secure, Chime Off
+			elif partition1 == 0b00000111:												# Armed Away Mode, System Secure, Chime Off
 				partitionState = 10
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]
-			elif partition1 == '00100101' or partition1 == '00100111':				# Armed Away Mode (entry delay timed), Security Alert (entry zone), Chime Off
+			elif partition1 == 0b00100101 or partition1 == 0b00100111:				# Armed Away Mode (entry delay timed), Security Alert (entry zone), Chime Off
 				partitionState = 11
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]
-			elif partition1 == '10000101' or partition1 == '10000111':				# Armed Away Mode , Security Alert Parameter, Chime Off
+			elif partition1 == 0b10000101 or partition1 == 0b10000111:				# Armed Away Mode , Security Alert Parameter, Chime Off
 				partitionState = 12	
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = self.breachedZone
 			
 			# analyze partition state conditions for Common Mode  (Chime Mode On)
-			elif partition1 == '00010011':  											# Disarmed, System Ready, Chime Off
+			elif partition1 == 0b00010011:  											# Disarmed, System Ready, Chime Off
 				partitionState = 1
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]
 				self.breachedZone = " "													# Reset breached zone on disarm cycle
-			elif partition1 == '00010001':												# Disarmed, System Not Ready, Chime On
+			elif partition1 == 0b00010001:												# Disarmed, System Not Ready, Chime On
 				partitionState = 2
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]
 			
 			# analyze partition state conditions for Stay Mode
-			elif partition1 == '01011111':												# Arming Stay Mode, System Ready, Chime On
+			elif partition1 == 0b01011111:												# Arming Stay Mode, System Ready, Chime On
 				partitionState = 3
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]
-			elif partition1 == '11011111':												# Arming Stay Mode (exit delay timed), Security Alert Parameter, Chime On
+			elif partition1 == 0b11011111:												# Arming Stay Mode (exit delay timed), Security Alert Parameter, Chime On
 				partitionState = 4
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = self.breachedZone
-			elif partition1 == '00011111':												# Armed Stay Mode , System Secure, Chime On
+			elif partition1 == 0b00011111:												# Armed Stay Mode , System Secure, Chime On
 				partitionState = 5
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]
-			elif partition1 == '00111101' or partition1 == '00111111':					# Armed Stay Mode (entry delay timed), Security Alert (entry zone), Chime On
+			elif partition1 == 0b00111101 or partition1 == 0b00111111:					# Armed Stay Mode (entry delay timed), Security Alert (entry zone), Chime On
 				partitionState = 6
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]
-			elif partition1 == '10011111':												# Armed Stay Mode , Security Alert Parameter, Chime On
+			elif partition1 == 0b10011111:												# Armed Stay Mode , Security Alert Parameter, Chime On
 				partitionState = 7
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = self.breachedZone
 			
 			# analyze partition state conditions for Away Mode
-			elif partition1 == '01010111':												# Arming Away Mode , System Ready, Chime On
+			elif partition1 == 0b01010111:												# Arming Away Mode , System Ready, Chime On
 				partitionState = 8
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]
-			elif partition1 == '11010101' or partition1 == '11010111':					# Arming Away Mode (exit delay timed), Security Alert Parameter, Chime On
+			elif partition1 == 0b11010101 or partition1 == 0b11010111:					# Arming Away Mode (exit delay timed), Security Alert Parameter, Chime On
 				partitionState = 9
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = self.breachedZone
-			elif partition1 == '00010111':												# Armed Away Mode, System Secure, Chime On
+			elif partition1 == 0b00010111:												# Armed Away Mode, System Secure, Chime On
 				partitionState = 10
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]
-			elif partition1 == '00110101' or partition1 == '00110111':					# Armed Away Mode (entry delay timed), Security Alert (entry zone), Chime On
+			elif partition1 == 0b00110101 or partition1 == 0b00110111:					# Armed Away Mode (entry delay timed), Security Alert (entry zone), Chime On
 				partitionState = 11
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = displayLCDLine2List[partitionState]
-			elif partition1 == '10010101' or partition1 == '10010111':					# Armed Away Mode , Security Alert Parameter, Chime On
+			elif partition1 == 0b10010101 or partition1 == 0b10010111:					# Armed Away Mode , Security Alert Parameter, Chime On
 				partitionState = 12
 				displayLCDLine1 = displayLCDLine1List[partitionState]
 				displayLCDLine2 = self.breachedZone
@@ -1016,223 +3058,32 @@ class Caddx(object):
 				zoneDisplayName = 'zone %r' % zone	
 		return zoneDisplayName	
 													
-	################################################################################
-	# Routines for Zone Group Type Processing methods (decode zone group type configuration and add zone description)
-	################################################################################
-	
-	def zoneGroupType(self, zoneTypeDict: str) -> str:
-		"""
-		Determine the zone group type number.
-
-		:param zoneTypeDict: ???
-		:return: The zone group type in string format.
-		"""
-		if zoneTypeDict == '000000000001001111110100':
-			zoneType = '01'
-		elif zoneTypeDict == '000000100001001111000000':
-			zoneType = '02'		
-		elif zoneTypeDict == '000100000001101111110000':
-			zoneType = '03'	
-		elif zoneTypeDict == '000110000001001111110000':
-			zoneType = '04'	
-		elif zoneTypeDict == '010110000001001111110000':
-			zoneType = '05'	
-		elif zoneTypeDict == '000000000001101111110000':
-			zoneType = '06'	
-		elif zoneTypeDict == '000000100000000011000000':
-			zoneType = '07'
-		elif zoneTypeDict == '000000010000010111000100':
-			zoneType = '08'	
-		elif zoneTypeDict == '001000000001101111110000':
-			zoneType = '09'	
-		elif zoneTypeDict == '000010100001000011000000':
-			zoneType = '10'		
-		elif zoneTypeDict == '000001000000000000000000':
-			zoneType = '11'		
-		elif zoneTypeDict == '010110000001001111111000':
-			zoneType = '12'	
-		elif zoneTypeDict == '000000001001101111110000':
-			zoneType = '13'
-		elif zoneTypeDict == '000100000011101111110000':
-			zoneType = '14'	
-		elif zoneTypeDict == '010110000011001111110000':
-			zoneType = '15'	
-		elif zoneTypeDict == '000000000011101111110000':
-			zoneType = '16'	
-		elif zoneTypeDict == '000100000001101111110010':
-			zoneType = '17'	
-		elif zoneTypeDict == '010110000001001111110010':
-			zoneType = '18'	
-		elif zoneTypeDict == '000000000001101111110010':
-			zoneType = '19'
-		elif zoneTypeDict == '001000000001101111110010':
-			zoneType = '20'	
-		elif zoneTypeDict == '000010100001000111000000':
-			zoneType = '21'		
-		elif zoneTypeDict == '000010100001000111000000':
-			zoneType = '22'	
-		elif zoneTypeDict == '000010100001000111000000':
-			zoneType = '23'
-		elif zoneTypeDict == '000000010000010111000100':
-			zoneType = '24'	
-		elif zoneTypeDict == '100010100001100000000000':
-			zoneType = '25'
-		elif zoneTypeDict == '011010000001001111110000':
-			zoneType = '26'	
-		elif zoneTypeDict == '010110000101001111110000':
-			zoneType = '27'		
-		elif zoneTypeDict == '001000000101101111110000':
-			zoneType = '28'	
-		elif zoneTypeDict == '010110000001001111110000':
-			zoneType = '29'
-		elif zoneTypeDict == '000100000001101111110000':
-			zoneType = '30'
-		else:
-			zoneType = 'no zone group match'	
-		return zoneType
-
-	def zoneGroupDescription(self, zoneTypeDict: str) -> str:
-		"""
-		Determine the zone group type description label
-
-		:param zoneTypeDict: ???
-		:return: The zone type description in string format.
-		"""
-		if zoneTypeDict == '000000000001001111110100':
-			# zoneType = '01'
-			zoneDescription = 'Day/Night Alarm'
-		elif zoneTypeDict == '000000100001001111000000':
-			# zoneType = '02'
-			zoneDescription = 'Panic Alarm'	
-		elif zoneTypeDict == '000100000001101111110000':
-			# zoneType = '03'
-			zoneDescription = 'Entry/Exit (delay1)'
-		elif zoneTypeDict == '000110000001001111110000':
-			# zoneType = '04'
-			zoneDescription = 'Interior Alarm'	
-		elif zoneTypeDict == '010110000001001111110000':
-			# zoneType = '05'
-			zoneDescription = 'Interior Alarm'
-		elif zoneTypeDict == '000000000001101111110000':
-			# zoneType = '06'
-			zoneDescription = 'Perimeter Alarm'	
-		elif zoneTypeDict == '000000100000000011000000':
-			# zoneType = '07'
-			zoneDescription = 'Silent Panic'	
-		elif zoneTypeDict == '000000010000010111000100':
-			# zoneType = '08'
-			zoneDescription = 'Fire Alarm'	
-		elif zoneTypeDict == '001000000001101111110000':
-			# zoneType = '09'
-			zoneDescription = 'Entry/Exit (delay2)'
-		elif zoneTypeDict == '000010100001000011000000':
-			# zoneType = '10'
-			zoneDescription = 'Tamper Alarm'	
-		elif zoneTypeDict == '000001000000000000000000':
-			# zoneType = '11'
-			zoneDescription = 'Arm/Disarm (momentary keyswitch)'	
-		elif zoneTypeDict == '010110000001001111111000':
-			# zoneType = '12'
-			zoneDescription = 'Interior Alarm (cross zone)'	
-		elif zoneTypeDict == '000000001001101111110000':
-			# zoneType = '13'
-			zoneDescription = 'Perimeter Alarm (entry guard)'
-		elif zoneTypeDict == '000100000011101111110000':
-			# zoneType = '14'
-			zoneDescription = 'Entry/Exit (delay1, group bypass)'
-		elif zoneTypeDict == '010110000011001111110000':
-			# zoneType = '15'
-			zoneDescription = 'Interior Alarm (group bypass)'	
-		elif zoneTypeDict == '000000000011101111110000':
-			# zoneType = '16'
-			zoneDescription = 'Perimeter Alarm (group bypass)'	
-		elif zoneTypeDict == '000100000001101111110010':
-			# zoneType = '17'
-			zoneDescription = 'Arm/Disarm (maintained keyswitch)'
-		elif zoneTypeDict == '010110000001001111110010':
-			# zoneType = '18'
-			zoneDescription = 'Entry/Exit (delay1, force armable)'
-		elif zoneTypeDict == '000000000001101111110010':
-			# zoneType = '19'
-			zoneDescription = 'Entry/Exit (delay2, force armable)'
-		elif zoneTypeDict == '001000000001101111110010':
-			# zoneType = '20'
-			zoneDescription = 'Entry/Exit (delay2, chime enabled)'	
-		elif zoneTypeDict == '000010100001000111000000':
-			# zoneType = '21"'
-			zoneDescription = 'Gas Detected or Low/High Temp'	
-		elif zoneTypeDict == '000010100001000111000000':
-			# zoneType = '22'
-			zoneDescription = 'Freeze Alarm'	
-		elif zoneTypeDict == '000010100001000111000000':
-			# zoneType = '23'
-			zoneDescription = 'Interior Alarm'
-		elif zoneTypeDict == '000000010000010111000100':
-			# zoneType = '24'
-			zoneDescription = 'Perimeter Alarm'	
-		elif zoneTypeDict == '100010100001100000000000':
-			# zoneType = '25'
-			zoneDescription = 'Interior Alarm'	
-		elif zoneTypeDict == '011010000001001111110000':
-			# zoneType = '26'
-			zoneDescription = 'Burglary Alarm (supervised local)'
-		elif zoneTypeDict == '010110000101001111110000':
-			# zoneType = '27'
-			zoneDescription = 'Perimeter Alarm (activity monitor)'		
-		elif zoneTypeDict == '001000000101101111110000':
-			# zoneType = '28'
-			zoneDescription = 'Perimeter Alarm (request to exit)'
-		elif zoneTypeDict == '010110000001001111110000':
-			# zoneType = '29'
-			zoneDescription = 'Interior Alarm (request access to entry)'	
-		elif zoneTypeDict == '000100000001101111110000':
-			# zoneType = '30'
-			zoneDescription = 'Medical Alarm'
-		else:
-			zoneDescription = 'no zone group match'	
-		return zoneDescription		
-																							
 	################################################################################
 	# Routines for Zone State Update method  (update zoneState value condition from received "Zone Status Message")
 	################################################################################
 	
 	def updateZoneStateCondition(self, dev, zoneNum, zoneCondition) -> None:
 		"""
-		Determine and update zoneState value condition
+		Determine zoneState from the zone condition and publish it, if it changed.
 
-		:param dev: ???
-		:param zoneNum: ???
-		:param zoneCondition: ???
+		:param dev: The zone device.
+		:param zoneNum: The zone number.
+		:param zoneCondition: Zone condition flags 1 byte.
 		:return: None
 		"""
-		
+		record = self.zoneStates.get(zoneNum)
+		if record is None:
+			record = self.zoneStates[zoneNum] = CaddxZoneState(dev.states.get("zoneState"))
+		if not record.update(zoneCondition):
+			return
+		zoneState = record.state
+
 		# test if zoneDisplayName exists in pluginProps dictionary
 		zone = f"{zoneNum:03}"
 		if dev.pluginProps['zoneDisplayName']:
 			zoneName = dev.pluginProps['zoneDisplayName']
 		else:
 			zoneName = "Zone " + zone
-		# bitList = zoneCondition
-				
-		# test for condition of zoneState device state for Group Trigger Plugin
-		if zoneCondition == '00000001':
-			zoneState = "triggered"
-		elif zoneCondition == '00000010':
-			zoneState = "tampered"
-		elif zoneCondition == '00000100':
-			zoneState = "trouble"	
-		elif zoneCondition == '00001000':
-			zoneState = "bypassed"
-		elif zoneCondition == '00010000':
-			zoneState = "inhibited"
-		elif zoneCondition == '00100000':
-			zoneState = "lowBattery"
-		elif zoneCondition == '01000000':
-			zoneState = "supervisionLoss"
-		elif zoneCondition == '00000000':
-			zoneState = "normal"
-		else:
-			zoneState = "multipleChanges"
 
 		# update zoneState device state
 		self.addToStatesUpdateList(dev, key="zoneState", value=zoneState)
@@ -1295,7 +3146,7 @@ class Caddx(object):
 			dev = self.partitionList[partition]
 			self.addToStatesUpdateList(dev, key="partitionState", value="Disconnected")
 			self.addToStatesUpdateList(dev, key="securityState", value="Disconnected")
-			self.addToStatesUpdateList(dev, key="lastStateChange", value=f"Partition 1  Disconnected  ** {self.timestamp}")
+			self.addToStatesUpdateList(dev, key="lastStateChange", value=f"Partition 1  Disconnected  ** {self.timestamp()}")
 			self.updateVariable("securityState", "Disconnected")
 			self.updateVariable("lastStateChange", f"Partition 1  Disconnected  ** {self.timestamp()}")
 
@@ -1320,236 +3171,222 @@ class Caddx(object):
 					self.watchdogTimer = timeNow + self.plugin.watchdogTimerPeriod  # reset watchdog timer
 					self.plugin.pluginPrefs['firmware'] = '*****'				# reset firmware to test communication loop
 					self.sendMsgToQueue(cmdInterfaceConfigurationRequest)	 # command action: Interface Configuration Request
-					# Todo:  Getting a dump of all zones seems like overkill.  Really necessary?
-					self.actionCmdMessage("", "Zone Status Request ALL")  # update status of zones in case we missed an event
+					self.pollZones()  # update status of zones in case we missed an event
+
+			else:
+				return
+		else:
+			return		
+
+	def validatePanelCache(self, cacheKey: tuple[int, str], timeout: float = 30) -> str | None:
+		"""
+		Re-read the panel model and firmware and a sample of zone names, and compare them with the loaded panel
+		configuration cache.
+
+		:param cacheKey: The (model, firmware) returned by CaddxPanelCache.load().
+		:param timeout: Seconds to wait for each reply.
+		:return: None if the cache matches the panel, otherwise what differs.
+		:raises CaddxCommandFailed, concurrent.futures.TimeoutError: If the panel does not answer.
+		"""
+		model, firmware = cacheKey
+		sample = self.panelCache.sample()
+		systemStatus = self.sendMsgToQueue(cmdSystemStatusRequest, wantReply=True)
+		interfaceConfiguration = self.sendMsgToQueue(cmdInterfaceConfigurationRequest, wantReply=True)
+		nameReplies = [self.singleZoneNameRequest(zone - 1) for zone in sample]
+		if systemStatus.result(timeout)[2] != model:
+			return "panel model changed"
+		if interfaceConfiguration.result(timeout)[2:6].decode("latin-1") != firmware:
+			return "panel firmware changed"
+		if CaddxPanelCache.checksum(sample.values()) != CaddxPanelCache.checksum(reply.result(timeout).hex() for reply in nameReplies):
+			return f"names of sampled zones {sorted(sample)} changed"
+		return None
+
+	def restorePanelCache(self) -> int:
+		"""
+		Apply the validated panel configuration cache to devices whose configuration differs from it.
+
+		:return: Number of devices updated.
+		"""
+		cache = self.panelCache
+		updated = 0
+		with cache.lock:
+			zoneNames = dict(cache.zoneNames)
+			zoneConfig = dict(cache.zoneConfig)
+			users = dict(cache.users)
+		for zone, frame in zoneNames.items():
+			if zone in self.zoneList.keys():
+				dataDict = bytes.fromhex(frame)
+				if self.zoneList[zone].pluginProps.get("zoneDisplayName") != self.decodeZoneName(dataDict):
+					self._zoneNameMessage(dataDict)
+					updated += 1
+		for zone, config in zoneConfig.items():
+			if zone in self.zoneList.keys():
+				# the cached bytes are frame offsets 3 - 6 of the zone's Zone Status Message
+				if self.updateZoneConfigUi(self.zoneList[zone], bytes(3) + bytes.fromhex(config)):
+					updated += 1
+		for user, frame in users.items():
+			if user in self.userList.keys():
+				# the cached frame has no PIN: restore the authority and partition flags, keep the device's PIN
+				dataDict = bytes.fromhex(frame)
+				userProps = self.userList[user].pluginProps
+				if any(userProps.get(key) != value for key, value in messageSchema[0x12].decodeProps(dataDict)):
+					self._userInformationReply(dataDict, withPin=False)
+					updated += 1
+		self.executeUpdateStatesList()
+		return updated
 
-			else:
-				return
-		else:
-			return		
+	def cachedZoneGroup(self, zone: int) -> tuple[str, str] | None:
+		"""
+		Zone group of a zone from the panel configuration cache, without a panel round-trip.
+
+		:param zone: Zone number.
+		:return: The zone group type number and description, or None if the zone's configuration is not cached.
+		"""
+		with self.panelCache.lock:
+			config = self.panelCache.zoneConfig.get(zone)
+		if config is None:
+			return None
+		return zoneGroup(int(config[2:8], 16))							# partition mask byte, then the type flags
 
 	################################################################################
 	# Routines for Received Message Processing (decode Received messages and call update process)
 	################################################################################
 
+	def _acknowledgeMessage(self, dataDict: bytes) -> None:
+		"""
+		Process *Command / Request Failed*, *ACK*, *NAK* and *Message Rejected*.  The reply itself is matched to its
+		command by the comm loop, so there is nothing to update.
+
+		:param dataDict: Received message frame (length, message number and data).
+		:return: None
+		"""
+		self.plugin.debugLog(f"decodeReceivedData: Got '{messageSchema[dataDict[1] & 0x3f].name}'")
+
 	# noinspection PyUnusedLocal
-	def decodeReceivedData(self, messageDict: list[str], reqMessageType: int) -> None:
+	def decodeReceivedData(self, messageDict: bytes, reqMessageType: int) -> None:
 		"""
 		Process received messages and call associated decode and update method.
 
-		:param messageDict: A hex-formatted message dictionary.
+		:param messageDict: Received message frame (length, message number and data).
 		:param reqMessageType: The type of message that triggered the received data.
 		:return: None.  (TBD: bool)
 		"""
 		# Todo: validate received data was proper response for reqMessageType
-		messageNumber = int(messageDict[1], 16)
+		messageNumber = messageDict[1]
 		ackRequested = bool(messageNumber & 0x80)
 		messageNumber = messageNumber & ~0xc0  # Use only bottom 6 bits.
 
-		match messageNumber:
-			case 0x01:											# Interface Configuration Message
-				self._interfaceConfigurationMessage(messageDict)
-			case 0x03:											# Zone Name Message
-				self._zoneNameMessage(messageDict)
-			case 0x04:											# Zone Status Message
-				self._zoneStatusMessage(messageDict)
-			case 0x05:											# Zone Snapshot Message
-				self._zoneSnapshotMessage(messageDict)
-			case 0x06:											# Partition Status Message
-				self._partitionStatusMessage(messageDict)
-			case 0x07:											# Partition Snapshot Message
-				self._partitionSnapshotMessage(messageDict)
-			case 0x08:											# System Status Message
-				self._systemStatusMessage(messageDict)
-			case 0x09:											# X-10 Message Received
-				self._x10MessageReceived(messageDict)
-			case 0x0a:											# Log Event Message
-				self._logEventMessage(messageDict)
-			case 0x0b:											# Keypad Message Received
-				self._keypadMessageReceived(messageDict)
-			case 0x10:											# Program Data Reply
-				self._programDataReply(messageDict)
-			case 0x12:											# User Information Reply
-				self._userInformationReply(messageDict)
-			case 0x1c:											# Command / Request Failed
-				self.plugin.debugLog("decodeReceivedData: Got 'Command/Request Failed'")
-				pass
-			case 0x1d:											# Positive Acknowledge
-				self.plugin.debugLog("decodeReceivedData: Got 'ACK'")
-				pass
-			case 0x1e:											# Negative Acknowledge
-				self.plugin.debugLog("decodeReceivedData: Got 'NAK'")
-				pass
-			case 0x1f:											# Message Rejected
-				self.plugin.debugLog("decodeReceivedData: Got 'Message Rejected'")
-				pass
-			case _:
-				self.sendMsg(CAN)
-				indigo.plugin.errorLog(f"decodeReceivedData: Invalid or not supported message type. Type: '{messageNumber:02x}'")
+		entry = self.messageHandlers.get(messageNumber)
+		if entry is None:
+			self.sendMsg(CAN)
+			indigo.plugin.errorLog(f"decodeReceivedData: Invalid or not supported message type. Type: '{messageNumber:02x}'")
+		elif len(messageDict) < entry[0].length:
+			self.plugin.debugLog(f"decodeReceivedData: {entry[0].name} too short,  bytes: {len(messageDict)}: {messageDict.hex()}")
+		else:
+			self.panelCache.record(messageDict)				# only frames long enough to decode are cached
+			entry[1](messageDict)
 		if ackRequested:
 			self.sendMsg(ACK)
 		self.executeUpdateStatesList()
 	
-	def _interfaceConfigurationMessage(self, dataDict: list[str]) -> None:
+	def _interfaceConfigurationMessage(self, dataDict: bytes) -> None:
 		"""
 		Process *Interface Configuration Message*
 
-		:param dataDict: Hex-encoded list of message data.
+		:param dataDict: Received message frame (length, message number and data).
 		:return: None
 		"""
-		kmessageLength = dataDict[0]
-		kmessageNumber = dataDict[1]
-		kalarmMessage = self.messageAlarmDict(kmessageNumber)							# convert message number to message description
-		bmessageLength = int(kmessageLength, 16)										# convert message length from hex to dec
+		bmessageLength = dataDict[0]
+		kalarmMessage = messageDescriptions[dataDict[1]]					# convert message number to message description
+		messageType = messageSchema[0x01]
 		
 		panel = int(self.systemId)														# system panel type number for updating state values
-		messageStart = 6																# start pointer for valid message data (exclude message length and message number)
 				
 		# verified message being processed notice
 		if self.plugin.messageProcessInfo or self.plugin.debug:
 			indigo.server.log("processing message:         %s,  system model: %s,  length: %r" % (kalarmMessage, self.model, bmessageLength))
-
-		# convert hex to binary map
-		dmessageLength = bmessageLength - 5
-		binterfaceConfigurationMessageDict = self.convertByteDictToBinaryMap(messageStart, dmessageLength, dataDict)
 		
 		# convert hex to ascii
 		# Fixme:  Added "global"  Was this the intent?
 		global panelFirmware
-		panelFirmware = chr(int(dataDict[2], 16)) + chr(int(dataDict[3], 16)) + chr(int(dataDict[4], 16)) + chr(int(dataDict[5], 16))
+		panelFirmware = dataDict[2:6].decode("latin-1")
 
 		# verify message word value and binary mapping
-		self.plugin.debugLog("interfaceConfigurationMessage:        interface configuration message dictionary: %r" % dataDict)
-		self.plugin.debugLog("interfaceConfigurationMessage:        interface configuration message bit map dictionary: %r" % binterfaceConfigurationMessageDict)
+		self.plugin.debugLog("interfaceConfigurationMessage:        interface configuration message dictionary: %s" % dataDict.hex())
 				
-		# parameter byte definition lists
-		transitionMessageFlags1List = [
-			"partitionSnapshotMessage", "partitionStatusMessage", "zoneSnapshotMessage", "zoneStatusMessage",
-			"zreservedBit3TransitionMessageFlags1", "zreservedBit2TransitionMessageFlags1",
-			"interfaceConfigurationMessage", "zreservedBit0TransitionMessageFlags1"
-		]
-		transitionMessageFlags2List = [
-			"zreservedBit7TransitionMessageFlags2", "zreservedBit6TransitionMessageFlags2",
-			"zreservedBit5TransitionMessageFlags2", "zreservedBit4TransitionMessageFlags2", "keypadMessageReceived",
-			"logEventReceived", "receivedX10Message", "systemStatusMessage"
-		]
-		requestCommandFlags1List = [
-			"partitionSnapshotRequest", "partitionStatusRequest", "zoneSnapshotRequest", "zoneStatusRequest",
-			"zoneNameRequest", "zreservedBit2RequestCommandFlags1", "interfaceConfigurationRequest",
-			"zreservedBit0RequestCommandFlags1"
-		]
-		requestCommandFlags2List = [
-			"zreservedBit7RequestCommandFlags2", "zreservedBit6RequestCommandFlags2",
-			"zreservedBit5RequestCommandFlags2", "keypadTerminalModeRequest", "sendKeypadTextMessage",
-			"logEventRequest", "sendX10Message", "systemStatusRequest"
-		]
-		requestCommandFlags3List = [
-			"setUserAuthorisationCommandWithoutPin", "setUserAuthorisationCommandWithPin",
-			"setUserCodeCommandWithoutPin", "setUserCodeCommandWithPin", "userInformationRequestWithoutPin",
-			"userInformationRequestWithPin", "programDataCommand", "programDataRequest"
-		]
-		requestCommandFlags4List = [
-			"zoneBypassToggle", "secondaryKeypadFunction", "primaryKeypadFunctionWithoutPin",
-			"primaryKeypadFunctionWithPin", "setClockCalenderCommand", "storeCommunicationEventCommand",
-			"zreservedBit1RequestCommandFlags4", "zreservedBit0RequestCommandFlags4"]
-		
 		# update Interface Configuration Status Plugin Preferences "Interface Configuration Message"
-		if binterfaceConfigurationMessageDict is not None:
-			self.plugin.pluginPrefs["firmware"] = panelFirmware
-			self.updateInterfaceConfigPluginPrefs(transitionMessageFlags1List, binterfaceConfigurationMessageDict[0])
-			self.updateInterfaceConfigPluginPrefs(transitionMessageFlags2List, binterfaceConfigurationMessageDict[1])
-			self.updateInterfaceConfigPluginPrefs(requestCommandFlags1List, binterfaceConfigurationMessageDict[2])
-			self.updateInterfaceConfigPluginPrefs(requestCommandFlags2List, binterfaceConfigurationMessageDict[3])
-			self.updateInterfaceConfigPluginPrefs(requestCommandFlags3List, binterfaceConfigurationMessageDict[4])
-			self.updateInterfaceConfigPluginPrefs(requestCommandFlags4List, binterfaceConfigurationMessageDict[5])
-			if self.plugin.messageProcessInfo or self.plugin.debug:
-				indigo.server.log("update interface configuration:        plugin preferences successfully updated with alarm panel interface configuration settings.")
-			
-			# copy "Transition Based Broadcast" message state values that are currently "enabled" to Indigo Log	
-			if not self.suspendInterfaceConfigMessageDisplay:
-				indigo.server.log("Caddx NetworX Security System:        System Model: %s        Firmware: %s " % (self.model, panelFirmware))
-				indigo.server.log("")
-				localPrefsCopy = self.plugin.pluginPrefs
-				indigo.server.log("Transition Based Broadcast messages currently enabled: ")
-				prefsInterfaceConfigList = [
-					"interfaceConfigurationMessage", "zoneStatusMessage", "zoneSnapshotMessage",
-					"partitionStatusMessage", "partitionSnapshotMessage",
-					"systemStatusMessage", "receivedX10Message", "logEventReceived", "keypadMessageReceived"
-				]
-				# Display enabled broadcast messages.
-				for item in prefsInterfaceConfigList:
-					var = localPrefsCopy[item]
-					if var == '1':
-						indigo.server.log(f"  - {item}")
-
-				# copy "Command / Request" message state values that are currently "enabled" to Indigo Log	
-				indigo.server.log("")
-				indigo.server.log("Command / Request messages currently enabled: ")
-				prefsInterfaceConfigList = [
-					"interfaceConfigurationRequest", "zoneNameRequest", "zoneStatusRequest", "zoneSnapshotRequest",
-					"partitionStatusRequest", "partitionSnapshotRequest", "systemStatusRequest", "sendX10Message",
-					"logEventRequest", "sendKeypadTextMessage", "keypadTerminalModeRequest", "programDataRequest",
-					"programDataCommand", "userInformationRequestWithPin",
-					"userInformationRequestWithoutPin", "setUserCodeCommandWithPin", "setUserCodeCommandWithoutPin",
-					"setUserAuthorisationCommandWithPin",
-					"setUserAuthorisationCommandWithoutPin", "storeCommunicationEventCommand",
-					"setClockCalenderCommand", "primaryKeypadFunctionWithPin",
-					"primaryKeypadFunctionWithoutPin", "secondaryKeypadFunction", "zoneBypassToggle"
-				]
-				# Display enabled commands.
-				for item in prefsInterfaceConfigList:
-					var = localPrefsCopy[item]
-					if var == '1':
-						indigo.server.log(f"  - {item}")
-				self.suspendInterfaceConfigMessageDisplay = True
-	
+		self.plugin.pluginPrefs["firmware"] = panelFirmware
+		self.updatePluginPrefs(messageType.decodePrefs(dataDict))
+		if self.plugin.messageProcessInfo or self.plugin.debug:
+			indigo.server.log("update interface configuration:        plugin preferences successfully updated with alarm panel interface configuration settings.")
+		
+		# copy "Transition Based Broadcast" message state values that are currently "enabled" to Indigo Log	
+		if not self.suspendInterfaceConfigMessageDisplay:
+			indigo.server.log("Caddx NetworX Security System:        System Model: %s        Firmware: %s " % (self.model, panelFirmware))
+			indigo.server.log("")
+			localPrefsCopy = self.plugin.pluginPrefs
+			indigo.server.log("Transition Based Broadcast messages currently enabled: ")
+			prefsInterfaceConfigList = [
+				"interfaceConfigurationMessage", "zoneStatusMessage", "zoneSnapshotMessage",
+				"partitionStatusMessage", "partitionSnapshotMessage",
+				"systemStatusMessage", "receivedX10Message", "logEventReceived", "keypadMessageReceived"
+			]
+			# Display enabled broadcast messages.
+			for item in prefsInterfaceConfigList:
+				var = localPrefsCopy[item]
+				if var == '1':
+					indigo.server.log(f"  - {item}")
+
+			# copy "Command / Request" message state values that are currently "enabled" to Indigo Log	
+			indigo.server.log("")
+			indigo.server.log("Command / Request messages currently enabled: ")
+			prefsInterfaceConfigList = [
+				"interfaceConfigurationRequest", "zoneNameRequest", "zoneStatusRequest", "zoneSnapshotRequest",
+				"partitionStatusRequest", "partitionSnapshotRequest", "systemStatusRequest", "sendX10Message",
+				"logEventRequest", "sendKeypadTextMessage", "keypadTerminalModeRequest", "programDataRequest",
+				"programDataCommand", "userInformationRequestWithPin",
+				"userInformationRequestWithoutPin", "setUserCodeCommandWithPin", "setUserCodeCommandWithoutPin",
+				"setUserAuthorisationCommandWithPin",
+				"setUserAuthorisationCommandWithoutPin", "storeCommunicationEventCommand",
+				"setClockCalenderCommand", "primaryKeypadFunctionWithPin",
+				"primaryKeypadFunctionWithoutPin", "secondaryKeypadFunction", "zoneBypassToggle"
+			]
+			# Display enabled commands.
+			for item in prefsInterfaceConfigList:
+				var = localPrefsCopy[item]
+				if var == '1':
+					indigo.server.log(f"  - {item}")
+			self.suspendInterfaceConfigMessageDisplay = True
+
 		# update Interface Configuration Status States from received "Interface Configuration Message"
-		if binterfaceConfigurationMessageDict is not None:
-			# Fixme:  The panel device was never created, so following if will always fail.  Intent?
-			if panel in self.panelList.keys():
-				dev = self.panelList[panel]
-				self.addToStatesUpdateList(dev, key=u'firmware', value=panelFirmware)
-				self.updateInterfaceConfigStates(dev, transitionMessageFlags1List, binterfaceConfigurationMessageDict[0])
-				self.updateInterfaceConfigStates(dev, transitionMessageFlags2List, binterfaceConfigurationMessageDict[1])
-				self.updateInterfaceConfigStates(dev, requestCommandFlags1List, binterfaceConfigurationMessageDict[2])
-				self.updateInterfaceConfigStates(dev, requestCommandFlags2List, binterfaceConfigurationMessageDict[3])
-				self.updateInterfaceConfigStates(dev, requestCommandFlags3List, binterfaceConfigurationMessageDict[4])
-				self.updateInterfaceConfigStates(dev, requestCommandFlags4List, binterfaceConfigurationMessageDict[5])
-				if self.plugin.messageProcessInfo or self.plugin.debug:
-					indigo.server.log("update interface configuration:        device state records successfully updated with alarm panel interface configuration settings.")
-			else:
-				self.plugin.debugLog("update interface configuration:        no record in indigo database (device - state) for alarm panel interface configuration settings.")
+		# Fixme:  The panel device was never created, so following if will always fail.  Intent?
+		if panel in self.panelList.keys():
+			dev = self.panelList[panel]
+			self.addToStatesUpdateList(dev, key=u'firmware', value=panelFirmware)
+			self.updateDeviceStates(dev, messageType.decodeStates(dataDict))
+			if self.plugin.messageProcessInfo or self.plugin.debug:
+				indigo.server.log("update interface configuration:        device state records successfully updated with alarm panel interface configuration settings.")
 		else:
-			self.plugin.debugLog("update interface configuration:        no device state records in message dictionary for alarm panel interface configuration settings update.")
+			self.plugin.debugLog("update interface configuration:        no record in indigo database (device - state) for alarm panel interface configuration settings.")
 					
-	def _zoneNameMessage(self, dataDict: list[str]) -> None:
+	def _zoneNameMessage(self, dataDict: bytes) -> None:
 		"""
 		Process *Zone Name Message*
 
-		:param dataDict: Hex-encoded list of message data.
+		:param dataDict: Received message frame (length, message number and data).
 		:return: None
 		"""
-		kmessageNumber = dataDict[1]
-		kalarmMessage = self.messageAlarmDict(kmessageNumber)							# convert message number to message description
-
-		kzoneNumber = dataDict[2]
-		dzoneNumber = int(kzoneNumber, 16) + 1 	# zone numbers start from 0 ie.(0 = zone 1)
-
-		kzoneNameHex = ""
-		for i in range(3, 19):
-			kzoneNameHex += dataDict[i]
-		displayName = bytes.fromhex(kzoneNameHex).decode("utf-8").rstrip()
+		kalarmMessage = messageDescriptions[dataDict[1]]					# convert message number to message description
 
-		# kzoneName1 = dataDict[3] + dataDict[4] + dataDict[5] + dataDict[6] + dataDict[7] + dataDict[8] + dataDict[9] + dataDict[10]
-		# kzoneName2 = dataDict[11] + dataDict[12] + dataDict[13] + dataDict[14] + dataDict[15] + dataDict[16] + dataDict[17] + dataDict[18]
-		# kzoneName = kzoneName1 + kzoneName2
+		dzoneNumber = dataDict[2] + 1 	# zone numbers start from 0 ie.(0 = zone 1)
+		displayName = self.decodeZoneName(dataDict)
 
 		# verified message being processed notice
 		if self.plugin.messageProcessInfo or self.plugin.debug:
 			indigo.server.log(f"processing message:         {kalarmMessage},  zone: {dzoneNumber},  {displayName}")
 		
 		# verify message word value and binary mapping
-		self.plugin.debugLog("zoneNameMessage:        zone name message dictionary: %r" % dataDict)
+		self.plugin.debugLog("zoneNameMessage:        zone name message dictionary: %s" % dataDict.hex())
 		
 		# update Device Zone configuration UI displayName
 		zone = dzoneNumber
@@ -1566,142 +3403,77 @@ class Caddx(object):
 				self.plugin.debugLog("update zone name:        no record in indigo database (device) for zone: %r" % dzoneNumber)
 		else:
 			self.plugin.debugLog("update zone name:        no device configuration ui records in message dictionary for zone name message update.")
-		self.keypadDisplayName = displayName
 
-	def _zoneStatusMessage(self, dataDict: list[str]) -> None:
+	@staticmethod
+	def decodeZoneName(dataDict: bytes) -> str:
+		"""
+		Keypad display name from a *Zone Name Message*.
+
+		:param dataDict: Received message frame (length, message number and data).
+		:return: The name, without trailing blanks.
+		"""
+		return dataDict[3:19].decode("utf-8").rstrip()
+
+	def _zoneStatusMessage(self, dataDict: bytes) -> None:
 		"""
 		Process *Zone Status Message*
 
-		:param dataDict: Hex-encoded list of message data.
+		:param dataDict: Received message frame (length, message number and data).
 		:return: None
 		"""
-		kmessageLength = dataDict[0]
-		kmessageNumber = dataDict[1]
-		kalarmMessage = self.messageAlarmDict(kmessageNumber)							# convert message number to message description
-		bmessageLength = int(kmessageLength, 16)							# convert message length from hex to dec
+		bmessageLength = dataDict[0]
+		kalarmMessage = messageDescriptions[dataDict[1]]					# convert message number to message description
 				
-		kzoneNumber = dataDict[2]
-		dzoneNumber = int(kzoneNumber, 16)									# convert zone number from hex to dec for indexing
-		dzoneNumber = dzoneNumber + 1											# zone numbers start from 0 ie.(0 = zone 1)
-
-		messageStart = 3
+		dzoneNumber = dataDict[2] + 1										# zone numbers start from 0 ie.(0 = zone 1)
+		messageType = messageSchema[0x04]
 		
 		# verified message being processed notice
 		if self.plugin.messageProcessInfo or self.plugin.debug:
 			indigo.server.log("processing message:         %s,  zone: %r,  length: %r" % (kalarmMessage, dzoneNumber, bmessageLength))
 		
-		# convert hex to binary map
-		dmessageLength = int(kmessageLength, 16) - 2	 # valid data message length
-		bzoneStatusMessageDict = self.convertByteDictToBinaryMap(messageStart, dmessageLength, dataDict)
-		
-		# verify message word value and binary mapping
-		self.plugin.debugLog("zoneStatusMessage:        zone status message dictionary: %r" % dataDict)
-		self.plugin.debugLog("zoneStatusMessage:        zone status message bit map dictionary: %r" % bzoneStatusMessageDict)
-				
-		# parameter byte definition lists
-		partitionMaskList = [
-			"partition8", "partition7", "partition6", "partition5", "partition4", "partition3",
-			"partition2", "partition1"
-		]
-		typeFlag1List = [
-			"localOnly", "interior", "entryExitDelay2", "entryExitDelay1", "follower", "keySwitch",
-			"in24HourFormat", "fire"
-		]
-		typeFlag2List = [
-			"entryGuard", "forceArmable", "groupBypassable", "bypassableType", "chime", "steadySiren",
-			"yelpingSiren", "keypadSounder"
-		]
-		typeFlag3List = [
-			"listenIn", "restorable", "swingerShutdown", "dialerDelay", "crossZone", "troubleZoneType",
-			"doubleEOLTamper", "fastLoopResponse"
-		]
-		# noinspection PyUnusedLocal
-		conditionFlag1List = [
-			"zreservedbit7ConditionFlag1", "lossOfSupervision", "lowBattery", "inhibitedForceArmed",
-			"bypassedCondition", "troubleCondition", "tampered", "faultedOrDelayedTrip"
-		]
-		# noinspection PyUnusedLocal
-		conditionFlag2List = [
-			"zreservedbit7ConditionFlag2", "zreservedbit6ConditionFlag2",
-			"zreservedbit5ConditionFlag2", "zreservedbit4ConditionFlag2",
-			"zreservedbit3ConditionFlag2", "zreservedbit2ConditionFlag2", "bypassMemory",
-			"alarmMemoryCondition"
-		]
+		# verify message word value
+		self.plugin.debugLog("zoneStatusMessage:        zone status message dictionary: %s" % dataDict.hex())
 			
 		# update Device Zone Configuration UI values from received "Zone Status Message"
 		zone = dzoneNumber
-		if bzoneStatusMessageDict is not None:
-			if zone in self.zoneList.keys():
-				dev = self.zoneList[zone]
-				localPropsCopy = dev.pluginProps
-				self.updateZoneStatusConfigUi(localPropsCopy, partitionMaskList, bzoneStatusMessageDict[0])
-				self.updateZoneStatusConfigUi(localPropsCopy, typeFlag1List, bzoneStatusMessageDict[1])
-				self.updateZoneStatusConfigUi(localPropsCopy, typeFlag2List, bzoneStatusMessageDict[2])
-				self.updateZoneStatusConfigUi(localPropsCopy, typeFlag3List, bzoneStatusMessageDict[3])
-
-				# determine configured panel 'zone group type'
-				zoneGroupTypeDict = bzoneStatusMessageDict[1] + bzoneStatusMessageDict[2] + bzoneStatusMessageDict[3]
-				zoneGroupType = self.zoneGroupType(zoneGroupTypeDict)
-				zoneGroupDescription = self.zoneGroupDescription(zoneGroupTypeDict)
-				self.plugin.debugLog("zoneStatusMessage:        zone group type %r,  %s  dictionary: %r" % (zoneGroupType, zoneGroupDescription, zoneGroupTypeDict))
-
-				# update zone configuration UI for zone group type and description
-				localPropsCopy["zoneGroupType"] = zoneGroupType	
-				localPropsCopy["zoneGroupDescription"] = zoneGroupDescription			
-				dev.replacePluginPropsOnServer(localPropsCopy)
-
-				# update zone device state for zone group type and description
-				# self.addToStatesUpdateList(dev,key="zoneGroupType", value=zoneGroupType)
-				# self.addToStatesUpdateList(dev,key="zoneGroupDescription", value=zoneGroupDescription)
-				if self.plugin.messageProcessInfo or self.plugin.debug:
-					indigo.server.log("update zone status:        device configuration ui records successfully updated with zone status message:  zone: %r" % dzoneNumber)	
-			else:
-				self.plugin.debugLog("update zone status:        no record in indigo database (device - config ui) for zone; %r." % dzoneNumber)
+		if zone in self.zoneList.keys():
+			dev = self.zoneList[zone]
+			self.updateZoneConfigUi(dev, dataDict)
+			if self.plugin.messageProcessInfo or self.plugin.debug:
+				indigo.server.log("update zone status:        device configuration ui records successfully updated with zone status message:  zone: %r" % dzoneNumber)	
 		else:
-			self.plugin.debugLog("update zone status:        no device configuration ui records in message dictionary for zone status message update.")
+			self.plugin.debugLog("update zone status:        no record in indigo database (device - config ui) for zone; %r." % dzoneNumber)
 			
 		# update Zone Device states values from received "Zone Status Message"
-		if bzoneStatusMessageDict is not None:
-			if zone in self.zoneList.keys():
-				dev = self.zoneList[zone]
-				self.updateZoneStatus(dev, bzoneStatusMessageDict[4], bzoneStatusMessageDict[5])
-				if self.plugin.messageProcessInfo or self.plugin.debug:
-					indigo.server.log("update zone status:        device state records successfully updated with zone status message:  zone: %r" % dzoneNumber)
-			else:
-				self.plugin.debugLog("update zone status:        no record in indigo database (device - state) for zone: %r." % dzoneNumber)
+		if zone in self.zoneList.keys():
+			dev = self.zoneList[zone]
+			self.updateDeviceStates(dev, messageType.decodeStates(dataDict))
+			if self.plugin.messageProcessInfo or self.plugin.debug:
+				indigo.server.log("update zone status:        device state records successfully updated with zone status message:  zone: %r" % dzoneNumber)
 		else:
-			self.plugin.debugLog("update zone status:        no device state records in message dictionary for zone status message update.")	
+			self.plugin.debugLog("update zone status:        no record in indigo database (device - state) for zone: %r." % dzoneNumber)
 			
 		# update zoneState value condition from received "Zone Status Message"
-		if bzoneStatusMessageDict is not None:
-			zoneCondition = bzoneStatusMessageDict[4]
-			if zone in self.zoneList.keys():
-				dev = self.zoneList[zone]
-				self.updateZoneStateCondition(dev, zone, zoneCondition)
-				if self.plugin.messageProcessInfo or self.plugin.debug:
-					indigo.server.log("update zone status:        zoneState device state value successfully updated with zone status message:  zone: %r" % dzoneNumber)
-			else:
-				self.plugin.debugLog("update zone status:        no record in indigo database (device - state 'zoneState') for zone: %r." % dzoneNumber)
+		zoneCondition = dataDict[7]
+		if zone in self.zoneList.keys():
+			dev = self.zoneList[zone]
+			self.updateZoneStateCondition(dev, zone, zoneCondition)
+			if self.plugin.messageProcessInfo or self.plugin.debug:
+				indigo.server.log("update zone status:        zoneState device state value successfully updated with zone status message:  zone: %r" % dzoneNumber)
 		else:
-			self.plugin.debugLog("update zone status:        no device state records in message dictionary for zone status message update.")
+			self.plugin.debugLog("update zone status:        no record in indigo database (device - state 'zoneState') for zone: %r." % dzoneNumber)
 	
-	def _zoneSnapshotMessage(self, dataDict: list[str]) -> None:
+	def _zoneSnapshotMessage(self, dataDict: bytes) -> None:
 		"""
 		Process *Zones Snapshot Message*
 
-		:param dataDict: Hex-encoded list of message data.
+		:param dataDict: Received message frame (length, message number and data).
 		:return: None
 		"""
-		kmessageLength = dataDict[0]
-		kmessageNumber = dataDict[1]
-		kalarmMessage = self.messageAlarmDict(kmessageNumber)							# convert message number to message description
-		# noinspection PyUnusedLocal
-		bmessageLength = int(kmessageLength, 16)							# convert message length from hex to dec
+		kalarmMessage = messageDescriptions[dataDict[1]]					# convert message number to message description
 			
-		kzoneOffset = dataDict[2]
-		bzoneOffset = int(kzoneOffset, 16)									# convert hex to binary map for zone blocks 1 - 16 + (offset, 16)
+		bzoneOffset = dataDict[2]											# zone block offset: zones 1 - 16 + (offset * 16)
 		
-		messageStart = 3
 		zoneGroups = {
 			0: "zone 1 - zone 16", 1: "zone 17 - zone 32", 2: "zone 33 - zone 48", 3: "zone 49 - zone 64",
 			4: "zone 65 - zone 80", 5: "zone 81 - zone 96",
@@ -1713,166 +3485,103 @@ class Caddx(object):
 		if self.plugin.messageProcessInfo or self.plugin.debug:
 			indigo.server.log("processing message:         %s,  block address: %r,  group: %s" % (kalarmMessage, bzoneOffset, zoneGroups[bzoneOffset]))		
 		
-		# convert hex to binary map
-		dmessageLength = int(kmessageLength, 16) - 2				# valid data message length
-		bzoneSnapshotMessageDict = self.convertByteDictToBinaryMap(messageStart, dmessageLength, dataDict)
-		
-		# verify binary mapping 
-		self.plugin.debugLog("zoneSnapshotMessage:        zone snapshot message dictionary: %r" % dataDict)
-		self.plugin.debugLog("zoneSnapshotMessage:        zone snapshot message bit map dictionary: %r" % bzoneSnapshotMessageDict)
+		# snapshot bytes, one nibble per zone
+		bzoneSnapshotMessageDict = dataDict[3:11]
 		
-		# parameter byte definition lists
-		# noinspection PyUnusedLocal
-		zoneSnapshotList = ["alarmMemory", "trouble", "bypass", "triggered"]
+		# verify message word value
+		self.plugin.debugLog("zoneSnapshotMessage:        zone snapshot message dictionary: %s" % dataDict.hex())
 		
-		# update Zone Device states values from received "Zone Snapshot Message"
-		"""
-		dzoneOffset = int(kzoneOffset, 16)									# convert zone offset number from hex to dec for indexing
-		if bzoneSnapshotMessageDict != None:
-				self.updateZoneSnapshot(bzoneOffset, zoneSnapshotList, bzoneSnapshotMessageDict)
-				if self.plugin.messageProcessInfo or self.plugin.debug:
-					indigo.server.log("update zone snapshot:        device state records successfully updated with zone snapshot message: %s" % zoneGroups[bzoneOffset])
-			else:
-				self.plugin.debugLog("update zone snapshot:        no device state records in message dictionary for zone snapshot message update.")
-		"""
+		# update Zone Device states values from received "Zone Snapshot Message", and request the full zone status of
+		# any zone whose snapshot changed since the last one
+		changedZones = self.updateZoneSnapshot(bzoneOffset, bzoneSnapshotMessageDict)
+		for zone in changedZones:
+			self.sendMsgToQueue(cmdZoneStatusRequest + f"{zone - 1:02x}")
+		if self.plugin.messageProcessInfo or self.plugin.debug:
+			indigo.server.log("update zone snapshot:        device state records successfully updated with zone snapshot message: %s,  changed zones: %r" % (zoneGroups[bzoneOffset], changedZones))
 		
 	########################################
 	# process "Partition Status Message"
 	########################################
 	
-	def _partitionStatusMessage(self, dataDict: list[str]) -> None:
+	def _partitionStatusMessage(self, dataDict: bytes) -> None:
 		"""
 		Process *Partition Status Message*
 
-		:param dataDict: Hex-encoded list of message data.
+		:param dataDict: Received message frame (length, message number and data).
 		:return: None
 		"""
-		kmessageLength = dataDict[0]
-		kmessageNumber = dataDict[1]
-		kalarmMessage = self.messageAlarmDict(kmessageNumber)		# convert message number to message description
-		messageLength = int(kmessageLength, 16)						# convert message length from hex to dec
-
-		# convert zone number from hex to dec for indexing. partition numbers start from 0 i.e.(0 = partition 1)
-		partition = int(dataDict[2], 16) + 1
-		partitionLastUserNumber = int(dataDict[7], 16)
+		messageLength = dataDict[0]
+		kalarmMessage = messageDescriptions[dataDict[1]]	# convert message number to message description
+		messageType = messageSchema[0x06]
 
-		# start pointer for valid message data (exclude message length and message number)
-		messageStart = 3
+		# partition numbers start from 0 i.e.(0 = partition 1)
+		partition = dataDict[2] + 1
 		
 		# verified message being processed notice	
 		if self.plugin.messageProcessInfo or self.plugin.debug:
 			indigo.server.log("processing message:          %s,  partition: %r,  length: %r" % (kalarmMessage, partition, messageLength))
 
-		# convert hex to binary map
-		dmessageLength = int(kmessageLength, 16) - 2					# valid data message length
-		bpartitionStatusMessageDict = self.convertByteDictToBinaryMap(messageStart, dmessageLength, dataDict)
-		
-		# verify message word value and binary mapping 
-		self.plugin.debugLog("partitionStatusMessage:        partition status message dictionary: %r" % dataDict)
-		self.plugin.debugLog("partitionStatusMessage:        partition status message bit map dictionary: %r" % bpartitionStatusMessageDict)
-		
-		# parameter byte definition lists
-		partitionConditionFlag1List = [
-			"instant", "armedSystem", "reservedbit5ConditionFlag1", "tLMFaultMemory", "firePulsingBuzzer", "fire",
-			"fireTrouble", "bypassCodeRequired"
-		]
-		partitionConditionFlag2List = [
-			"cancelPending", "codeEntered", "cancelCommandEntered", "tamper", "alarmMemoryCondition", "steadySirenOn",
-			"sirenOn", "previousAlarm"
-		]
-		partitionConditionFlag3List = [
-			"exit2", "exit1", "delayExpirationWarning", "entry", "chimeModeOn", "entryGuardStayMode",
-			"silentExitEnabled", "reservedbit0ConditionFlag3"
-		]
-		partitionConditionFlag4List = [
-			"sensorLostSupervision", "sensorLowBattery", "autoHomeInhibited", "exitErrorTriggered",
-			"reservedbit3ConditionFlag4", "recentClosingBeingTimed", "crossTiming", "ledExtinguish"
-		]
-		partitionConditionFlag5List = [
-			"toneOnActivationTone", "errorBeepTripleBeep", "chimeOnSounding", "validPinAccepted", "readyToForceArm",
-			"readyToArm", "forceArmTriggeredByAutoArm", "zoneBypass"
-		]
-		partitionConditionFlag6List = [
-			"delayTripInProgressCommonZone", "keySwitchArmed", "cancelReportIsInTheStack", "alarmSendUsingPhoneNumber3",
-			"alarmSendUsingPhoneNumber2", "alarmSendUsingPhoneNumber1", "openPeriod", "entry1"
-		]
+		# verify message word value
+		self.plugin.debugLog("partitionStatusMessage:        partition status message dictionary: %s" % dataDict.hex())
 		
 		# update Partition Device states values from received "Partition Status Message"
-		if bpartitionStatusMessageDict is not None:
-			if partition in self.partitionList.keys():
-				dev = self.partitionList[partition]
-				self.addToStatesUpdateList(dev, key="lastUserNumber", value=partitionLastUserNumber)
-				self.updatePartitionStatus(dev, partitionConditionFlag1List, bpartitionStatusMessageDict[0])
-				self.updatePartitionStatus(dev, partitionConditionFlag2List, bpartitionStatusMessageDict[1])
-				self.updatePartitionStatus(dev, partitionConditionFlag3List, bpartitionStatusMessageDict[2])
-				self.updatePartitionStatus(dev, partitionConditionFlag4List, bpartitionStatusMessageDict[3])
-				self.updatePartitionStatus(dev, partitionConditionFlag5List, bpartitionStatusMessageDict[5])
-				self.updatePartitionStatus(dev, partitionConditionFlag6List, bpartitionStatusMessageDict[6])
+		if partition in self.partitionList.keys():
+			dev = self.partitionList[partition]
+			self.updateDeviceStates(dev, messageType.decodeStates(dataDict))
+			if self.plugin.messageProcessInfo or self.plugin.debug:
+				indigo.server.log("update partition status:        device state records successfully updated with partition status message:  partition: %r" % partition)
+			
+			# update Keypad Device states values from received "Partition Status Message"
+			systemArmed = dev.states['armedSystem']
+			systemReady = dev.states['readyToArm']
+			fireAlert = dev.states['fire']
+			acPowerOn = dev.states['reservedbit5ConditionFlag1']
+			stayArmed = dev.states['entryGuardStayMode']
+			chimeMode = dev.states['chimeModeOn']
+			exitDelay = dev.states['exit1']
+			bypassZone = dev.states['zoneBypass']
+			# cancel = dev.states['cancelPending']
+			keypad = int(dev.pluginProps['associatedKeypad'])
+			if keypad in self.keypadList.keys():
+				dev = self.keypadList[keypad]
+				self.addToStatesUpdateList(dev, key='armedSystem', value=systemArmed)
+				self.addToStatesUpdateList(dev, key='readyToArm', value=systemReady)
+				self.addToStatesUpdateList(dev, key='fire', value=fireAlert)
+				self.addToStatesUpdateList(dev, key='acPowerOn', value=acPowerOn)
+				self.addToStatesUpdateList(dev, key='stayMode', value=stayArmed)
+				self.addToStatesUpdateList(dev, key='chimeMode', value=chimeMode)
+				self.addToStatesUpdateList(dev, key='exitDelay', value=exitDelay)
+				self.addToStatesUpdateList(dev, key='zoneBypass', value=bypassZone)
+				# self.addToStatesUpdateList(dev,key='cancelPending', value=cancelPending)
 				if self.plugin.messageProcessInfo or self.plugin.debug:
-					indigo.server.log("update partition status:        device state records successfully updated with partition status message:  partition: %r" % partition)
-				
-				# update Keypad Device states values from received "Partition Status Message"
-				systemArmed = dev.states['armedSystem']
-				systemReady = dev.states['readyToArm']
-				fireAlert = dev.states['fire']
-				acPowerOn = dev.states['reservedbit5ConditionFlag1']
-				stayArmed = dev.states['entryGuardStayMode']
-				chimeMode = dev.states['chimeModeOn']
-				exitDelay = dev.states['exit1']
-				bypassZone = dev.states['zoneBypass']
-				# cancel = dev.states['cancelPending']
-				keypad = int(dev.pluginProps['associatedKeypad'])
-				if keypad in self.keypadList.keys():
-					dev = self.keypadList[keypad]
-					self.addToStatesUpdateList(dev, key='armedSystem', value=systemArmed)
-					self.addToStatesUpdateList(dev, key='readyToArm', value=systemReady)
-					self.addToStatesUpdateList(dev, key='fire', value=fireAlert)
-					self.addToStatesUpdateList(dev, key='acPowerOn', value=acPowerOn)
-					self.addToStatesUpdateList(dev, key='stayMode', value=stayArmed)
-					self.addToStatesUpdateList(dev, key='chimeMode', value=chimeMode)
-					self.addToStatesUpdateList(dev, key='exitDelay', value=exitDelay)
-					self.addToStatesUpdateList(dev, key='zoneBypass', value=bypassZone)
-					# self.addToStatesUpdateList(dev,key='cancelPending', value=cancelPending)
-					if self.plugin.messageProcessInfo or self.plugin.debug:
-						indigo.server.log("update keypad status:        device state records successfully updated with partition status message:  keypad: %r" % keypad)
-			else:
-				self.plugin.debugLog("update partition status:        no record in indigo database (device - state) for partition: %r." % partition)
+					indigo.server.log("update keypad status:        device state records successfully updated with partition status message:  keypad: %r" % keypad)
 		else:
-			self.plugin.debugLog("update partition status:        no device state records in message dictionary for partition status message update.")
+			self.plugin.debugLog("update partition status:        no record in indigo database (device - state) for partition: %r." % partition)
 
-	def _partitionSnapshotMessage(self, dataDict: list[str]) -> None:
+	def _partitionSnapshotMessage(self, dataDict: bytes) -> None:
 		"""
 		Process *Partition Snapshot Message*
 
-		:param dataDict: Hex-encoded list of message data.
+		:param dataDict: Received message frame (length, message number and data).
 		:return: None
 		"""
-		kmessageLength = dataDict[0]
-		kmessageNumber = dataDict[1]
-		kalarmMessage = self.messageAlarmDict(kmessageNumber)							# convert message number to message description
-		bmessageLength = int(kmessageLength, 16)										# convert message length from hex to dec
+		bmessageLength = dataDict[0]
+		kalarmMessage = messageDescriptions[dataDict[1]]					# convert message number to message description
 						
-		messageStart = 2																# start pointer for valid message data (exclude message length and message number)
-		
 		# verified message being processed notice
 		if self.plugin.messageProcessInfo or self.plugin.debug:
 			indigo.server.log("processing message:         %s,  partition 1 - 8,  length: %r" % (kalarmMessage, bmessageLength))
 
-		# convert hex to binary map for partitions 1 - 8
-		dmessageLength = int(kmessageLength, 16) - 1				# valid data message length
-		bpartitionSnapshotMessageDict = self.convertByteDictToBinaryMap(messageStart, dmessageLength, dataDict)
-		
-		# verify binary mapping 
-		self.plugin.debugLog("partitionSnapshotMessage:        snapshot partition message dictionary: %r" % dataDict)
-		self.plugin.debugLog("partitionSnapshotMessage:        snapshot partition message bit map dictionary: %r" % bpartitionSnapshotMessageDict)
+		# snapshot bytes for partitions 1 - 8
+		bpartitionSnapshotMessageDict = dataDict[2:10]
 		
-		# parameter byte definition lists
-		partitionSnapshotList = ["partitionPreviousAlarm", "anyExitDelay", "anyEntryDelay", "chimeMode", "stayArm", "exitArm", "securityReady", "validPartition"]
+		# verify message word value
+		self.plugin.debugLog("partitionSnapshotMessage:        snapshot partition message dictionary: %s" % dataDict.hex())
 		
 		# update Device Partition Configuration UI values from received "Partition Snapshot Message"
 		"""
 		if bpartitionSnapshotMessageDict != None:
-			self.updatePartitionSnapshotConfigUi(partitionSnapshotList, bpartitionSnapshotMessageDict)
+			self.updatePartitionSnapshotConfigUi(partitionSnapshotBits, bpartitionSnapshotMessageDict)
 			if self.plugin.messageProcessInfo or self.plugin.debug:
 				indigo.server.log("update partition snapshot . device configuration ui records  successfully updated for partition snapshot message: partition: all active partitions: ")
 		else:
@@ -1880,156 +3589,60 @@ class Caddx(object):
 		"""
 							
 		# update Device Partition State values from received "Partition Snapshot Message"
-		if bpartitionSnapshotMessageDict is not None:
-			self.updatePartitionSnapshot(partitionSnapshotList, bpartitionSnapshotMessageDict)
-			if self.plugin.messageProcessInfo or self.plugin.debug:
-				indigo.server.log("update partition snapshot:        device state records successfully updated with partition snapshot message: all active partitions: ")
-		else:
-			self.plugin.debugLog("update partition snapshot:        no device state records in message dictionary for partition snapshot message update.")
+		self.updatePartitionSnapshot(bpartitionSnapshotMessageDict)
+		if self.plugin.messageProcessInfo or self.plugin.debug:
+			indigo.server.log("update partition snapshot:        device state records successfully updated with partition snapshot message: all active partitions: ")
 			
 		# Update Alarm Display from received "Partition Snapshot Message"
-		if bpartitionSnapshotMessageDict is not None:
-			self.updateAlarmDisplay(partitionSnapshotList, bpartitionSnapshotMessageDict)
+		self.updateAlarmDisplay(bpartitionSnapshotMessageDict)
 	
-	def _systemStatusMessage(self, dataDict: list[str]) -> None:
+	def _systemStatusMessage(self, dataDict: bytes) -> None:
 		"""
 		Process *System Status Message*
 
-		:param dataDict: Hex-encoded list of message data.
+		:param dataDict: Received message frame (length, message number and data).
 		:return: None
 		"""
-		kmessageLength = dataDict[0]
-		kmessageNumber = dataDict[1]
-		ksystemNumber = dataDict[2]
-		kalarmMessage = self.messageAlarmDict(kmessageNumber)							# convert message number to message description
-		bmessageLength = int(kmessageLength, 16)							# convert message length from hex to dec
-		systemPanelId = int(ksystemNumber, 16)						# convert system number from hex to dec
-		
-		model = {"0": 'None', "1": 'NX-4', "2": 'NX-6', "3": 'NX-8', "4": 'NX-8e', "10": 'NX-6v2', "12": 'NX-8v2'}
-
-		systemPanelIdS = str(systemPanelId)
-		if systemPanelIdS in model:
-			self.model = model[systemPanelIdS]
-		else:
-			self.model = "Other"
-
-		kpanelByte12 = dataDict[12]
-		bpanelByte12 = int(kpanelByte12, 16)								# convert communicator stack pointer length from hex to dec
+		bmessageLength = dataDict[0]
+		kalarmMessage = messageDescriptions[dataDict[1]]					# convert message number to message description
+		messageType = messageSchema[0x08]
+		self.model = panelModels.get(dataDict[2], "Other")
 		
 		system = int(self.systemId)														# system panel type number for updating state values
-		messageStart = 3																# start pointer for valid message data (exclude message length and message number)
 		
 		# verified message being processed notice
 		if self.plugin.messageProcessInfo or self.plugin.debug:
 			indigo.server.log("processing message:         %s,  system model: %s,  length: %r" % (kalarmMessage, self.model, bmessageLength))
 			
-		# convert hex to binary map
-		dmessageLength = int(kmessageLength, 16) - 2					# valid data message length
-		bsystemStatusMessageDict = self.convertByteDictToBinaryMap(messageStart, dmessageLength, dataDict)
-
-		# verify message word value and binary mapping
-		self.plugin.debugLog("systemStatusMessage:        system status message dictionary: %r" % dataDict)
-		self.plugin.debugLog("systemStatusMessage:        system status message bit map dictionary: %r" % bsystemStatusMessageDict)
-		
-		# parameter byte definition lists
-		panelByte03List = [
-			"twoWayLockout", "listenInActive", "usingBackupPhone", "dialerDelayInProgress", "downloadInProgress",
-			"initialHandshakeReceived", "offHook", "lineSeizure"
-		]
-		panelByte04List = [
-			"acFail", "lowBattery", "sirenTamper", "boxTamper", "fuseFault", "failToCommunicate", "phoneFault",
-			"groundFault"
-		]
-		panelByte05List = [
-			"zreservedbit7PanelByte5", "expanderBellFault", "auxiliaryCommChannelFailure", "expanderAuxOverCurrent",
-			"expanderLossOffSupervision", "expanderLowBattery", "expanderACFailure", "expanderBoxTamper"
-		]
-		panelByte06List = [
-			"busDeviceRequestedSniffMode", "busDeviceHasLineSeized", "globalSteadySiren", "globalSirenOn",
-			"globalPulsingBuzzer", "pinRequiredForLocalDownload", "programmingTokenInUse", "enable6DigitPin"
-		]
-		panelByte07List = [
-			"timingHighVoltageBatteryCharge", "linePowerDetected50Hz", "smokePowerReset",
-			"fireAlarmVerificationBeingTimed", "groundFaultMemory", "lowBatteryMemory", "acPowerOn",
-			"dynamicBatteryTest"
-		]
-		panelByte08List = [
-			"timingACancelWindow", "controlShutdownMode", "testFixtureMode", "enrollRequested", "lossOfSystemTime",
-			"walkTestMode", "powerUpDelayInProgress", "communicationSinceLastAutoTest"
-		]
-		panelByte09List = [
-			"callBackInProgress", "zreservedbit6PanelByte9", "zreservedbit5PanelByte9", "zreservedbit4PanelByte9",
-			"zreservedbit3PanelByte9", "zreservedbit2PanelByte9", "zreservedbit1PanelByte9", "zreservedbit0PanelByte9"
-		]
-		panelByte10List = [
-			"listenInTrigger", "listenInRequested", "lastReadWasOffHook", "sniffing", "phoneLineMonitorEnabled",
-			"housePhoneOffHook", "voltagePresentInterruptActive", "phoneLineFaulted"
-		]
-		panelByte11List = [
-			"validPartition8", "validPartition7", "validPartition6", "validPartition5", "validPartition4",
-			"validPartition3", "validPartition2", "validPartition1"
-		]
-		# noinspection PyUnusedLocal
-		panelByte12List = ["communicatorStackPointer"]
+		# verify message word value
+		self.plugin.debugLog("systemStatusMessage:        system status message dictionary: %s" % dataDict.hex())
 		
 		# update System Status Message Plugin Preferences "System Status Message"
-		if bsystemStatusMessageDict is not None:
-			self.plugin.pluginPrefs["communicatorStackPointer"] = bpanelByte12
-			self.updateSystemStatusPluginPrefs(panelByte03List, bsystemStatusMessageDict[0])
-			self.updateSystemStatusPluginPrefs(panelByte04List, bsystemStatusMessageDict[1])
-			self.updateSystemStatusPluginPrefs(panelByte05List, bsystemStatusMessageDict[2])
-			self.updateSystemStatusPluginPrefs(panelByte06List, bsystemStatusMessageDict[3])
-			self.updateSystemStatusPluginPrefs(panelByte07List, bsystemStatusMessageDict[4])
-			self.updateSystemStatusPluginPrefs(panelByte08List, bsystemStatusMessageDict[5])
-			self.updateSystemStatusPluginPrefs(panelByte09List, bsystemStatusMessageDict[6])
-			self.updateSystemStatusPluginPrefs(panelByte10List, bsystemStatusMessageDict[7])
-			self.updateSystemStatusPluginPrefs(panelByte11List, bsystemStatusMessageDict[8])
-			if self.plugin.messageProcessInfo or self.plugin.debug:
-				indigo.server.log("update system status:        plugin preferences  successfully updated with alarm panel system status message information.")
+		self.updatePluginPrefs(messageType.decodePrefs(dataDict))
+		if self.plugin.messageProcessInfo or self.plugin.debug:
+			indigo.server.log("update system status:        plugin preferences  successfully updated with alarm panel system status message information.")
 		
 		# update System Status States from received "System Status Message"
-		if bsystemStatusMessageDict is not None:
-			if system in self.systemStatusList.keys():
-				dev = self.systemStatusList[system]
-				self.addToStatesUpdateList(dev, key=u'systemNumber', value=systemPanelId)
-				self.addToStatesUpdateList(dev, key=u'model', value=self.model)
-				self.addToStatesUpdateList(dev, key=u'communicatorStackPointer', value=bpanelByte12)
-				self.updateSystemStatus(dev, panelByte03List, bsystemStatusMessageDict[0])
-				self.updateSystemStatus(dev, panelByte04List, bsystemStatusMessageDict[1])
-				self.updateSystemStatus(dev, panelByte05List, bsystemStatusMessageDict[2])
-				self.updateSystemStatus(dev, panelByte06List, bsystemStatusMessageDict[3])
-				self.updateSystemStatus(dev, panelByte07List, bsystemStatusMessageDict[4])
-				self.updateSystemStatus(dev, panelByte08List, bsystemStatusMessageDict[5])
-				self.updateSystemStatus(dev, panelByte09List, bsystemStatusMessageDict[6])
-				self.updateSystemStatus(dev, panelByte10List, bsystemStatusMessageDict[7])
-				self.updateSystemStatus(dev, panelByte11List, bsystemStatusMessageDict[8])
-				if self.plugin.messageProcessInfo or self.plugin.debug:
-					indigo.server.log("update system status:        device state records  successfully updated with alarm panel system status message information.")
-			else:
-				self.plugin.debugLog("update system status:        no record in indigo database (device - state) for alarm panel system status message information.")
+		if system in self.systemStatusList.keys():
+			dev = self.systemStatusList[system]
+			self.updateDeviceStates(dev, messageType.decodeStates(dataDict))
+			if self.plugin.messageProcessInfo or self.plugin.debug:
+				indigo.server.log("update system status:        device state records  successfully updated with alarm panel system status message information.")
 		else:
-			self.plugin.debugLog("update system status:        no device state records in message dictionary for alarm panel system status message information update.")
+			self.plugin.debugLog("update system status:        no record in indigo database (device - state) for alarm panel system status message information.")
 	
-	def _x10MessageReceived(self, dataDict: list[str]) -> None:
+	def _x10MessageReceived(self, dataDict: bytes) -> None:
 		"""
 		Process *X10 Messages Received*.   Implementation incomplete.  No not use.
 
-		:param dataDict: Hex-encoded list of message data.
+		:param dataDict: Received message frame (length, message number and data).
 		:return: None
 		"""
 		# noinspection PyUnusedLocal
-		kmessageLength = dataDict[0]
-		kmessageNumber = dataDict[1]
-		khouseCode = dataDict[2]
-		kunitCode = dataDict[3]
-		kx10FunctionCode = dataDict[4]
-		# noinspection PyUnusedLocal
-		kalarmMessage = self.messageAlarmDict(kmessageNumber)
-		
-		# convert hex to binary map
-		bhouseCode = int(khouseCode, 16)
-		bunitCode = int(kunitCode, 16)
-		bx10FunctionCode = int(kx10FunctionCode, 16)
+		kalarmMessage = messageDescriptions[dataDict[1]]
+		bhouseCode = dataDict[2]
+		bunitCode = dataDict[3]
+		bx10FunctionCode = dataDict[4]
 		
 		# verify binary mapping 
 		self.plugin.debugLog("x10MessageReceived:        decode X-10 house code: %r" % bhouseCode)
@@ -2040,25 +3653,21 @@ class Caddx(object):
 		# noinspection PyUnusedLocal
 		x10FunctionCodeDict = {"\x68": "allLightsOff", "\x58": "bright", "\x48": "dim", "\x38": "off", "\x28": "on", "\x18": "allLightsOn", "\x08": "allUnitsOff"}
 
-	def _logEventMessage(self, dataDict: list[str]) -> None:
+	def _logEventMessage(self, dataDict: bytes) -> None:
 		"""
 		Process *Log Event Message*
 
-		:param dataDict: Hex-encoded list of message data.
+		:param dataDict: Received message frame (length, message number and data).
 		:return: None
 		"""
-		# noinspection PyUnusedLocal
-		kmessageLength = dataDict[0]
-		kmessageNumber = dataDict[1]
-		kalarmMessage = self.messageAlarmDict(kmessageNumber)
+		kalarmMessage = messageDescriptions[dataDict[1]]
 						
-		# convert hex to ascii map
-		deventNum = int(dataDict[2], 16)								# specific sequence event number
+		deventNum = dataDict[2]											# specific sequence event number
 		# noinspection PyUnusedLocal
-		dtotalLogSize = int(dataDict[3], 16)							# total size of the event log queue
-		deventType = int(dataDict[4], 16)								# event type number to translated to event scription
-		dzoneUserDevice = int(dataDict[5], 16) + 1						# event effects zone (0 = zone 1), user (0 = user 1) or device reference
-		dpartitionNumber = int(dataDict[6], 16) + 1   					# partition numbers start from 0 i.e.(0 = partition 1)
+		dtotalLogSize = dataDict[3]										# total size of the event log queue
+		deventType = dataDict[4]										# event type number to translated to event scription
+		dzoneUserDevice = dataDict[5] + 1								# event effects zone (0 = zone 1), user (0 = user 1) or device reference
+		dpartitionNumber = dataDict[6] + 1   							# partition numbers start from 0 i.e.(0 = partition 1)
 	
 		timeStamp = time.asctime(time.localtime(time.time()))
 		deventNumber = f"{deventNum:03}"
@@ -2072,10 +3681,8 @@ class Caddx(object):
 		timeLogEvent = self.timestamp()
 	
 		if deventType <= 127:
-			# look up dictionary event number for description, byte 5 and byte 6 values
-			eventDescription = self.messageLogEventDict(deventType)
-			eventZoneUserDeviceValid = self.messageLogByte5Dict(deventType)
-			eventPartitionNumberValid = self.messageLogByte6Dict(deventType)
+			# look up catalog event number for description, byte 5 and byte 6 values
+			eventDescription, eventZoneUserDeviceValid, eventPartitionNumberValid = logEventTypes[deventType]
 		
 			# conditional log event format statements
 			if eventZoneUserDeviceValid == "zone" and eventPartitionNumberValid:
@@ -2101,29 +3708,29 @@ class Caddx(object):
 		# for special conditional log events not defined in the dictionary			
 		else:
 			if deventType == 138:
-				eventDeviceDescription = self.messageLogDeviceAddressDict(dzoneUserDevice - 1)
+				eventDeviceDescription = logEventDevices[dzoneUserDevice - 1]
 				# noinspection PyUnusedLocal
 				logEventMessagePrint = "log event %s:      Loss of Supervision (wireless): %s,  zone: %s,  partition: %s  ** %s" % (
 					deventNumber, eventDeviceDescription, (dzoneUserDevice - 1), dpartitionNumber, timeLogEvent)
 			if deventType == 139:
-				eventDeviceDescription = self.messageLogDeviceAddressDict(dzoneUserDevice - 1)
+				eventDeviceDescription = logEventDevices[dzoneUserDevice - 1]
 				# noinspection PyUnusedLocal
 				logEventMessagePrint = "log event %s:      Loss of Supervision RESTORED (wireless): %s,  zone: %s,  partition: %s  ** %s" % (
 					deventNumber, eventDeviceDescription, (dzoneUserDevice - 1), dpartitionNumber, timeLogEvent)
 			if deventType == 168:
-				eventDeviceDescription = self.messageLogDeviceAddressDict(dzoneUserDevice - 1)
+				eventDeviceDescription = logEventDevices[dzoneUserDevice - 1]
 				logEventMessagePrint = "log event %s:      system DISARMED: %s,  address: %s,  partition: %s  ** %s" % (
 					deventNumber, eventDeviceDescription, (dzoneUserDevice - 1), dpartitionNumber, timeLogEvent)
 				if self.plugin.enableSpeakPrompts:
 					indigo.server.speak(sayDisarmed)
 			elif deventType == 169:
-				eventDeviceDescription = self.messageLogDeviceAddressDict(dzoneUserDevice - 1)
+				eventDeviceDescription = logEventDevices[dzoneUserDevice - 1]
 				logEventMessagePrint = "log event %s:      system ARMED: %s,  address: %s,  partition: %s  ** %s" % (
 					deventNumber, eventDeviceDescription, (dzoneUserDevice - 1), dpartitionNumber, timeLogEvent)
 				if self.plugin.enableSpeakPrompts:
 					indigo.server.speak(sayArmed)
 			elif deventType == 173:
-				eventDeviceDescription = self.messageLogDeviceAddressDict(dzoneUserDevice - 1)
+				eventDeviceDescription = logEventDevices[dzoneUserDevice - 1]
 				logEventMessagePrint = "log event %s:      entering program mode: %s,  address: %s,  partition: %s  ** %s" % (
 					deventNumber, eventDeviceDescription, (dzoneUserDevice - 1), dpartitionNumber, timeLogEvent)
 				# update enter keypad program mode states in plugin preferences
@@ -2131,7 +3738,7 @@ class Caddx(object):
 				self.plugin.pluginPrefs["panelStatus"] = "Program Mode (enter)  ** %s " % self.timestamp()
 				self.updateVariable("panelStatus", f"Program Mode (enter)  ** {self.timestamp()}")
 			elif deventType == 174:
-				eventDeviceDescription = self.messageLogDeviceAddressDict(dzoneUserDevice - 1)
+				eventDeviceDescription = logEventDevices[dzoneUserDevice - 1]
 				logEventMessagePrint = "log event %s:        exiting program mode: %s,  address: %s,  partition: %s  ** %s" % (
 					deventNumber, eventDeviceDescription, (dzoneUserDevice - 1), dpartitionNumber, timeLogEvent)
 				# update exit keypad program mode states in plugin preferences
@@ -2139,7 +3746,7 @@ class Caddx(object):
 				self.plugin.pluginPrefs["panelStatus"] = "Program Mode (exit)  ** %s " % self.timestamp()
 				self.updateVariable("panelStatus", f"Program Mode (exit)  ** {self.timestamp()}")
 			elif deventType == 245:
-				eventDeviceDescription = self.messageLogDeviceAddressDict(dzoneUserDevice - 1)
+				eventDeviceDescription = logEventDevices[dzoneUserDevice - 1]
 				logEventMessagePrint = "log event %s:      registering module: %s,  address: %s,  partition: %s  ** %s" % (
 					deventNumber, eventDeviceDescription, (dzoneUserDevice - 1), dpartitionNumber, timeLogEvent)
 			elif deventType == 247:
@@ -2149,7 +3756,7 @@ class Caddx(object):
 				logEventMessagePrint = "log event %s:      alarm event: (%s)  is out of range of event dictionary definitions byte 5: (device address %s),  byte 6: (partition %s)  ** %s" % (
 					deventNumber, deventType, (dzoneUserDevice - 1), dpartitionNumber, timeLogEvent)
 				if self.plugin.alarmEventInfo or self.plugin.debug:
-					indigo.server.log("log event %s:      data dictionary: %s " % (deventNumber, dataDict))
+					indigo.server.log("log event %s:      data dictionary: %s " % (deventNumber, dataDict.hex()))
 
 		# log event to indigo log history (last 25 entries)
 		logEventHistoryList = [
@@ -2174,71 +3781,51 @@ class Caddx(object):
 			indigo.server.log("%s" % logEventMessagePrint)
 			self.updateVariable("eventLogMessage", logEventMessagePrint)
 
-	def _keypadMessageReceived(self, dataDict: list[str]) -> None:
+	def _keypadMessageReceived(self, dataDict: bytes) -> None:
 		"""
 		Process *Keypad Message Received*
 
-		:param dataDict: Hex-encoded list of message data.
+		:param dataDict: Received message frame (length, message number and data).
 		:return: None
 		"""
 		# noinspection PyUnusedLocal
-		kmessageLength = dataDict[0]
-		kmessageNumber = dataDict[1]
-		# noinspection PyUnusedLocal
-		kalarmMessage = self.messageAlarmDict(kmessageNumber)
+		kalarmMessage = messageDescriptions[dataDict[1]]
 		
 		kkeypadAddress = dataDict[2]
 		kkeypadValue = dataDict[3]
 		
 		# parameter byte definition lists
 		keypadValueDict = {
-			"00": "0", "01": "1", "02": "2", "03": "3", "04": "4", "05": "5", "06": "6", "07": "7", "08": "8",
-			"09": "9", "0a": "Stay", "0b": "Chime",
-			"0c": "Exit", "0d": "Bypass", "0e": "Cancel", "0f": "Fire", "10": "Medical", "11": "Police", "12": "*",
-			"13": "#", "14": "up", "15": "down",
-			"80": "Auxiliary 1", "81": "Auxiliary 2"
+			0x00: "0", 0x01: "1", 0x02: "2", 0x03: "3", 0x04: "4", 0x05: "5", 0x06: "6", 0x07: "7", 0x08: "8",
+			0x09: "9", 0x0a: "Stay", 0x0b: "Chime",
+			0x0c: "Exit", 0x0d: "Bypass", 0x0e: "Cancel", 0x0f: "Fire", 0x10: "Medical", 0x11: "Police", 0x12: "*",
+			0x13: "#", 0x14: "up", 0x15: "down",
+			0x80: "Auxiliary 1", 0x81: "Auxiliary 2"
 		}
 		# verify binary mapping 
 		indigo.server.log("alarm keypad button pressed;  keypad: %r,  button: %s" % (kkeypadAddress, keypadValueDict[kkeypadValue]))
 		
-	def _programDataReply(self, dataDict: list[str]) -> None:
+	def _programDataReply(self, dataDict: bytes) -> None:
 		"""
 		Process *Program Data Reply*.   Incomplete implementation.  Do not use.
 
-		:param dataDict: Hex-encoded list of message data.
+		:param dataDict: Received message frame (length, message number and data).
 		:return: None
 		"""
 		# noinspection PyUnusedLocal
-		kmessageLength = dataDict[0]
-		kmessageNumber = dataDict[1]
-		kdeviceBusAddress = dataDict[2]
-		kupperLogicalLocationOffset = dataDict[3]
-		klowerLogicalLocationOffset = dataDict[4]
-		klocationLengthDataType = dataDict[5]
-		kdataTypeByte06 = dataDict[6]
-		kdataTypeByte07 = dataDict[7]
-		kdataTypeByte08 = dataDict[8]
-		kdataTypeByte09 = dataDict[9]
-		kdataTypeByte10 = dataDict[10]
-		kdataTypeByte11 = dataDict[11]
-		kdataTypeByte12 = dataDict[12]
-		kdataTypeByte13 = dataDict[13]		
-		# noinspection PyUnusedLocal
-		kalarmMessage = self.messageAlarmDict(kmessageNumber)
-		
-		# convert hex to binary map
-		bdeviceBusAddress = int(kdeviceBusAddress, 16)
-		bupperLogicalLocationOffset = int(kupperLogicalLocationOffset, 16)
-		blowerLogicalLocationOffset = int(klowerLogicalLocationOffset, 16)
-		blocationLengthDataType = int(klocationLengthDataType, 16)
-		bdataTypeByte06 = int(kdataTypeByte06, 16)
-		bdataTypeByte07 = int(kdataTypeByte07, 16)
-		bdataTypeByte08 = int(kdataTypeByte08, 16)
-		bdataTypeByte09 = int(kdataTypeByte09, 16)
-		bdataTypeByte10 = int(kdataTypeByte10, 16)
-		bdataTypeByte11 = int(kdataTypeByte11, 16)
-		bdataTypeByte12 = int(kdataTypeByte12, 16)
-		bdataTypeByte13 = int(kdataTypeByte13, 16)
+		kalarmMessage = messageDescriptions[dataDict[1]]
+		bdeviceBusAddress = dataDict[2]
+		bupperLogicalLocationOffset = dataDict[3]
+		blowerLogicalLocationOffset = dataDict[4]
+		blocationLengthDataType = dataDict[5]
+		bdataTypeByte06 = dataDict[6]
+		bdataTypeByte07 = dataDict[7]
+		bdataTypeByte08 = dataDict[8]
+		bdataTypeByte09 = dataDict[9]
+		bdataTypeByte10 = dataDict[10]
+		bdataTypeByte11 = dataDict[11]
+		bdataTypeByte12 = dataDict[12]
+		bdataTypeByte13 = dataDict[13]
 		
 		# verify binary mapping 
 		self.plugin.debugLog("programDataReply:        decode device bus address: %r" % bdeviceBusAddress)
@@ -2254,114 +3841,80 @@ class Caddx(object):
 		self.plugin.debugLog("programDataReply:        decode data type byte 12: %r" % bdataTypeByte12)
 		self.plugin.debugLog("programDataReply:        decode data type byte 13: %r" % bdataTypeByte13)
 	
-	def _userInformationReply(self, dataDict: list[str]) -> None:
+	def _userInformationReply(self, dataDict: bytes, withPin: bool = True) -> None:
 		"""
 		Process *User Information Reply*.
 
-		:param dataDict: Hex-encoded list of message data.
+		:param dataDict: Received message frame (length, message number and data).
+		:param withPin: Update the user's PIN.  False for frames from the panel configuration cache, which has none.
 		:return: None
 		"""
-		kmessageLength = dataDict[0]
-		kmessageNumber = dataDict[1]
-		kalarmMessage = self.messageAlarmDict(kmessageNumber)
-		bmessageLength = int(kmessageLength, 16)
+		bmessageLength = dataDict[0]
+		kalarmMessage = messageDescriptions[dataDict[1]]
 		
-		kuserNumber = dataDict[2]
-		buserNumber = int(kuserNumber, 16)
+		buserNumber = dataDict[2]
 		user = buserNumber
-		kpinDigit1and2 = dataDict[3]
-		kpinDigit3and4 = dataDict[4]
-		kpinDigit5and6 = dataDict[5]
+		# PIN digits are packed two per byte, low nibble first
+		kpinDigits = "".join(f"{pinByte & 0x0f:x}{pinByte >> 4:x}" for pinByte in dataDict[3:6])
 		
 		# format user code length correctly for 4 or 6 digits
 		codeLength = float(self.plugin.pluginPrefs['codeLength'])
 		if codeLength == 4:
-			kuserPin = kpinDigit1and2[1] + kpinDigit1and2[0] + kpinDigit3and4[1] + kpinDigit3and4[0]
+			kuserPin = kpinDigits[:4]
 		elif codeLength == 6:
-			kuserPin = kpinDigit1and2[1] + kpinDigit1and2[0] + kpinDigit3and4[1] + kpinDigit3and4[0] + kpinDigit5and6[1] + kpinDigit5and6[0]
+			kuserPin = kpinDigits
 		else:
 			kuserPin = None
 			indigo.server.log("Program error:  PIN code length defined incorrectly", level=logging.ERROR)
 			
-		messageStart = 3  # start pointer for valid message data (exclude message length and message number)
+		messageType = messageSchema[0x12]
 		
 		# verified message being processed notice
 		if self.plugin.messageProcessInfo or self.plugin.debug:
 			indigo.server.log("processing message:         %s,  user: %r,  length: %r" % (kalarmMessage, buserNumber, bmessageLength))
-			
-		# convert hex to binary map
-		dmessageLength = int(kmessageLength, 16) - 2					# valid data message length
-		buserInformationReplyDict = self.convertByteDictToBinaryMap(messageStart, dmessageLength, dataDict)
 		
-		# verify binary mapping 
+		# verify decoding
 		self.plugin.debugLog("userInformationReply:        decode user PIN: %r" % kuserPin)
-		self.plugin.debugLog("userInformationReply:        decode user information bit map dictionary: %r" % buserInformationReplyDict)
+		self.plugin.debugLog("userInformationReply:        decode user information dictionary: %s" % dataDict.hex())
 			
-		# parameter byte definition lists
-		authorityFlag1List = [
-			"mustBe0", "openCloseReportEnabled", "bypassEnabled", "armDisarmEnabled", "masterProgram",
-			"armOnlyDuringCloseWindow", "armOnly", "reservedbit0UserAuthorityFlag1"
-		]
-		# noinspection PyUnusedLocal
-		authorityFlag2List = [
-			"mustBe1", "openCloseReportEnabled", "bypassEnabled", "armDisarmEnabled", "output4Enable", "output3Enable",
-			"output2Enable", "output1Enable"
-		]
-		userAuthorisedPartitionList = [
-			"authorisedForPartition8", "authorisedForPartition7", "authorisedForPartition6", "authorisedForPartition5",
-			"authorisedForPartition4", "authorisedForPartition3", "authorisedForPartition2", "authorisedForPartition1"
-		]
 
 		# update Device User Information Configuration UI values from received "User Information Reply"
-		if buserInformationReplyDict is not None:
-			if user in self.userList.keys():
-				dev = self.userList[user]
-				localPropsCopy = dev.pluginProps
+		if user in self.userList.keys():
+			dev = self.userList[user]
+			localPropsCopy = dev.pluginProps
+			if withPin:
 				localPropsCopy["userPin"] = kuserPin
-				self.updateUserInformationStatusConfigUi(localPropsCopy, authorityFlag1List, buserInformationReplyDict[3])
-				self.updateUserInformationStatusConfigUi(localPropsCopy, userAuthorisedPartitionList, buserInformationReplyDict[4])
-				dev.replacePluginPropsOnServer(localPropsCopy)
-				if self.plugin.messageProcessInfo or self.plugin.debug:
-					indigo.server.log("update user information:        device configuration ui records successfully updated for user information:  user: %r" % buserNumber)
-			else:
-				self.plugin.debugLog("update user information:        no record in indigo database (device - config ui) for user: %r." % buserNumber)
+			localPropsCopy.update(messageType.decodeProps(dataDict))
+			dev.replacePluginPropsOnServer(localPropsCopy)
+			if self.plugin.messageProcessInfo or self.plugin.debug:
+				indigo.server.log("update user information:        device configuration ui records successfully updated for user information:  user: %r" % buserNumber)
 		else:
-			self.plugin.debugLog("update user information:        no device configuration ui records in message dictionary for user information update.")
+			self.plugin.debugLog("update user information:        no record in indigo database (device - config ui) for user: %r." % buserNumber)
 				
 		# Update User Information Device states values from received "User Information Reply"
-		if buserInformationReplyDict is not None:
-			if user in self.userList.keys():
-				dev = self.userList[user]
+		if user in self.userList.keys():
+			dev = self.userList[user]
+			if withPin:
 				self.addToStatesUpdateList(dev, key="userPin", value=kuserPin)
-				self.updateUserInformationStatus(dev, authorityFlag1List, buserInformationReplyDict[3])
-				self.updateUserInformationStatus(dev, userAuthorisedPartitionList, buserInformationReplyDict[4])
-				if self.plugin.messageProcessInfo or self.plugin.debug:
-					indigo.server.log("update user information:        device state records  successfully updated for user information:  user: %r" % buserNumber)
-			else:
-				self.plugin.debugLog("update user information:        no record in indigo database (device - state) for user: %r." % buserNumber)
+			self.updateDeviceStates(dev, messageType.decodeStates(dataDict))
+			if self.plugin.messageProcessInfo or self.plugin.debug:
+				indigo.server.log("update user information:        device state records  successfully updated for user information:  user: %r" % buserNumber)
 		else:
-			self.plugin.debugLog("update user information:        no device state records in message dictionary for user information update.")
+			self.plugin.debugLog("update user information:        no record in indigo database (device - state) for user: %r." % buserNumber)
 				
 	################################################################################
 	# Routines to Support Message Processing methods data conversion methods to support message processing
 	################################################################################
 	
-	def convertByteDictToBinaryMap(self, msgStart: int, msgLength: int, messageDict: list[str]) -> list[str] | None:
-		"""
-		Convert range of hex-encoded ASCII bytes to a list of binary-formatted ASCII bytes.
-		:param msgStart: The start of the sub-range to convert.
-		:param msgLength: The length of the sub-range to convert.
-		:param messageDict: Hex-encoded list of message data.
-		:return:
-		"""
-		if msgLength <= len(messageDict):
-			bitmapDict = []
-			for i in range(msgStart, (msgStart + msgLength)):
-				bitmapDict.append(f"{int(messageDict[i], 16):08b}")
-			return bitmapDict
-		else:
-			self.plugin.debugLog("convertByteDictToBinaryMap:        error in message format,  message byte length: %r,  nibbles: %r" % (msgLength, len(messageDict)))
-			return None
+	# update plugin preferences from decoded (name, value) pairs
+	def updatePluginPrefs(self, decoded):
+		for var, value in decoded:
+			self.plugin.pluginPrefs[var] = value
+
+	# update device states from decoded (name, value) pairs, as addToStatesUpdateList() does for one state
+	def updateDeviceStates(self, dev, decoded):
+		with self.devStateChangeLock:
+			self.devStateChangeList.setdefault(dev.id, {}).update(decoded)
 
 	################################################################################
 	# Routines for updating Indigo Database States methods update indigo plugin preferences, device configuration ui and device states	
@@ -2388,91 +3941,60 @@ class Caddx(object):
 			varName_ = indigo.variables[varName]
 			indigo.variable.updateValue(varName_, value=varValue)
 			
-	########################################
-	# update values from "Interface Configuration Message"
-	########################################
-	
-	# update Interface Configuration Plugin Preferences from received "Interface Configuration Message"
-	def updateInterfaceConfigPluginPrefs(self, varList, newByte):
-		if newByte is not None:
-			# Todo:  Test after refactor.
-			for i in range(8):
-				var = varList[i]
-				bit = newByte[i]
-				self.plugin.pluginPrefs[var] = bit
-
-	# update Interface Configuration Status States from received "Interface Configuration Message"
-	def updateInterfaceConfigStates(self, dev, varList, newByte):
-		if newByte is not None:
-			# Todo:  Test after refactor
-			for i in range(8):
-				var = varList[i]
-				bit = newByte[i]
-				self.addToStatesUpdateList(dev, key=var, value=bit)
-
 	########################################
 	# update values from "Zone Status Message"
 	########################################
 	
-	# update Zone Configuration UI pluginProps values from received "Zone Status Message" 
-	def updateZoneStatusConfigUi(self, localProps, varList, newByte):
-		# Todo: Test after refactor
-		for i in range(8):
-			var = varList[i]
-			bit = newByte[i]
-			localProps[var] = bit
-		return localProps
-		
-	# update Zone Device States from received "Zone Status Message" 	
-	def updateZoneStatus(self, dev, zoneConditionLevel1, zoneConditionLevel2):
-		self.addToStatesUpdateList(dev, key='faultedOrDelayedTrip', value=zoneConditionLevel1[7])
-		self.addToStatesUpdateList(dev, key='tampered', value=zoneConditionLevel1[6])
-		self.addToStatesUpdateList(dev, key='troubleCondition', value=zoneConditionLevel1[5])
-		self.addToStatesUpdateList(dev, key='bypassedCondition', value=zoneConditionLevel1[4])
-		self.addToStatesUpdateList(dev, key='inhibitedForceArmed', value=zoneConditionLevel1[3])
-		self.addToStatesUpdateList(dev, key='lowBattery', value=zoneConditionLevel1[2])
-		self.addToStatesUpdateList(dev, key='lossOfSupervision', value=zoneConditionLevel1[1])
-		self.addToStatesUpdateList(dev, key='alarmMemoryCondition', value=zoneConditionLevel2[7])
-		self.addToStatesUpdateList(dev, key='bypassMemory', value=zoneConditionLevel2[6])
+	# update Zone Configuration UI pluginProps values for the partition mask and type flag bytes of a "Zone Status
+	# Message", and the zone group type they define.  Returns False, without writing to the server, if unchanged.
+	def updateZoneConfigUi(self, dev, dataDict) -> bool:
+		newProps = dict(messageSchema[0x04].decodeProps(dataDict))
+
+		# determine configured panel 'zone group type'
+		zoneTypeMask = int.from_bytes(dataDict[4:7], "big")
+		zoneGroupType, zoneGroupDescription = zoneGroup(zoneTypeMask)
+		self.plugin.debugLog("zoneStatusMessage:        zone group type %r,  %s  type flags: %06x" % (zoneGroupType, zoneGroupDescription, zoneTypeMask))
+
+		# update zone configuration UI for zone group type and description
+		newProps["zoneGroupType"] = zoneGroupType
+		newProps["zoneGroupDescription"] = zoneGroupDescription
+		localPropsCopy = dev.pluginProps
+		if all(localPropsCopy.get(key) == value for key, value in newProps.items()):
+			return False
+		localPropsCopy.update(newProps)
+		dev.replacePluginPropsOnServer(localPropsCopy)
+		return True
 
 	########################################
 	# update values from "Zone Snapshot Message"
 	########################################
 	
-	# update Zone Device States Snapshot from received "Zone Snapshot Message"
-	def updateZoneSnapshot(self, offset, varList, newByte):
-		zoneAddress = (offset + 1)
-		if newByte is not None:
-			for key in newByte:
-				# self.plugin.debugLog("updateZoneSnapshot:        updating zone: %r." % zoneAddress)
-				if zoneAddress in self.zoneList.keys():
-					dev = self.zoneList[zoneAddress] 
-					nibble = newByte[key]
-					address = 3
-					bitLocation = 7
-					# Todo: Re-factor this loop
-					for i in range(0, 4):
-						# self.plugin.debugLog("updateZoneSnapshot:        updating device state,  zone: %r,  variable: %r,  value: %r,  address: %r" % (zoneAddress, var, bit, bitLocation))
-						self.addToStatesUpdateList(dev, key=varList[address], value=nibble[bitLocation])
-						address -= 1
-						bitLocation -= 1
-					zoneAddress += 1	
-	
+	# update Zone Device States Snapshot from received "Zone Snapshot Message".  Each byte holds two zones, the lower
+	# numbered zone in the low nibble.  Returns the zones with a device whose snapshot changed since the last one.
+	# The first snapshot of a zone also sets its zoneState, merged into the condition already known for the zone or, if
+	# there is none, until a Zone Status Message gives the full condition.
+	def updateZoneSnapshot(self, offset, newByte):
+		changedZones = []
+		zoneAddress = offset * 16 + 1
+		for byte in newByte:
+			for nibble in (byte & 0x0f, byte >> 4):
+				previousNibble = self.zoneSnapshotCache.get(zoneAddress)
+				self.zoneSnapshotCache[zoneAddress] = nibble
 				if zoneAddress in self.zoneList.keys():
-					dev = self.zoneList[zoneAddress] 
-					nibble = newByte[key]
-					address = 3
-					bitLocation = 3
-					# Todo: Re-factor this loop
-					for i in range(0, 4):
-						# self.plugin.debugLog("updateZoneSnapshot:        updating device state,  zone: %r,  variable: %r,  value: %r,  address: %r" % (zoneAddress, var, bit, bitLocation))
-						self.addToStatesUpdateList(dev, key=varList[address], value=nibble[bitLocation])
-						address -= 1
-						bitLocation -= 1
-					zoneAddress += 1	
-
-		else:
-			self.plugin.debugLog("updateZoneSnapshot(): -- no device state records in message dictionary for zone snapshot message update.")					
+					dev = self.zoneList[zoneAddress]
+					self.updateDeviceStates(dev, zoneSnapshotBits[nibble])
+					if previousNibble is None:
+						# to condition flags 1: bypassed (nibble bit 1) is bit 3, trouble bit 2 and faulted bit 0
+						zoneCondition = (nibble & 0x02) << 2 | nibble & 0x05
+						record = self.zoneStates.get(zoneAddress)
+						if record is not None:
+							# keep tampered, inhibited, low battery and supervision loss, which the snapshot does not carry
+							zoneCondition |= record.condition & ~0x0d
+						self.updateZoneStateCondition(dev, zoneAddress, zoneCondition)
+					elif previousNibble != nibble:
+						changedZones.append(zoneAddress)
+				zoneAddress += 1
+		return changedZones
 
 	########################################
 	# update values from "Partition Status Message"
@@ -2489,13 +4011,6 @@ class Caddx(object):
 			localProps[var] = bit
 		return localProps
 	"""
-		
-	# update Partition Status States from received "Partition Status Message" 
-	def updatePartitionStatus(self, dev, varList, newByte):
-		if newByte is not None:
-			# Todo: Verify refactored loop
-			for i in range(8):
-				self.addToStatesUpdateList(dev, key=varList[i], value=newByte[i])
 
 	########################################
 	# update values from "Partition Snapshot Message"
@@ -2528,531 +4043,11 @@ class Caddx(object):
 	"""
 
 	# update Partition Device States Snapshot from received "Partition Snapshot Message" 
-	def updatePartitionSnapshot(self, varList: list[str], bitList: list[str]):
-		partitionNumber = 1
-		for entry in bitList:
-			# self.plugin.debugLog("updatePartitionSnapshot:        updating partition: %r" % partitionNumber)
+	def updatePartitionSnapshot(self, newByte: bytes):
+		for partitionNumber, entry in enumerate(newByte, 1):
 			if partitionNumber in self.partitionList.keys():
-				dev = self.partitionList[partitionNumber] 
-				nibble = entry
-				address = 7
-				bitLocation = 0
-				# Todo: Re-factor this loop
-				# noinspection PyUnusedLocal
-				for i in nibble:
-					# self.plugin.debugLog("updatePartitionSnapshot:        updating device state variable: %r,  value: %r,  address: %r" % (var, bit, bitLocation))
-					self.addToStatesUpdateList(dev, key=varList[address], value=nibble[address])
-					address -= 1
-					bitLocation += 1
-			partitionNumber += 1
-
-	########################################
-	# update values from "System Status Message"
-	########################################
-	
-	def updateSystemStatusPluginPrefs(self, varList, newByte) -> None:
-		"""
-		Update System Status Information plugin preferences from received "System Status Message".
-
-		:param varList: TBD
-		:param newByte: TBD
-		:return: None
-		"""
-		if newByte is not None:
-			# Todo: Test after refactor
-			for i in range(8):
-				var = varList[i]
-				bit = newByte[i]
-				# self.plugin.debugLog("updateSystemStatusPluginPrefs:        updating plugin pref variable: %r,  value: %r,  address: %r" % (var, bit, bitLocation))
-				self.plugin.pluginPrefs[var] = bit
-					
-	# update System Status States from received "System Status Message"	
-	def updateSystemStatus(self, dev, varList, newByte):
-		if newByte is not None:
-			# Todo: Test after refactor
-			for i in range(8):
-				# self.plugin.debugLog("updateSystemStatus:        updating device state variable: %r,  value: %r,  address: %r" % (var, bit, bitLocation))
-				self.addToStatesUpdateList(dev, key=varList[i], value=newByte[i])
-
-	########################################
-	# update values from "User Information Reply"
-	########################################
-	
-	# update User Information Configuration UI pluginProps values from received "User Information Reply" 	
-	def updateUserInformationStatusConfigUi(self, localProps, varList, newByte):
-		# Todo: Test after refactor
-		for i in range(8):
-			var = varList[i]
-			bit = newByte[i]
-			# self.plugin.debugLog("updateUserInformationStatusConfigUi:        updating device config ui variable: %r,  value: %r,  address: %r" % (var, bit, bitLocation))
-			localProps[var] = bit
-
-		return localProps
-		
-	# update User Information Status States from received "User Information Reply" 	
-	def updateUserInformationStatus(self, dev, varList, newByte):
-		if newByte is not None:
-			# Todo: Test after refactor
-			for i in range(8):
-				# self.plugin.debugLog("updateUserInformationStatus:        updating device state variable: %r,  value: %r,  address: %r" % (var, bit, bitLocation))
-				self.addToStatesUpdateList(dev, key=varList[i], value=newByte[i])
-
-	################################################################################
-	# Routine for Alarm Panel Lookup Dictionaries method 	(state translation tables for message number and log events)
-	################################################################################
-	
-	########################################
-	# translate message number to message description
-	########################################
-	def messageAlarmDict(self, kmessageNumber: str) -> str:
-		alarmDict = {
-			"01": "Interface Configuration Message",
-			"03": "Zone Name Message",
-			"04": "Zone Status Message",
-			"05": "Zones Snapshot Message",
-			"06": "Partition Status Message",
-			"07": "Partitions Snapshot Message",
-			"08": "System Status Message",
-			"09": "X-10 Message Received",
-			"0a": "Log Event Message",
-			"0b": "Keypad Message Received",
-			"10": "Program Data Reply",
-			"12": "User Information Reply",
-			"1c": "Command / Request Failed",
-			"1d": "ACK",
-			"1e": "NAK",
-			"1f": "CAN",
-			"21": "Interface Configuration Request",
-			"23": "Zone Name Request",
-			"24": "Zone Status Request",
-			"25": "Zones Snapshot Request",
-			"26": "Partition Status Request",
-			"27": "Partitions Snapshot Request",
-			"28": "System Status Request",
-			"29": "Send X-10 Message",
-			"2a": "Log Event Request",
-			"2b": "Send Keypad Text Message",
-			"2c": "Keypad Terminal Mode Request",
-			"30": "Program Data Request",
-			"31": "Program Data Command",
-			"32": "User Information Request with Pin",
-			"33": "User Information Request without Pin",
-			"34": "Set User Code Command with Pin",
-			"35": "Set User Code Command without Pin",
-			"36": "Set User Authorisation Command with Pin",
-			"37": "Set User Authorisation Command without Pin",
-			"3a": "Store Communication Event Command",
-			"3b": "Set Date / Time Command",
-			"3c": "Primary Keypad Function with Pin",
-			"3d": "Primary Keypad Function without Pin",
-			"3e": "Secondary Keypad Function",
-			"3f": "Zone Bypass Toggle",
-			"81": "Interface Configuration Message",
-			"83": "Zone Name Message",
-			"84": "Zone Status Message",
-			"85": "Zones Snapshot Message",
-			"86": "Partition Status Message",
-			"87": "Partitions Snapshot Message",
-			"88": "System Status Message",
-			"89": "X-10 Message Received",
-			"8a": "Log Event Message",
-			"8b": "Keypad Message Received",
-			"a9": "Send X-10 Message",
-			"ab": "Send Keypad Text Message",
-			"ac": "Keypad Terminal Mode Request",
-			"b1": "Program Data Command",
-			"b4": "Set User Code Command with Pin",
-			"b5": "Set User Code Command without Pin",
-			"b6": "Set User Authorisation Command with Pin",
-			"b7": "Set User Authorisation Command without Pin",
-			"ba": "Store Communication Event Command",
-			"bb": "Set Clock / Calender Command",
-			"bc": "Primary Keypad Function with Pin",
-			"bd": "Primary Keypad Function without Pin",
-			"be": "Secondary Keypad Function",
-			"bf": "Zone Bypass Toggle",
-			"ff": "end of file"
-		}
-		if kmessageNumber in alarmDict:
-			message = alarmDict[kmessageNumber]
-		else:
-			message = "Program Error: No such message"
-		return message
-		
-	########################################
-	# translate log event type number to an event description
-	########################################
-	
-	def messageLogEventDict(self, keventType: int) -> str:
-		eventType = str(keventType)
-		eventDict = {
-			"0": "Alarm",
-			"1": "Alarm Restore",
-			"2": "Bypass",
-			"3": "Bypass Restore",
-			"4": "Tamper",
-			"5": "Tamper Restore",
-			"6": "Trouble",
-			"7": "Trouble Restore",
-			"8": "Tx Low Battery",
-			"9": "Tx Low Battery Restore",
-			"10": "Zone Lost",
-			"11": "Zone Lost Restore",
-			"12": "Not Used",
-			"13": "Not Used",
-			"14": "Not Used",
-			"15": "Not Used",
-			"16": "Not Used",
-			"17": "Special Expansion Event",
-			"18": "Duress",
-			"19": "Fire Alert (Manual)",
-			"20": "Medical Alert",
-			"21": "Not Used",
-			"22": "Police Panic",
-			"23": "Keypad Tamper",
-			"24": "Control Box Tamper",
-			"25": "Control Box Tamper Restore",
-			"26": "AC Failure",
-			"27": "AC Failure Restore",
-			"28": "Low Battery",
-			"29": "Low Battery Restore",
-			"30": "Over-current",
-			"31": "Over-current Restore",
-			"32": "Siren Tamper",
-			"33": "Siren Tamper Restore",
-			"34": "Telephone Fault",
-			"35": "Telephone Fault Restore",
-			"36": "Expander Trouble",
-			"37": "Expander Trouble Restore",
-			"38": "Fail To Communicate",
-			"39": "Log Full",
-			"40": "Opening",
-			"41": "Closing",
-			"42": "Exit Error",
-			"43": "Recent Closing",
-			"44": "Auto Test",
-			"45": "Start Program",
-			"46": "End Program",
-			"47": "Start Download",
-			"48": "End Download",
-			"49": "Cancel",
-			"50": "Ground Fault",
-			"51": "Ground Fault Restore",
-			"52": "Manual Test",
-			"53": "Closed with Zones Bypassed",
-			"54": "Start of Listen In",
-			"55": "Technician On Site",
-			"56": "Technician Left",
-			"57": "Control Power Up",
-			"119": "Not Used",
-			"120": "First To Open",
-			"121": "Last to Close",
-			"122": "Pin Entered with Bit 7 Set",
-			"123": "Begin Walk Test",
-			"124": "End Walk Test",
-			"125": "Re-Exit",
-			"126": "Output Trip",
-			"127": "Data Lost"
-		}
-		if eventType in eventDict:
-			event = eventDict[eventType]
-		else:
-			event = "Program Error: No such event"
-		self.plugin.debugLog(f"messageLogEventDict:       {eventType} - {event}")
-		return event
-									
-	########################################
-	# translate log byte 5 to zone, user or device
-	########################################
-	
-	def messageLogByte5Dict(self, keventType: int) -> str:
-		eventType = str(keventType)
-		byte5Dict = {
-			"0": "zone",
-			"1": "zone",
-			"2": "zone",
-			"3": "zone",
-			"4": "zone",
-			"5": "zone",
-			"6": "zone",
-			"7": "zone",
-			"8": "zone",
-			"9": "zone",
-			"10": "zone",
-			"11": "zone",
-			"12": "zone",
-			"13": "none",
-			"14": "none",
-			"15": "none",
-			"16": "none",
-			"17": "none",
-			"18": "none",
-			"19": "none",
-			"20": "none",
-			"21": "none",
-			"22": "none",
-			"23": "none",
-			"24": "device",
-			"25": "device",
-			"26": "device",
-			"27": "device",
-			"28": "device",
-			"29": "device",
-			"30": "device",
-			"31": "device",
-			"32": "device",
-			"33": "device",
-			"34": "none",
-			"35": "none",
-			"36": "device",
-			"37": "device",
-			"38": "none",
-			"39": "none",
-			"40": "user",
-			"41": "user",
-			"42": "user",
-			"43": "user",
-			"44": "none",
-			"45": "none",
-			"46": "none",
-			"47": "none",
-			"48": "none",
-			"49": "user",
-			"50": "none",
-			"51": "none",
-			"52": "none",
-			"53": "user",
-			"54": "none",
-			"55": "none",
-			"56": "none",
-			"57": "none",
-			"119": "none",
-			"120": "user",
-			"121": "user",
-			"122": "user",
-			"123": "none",
-			"124": "none",
-			"125": "none",
-			"126": "user",
-			"127": "none"
-		}
-		if eventType in byte5Dict:
-			byte5Value = byte5Dict[eventType]
-		else:
-			byte5Value = "Program Error: No such byte5Value"
-		self.plugin.debugLog("messageLogByte5Dict:        event number: \"%s\" " % eventType)
-		self.plugin.debugLog("messageLogByte5Dict:        zone,  device,  user: \"%s\" " % byte5Value)
-		return byte5Value
-		
-	########################################
-	# translate log byte 6 to reference partition or not	
-	########################################
-	
-	def messageLogByte6Dict(self, keventType: int) -> bool:
-		eventType = str(keventType)
-		byte6Dict = {
-			"0": True,
-			"1": True,
-			"2": True,
-			"3": True,
-			"4": True,
-			"5": True,
-			"6": True,
-			"7": True,
-			"8": True,
-			"9": True,
-			"10": True,
-			"11": True,
-			"12": True,
-			"13": False,
-			"14": False,
-			"15": False,
-			"16": False,
-			"17": False,
-			"18": True,
-			"19": True,
-			"20": True,
-			"21": False,
-			"22": True,
-			"23": True,
-			"24": False,
-			"25": False,
-			"26": False,
-			"27": False,
-			"28": False,
-			"29": False,
-			"30": False,
-			"31": False,
-			"32": False,
-			"33": False,
-			"34": False,
-			"35": False,
-			"36": False,
-			"37": False,
-			"38": False,
-			"39": False,
-			"40": True,
-			"41": True,
-			"42": True,
-			"43": True,
-			"44": False,
-			"45": False,
-			"46": False,
-			"47": False,
-			"48": False,
-			"49": True,
-			"50": False,
-			"51": False,
-			"52": False,
-			"53": True,
-			"54": False,
-			"55": False,
-			"56": False,
-			"57": False,
-			"119": False,
-			"120": True,
-			"121": True,
-			"122": True,
-			"123": False,
-			"124": False,
-			"125": True,
-			"126": False,
-			"127": False
-		}
-		if eventType in byte6Dict:
-			byte6Valid = byte6Dict[eventType]
-		else:
-			byte6Valid = False
-		self.plugin.debugLog("messageLogByte6Dict:        event number: \"%s\" " % eventType)
-		self.plugin.debugLog("messageLogByte6Dict:        partition valid: \"%s\" " % byte6Valid)		
-		return byte6Valid
-		
-	########################################
-	# translate log device address to a module description
-	########################################
-	
-	def messageLogDeviceAddressDict(self, kdeviceAddress: int) -> str:
-		deviceAddress = str(kdeviceAddress)
-		deviceDict = {
-			"0": "Security Panel",
-			"16": "Hardwired Expander NX-216E (start zone 17)",
-			"17": "Hardwired Expander NX-216E (start zone 25)",
-			"18": "Hardwired Expander NX-216E (start zone 33)",
-			"19": "Hardwired Expander NX-216E (start zone 41)",
-			"20": "Hardwired Expander NX-216E (start zone 49)",
-			"21": "Hardwired Expander NX-216E (start zone 57)",
-			"23": "Hardwired Expander NX-216E (start zone 09)",
-			"24": "Relay Expander NX-507E or Output Expander NX-508E (module 1)",
-			"25": "Relay Expander NX-507E or Output Expander NX-508E (module 2)",
-			"26": "Relay Expander NX-507E or Output Expander NX-508E (module 3)",
-			"27": "Relay Expander NX-507E or Output Expander NX-508E (module 4)",
-			"28": "Relay Expander NX-507E or Output Expander NX-508E (module 5)",
-			"29": "Relay Expander NX-507E or Output Expander NX-508E (module 6)",
-			"30": "Relay Expander NX-507E or Output Expander NX-508E (module 7)",
-			"31": "Relay Expander NX-507E or Output Expander NX-508E (module 8)",
-			"32": "Wireless Receiver NX-448E (module 6)",
-			"33": "Wireless Receiver NX-448E (module 7)",
-			"34": "Wireless Receiver NX-448E (module 8)",
-			"35": "Wireless Receiver NX-448E (module 1)",
-			"36": "Wireless Receiver NX-448E (module 2)",
-			"37": "Wireless Receiver NX-448E (module 3)",
-			"38": "Wireless Receiver NX-448E (module 4)",
-			"39": "Wireless Receiver NX-448E (module 5)",
-			"84": "Remote Power Supply NX-320E (module 1)",
-			"85": "Remote Power Supply NX-320E (module 2)",
-			"86": "Remote Power Supply NX-320E (module 3)",
-			"87": "Remote Power Supply NX-320E (module 4)",
-			"88": "Remote Power Supply NX-320E (module 5)",
-			"89": "Remote Power Supply NX-320E (module 6)",
-			"90": "Remote Power Supply NX-320E (module 7)",
-			"91": "Remote Power Supply NX-320E (module 8)",
-			"96": "Hardwired Expander NX-216E (start zone 65)",
-			"97": "Hardwired Expander NX-216E (start zone 73)",
-			"98": "Hardwired Expander NX-216E (start zone 81)",
-			"99": "Hardwired Expander NX-216E (start zone 89)",
-			"100": "Hardwired Expander NX-216E (start zone 97)",
-			"101": "Hardwired Expander NX-216E (start zone 105)",
-			"102": "Hardwired Expander NX-216E (start zone 113)",
-			"103": "Hardwired Expander NX-216E (start zone 121)",
-			"104": "Hardwired Expander NX-216E (start zone 129)",
-			"105": "Hardwired Expander NX-216E (start zone 137)",
-			"106": "Hardwired Expander NX-216E (start zone 145)",
-			"107": "Hardwired Expander NX-216E (start zone 153)",
-			"108": "Hardwired Expander NX-216E (start zone 161)",
-			"109": "Hardwired Expander NX-216E (start zone 169)",
-			"110": "Hardwired Expander NX-216E (start zone 177)",
-			"111": "Hardwired Expander NX-216E (start zone 185)",
-			"192": "Keypad (1)",
-			"193": "Keypad (1)",
-			"194": "Keypad (1)",
-			"195": "Keypad (1)",
-			"196": "Keypad (1)",
-			"197": "Keypad (1)",
-			"198": "Keypad (1)",
-			"199": "Keypad (1)",
-			"200": "Keypad (2)",
-			"201": "Keypad (2)",
-			"202": "Keypad (2)",
-			"203": "Keypad (2)",
-			"204": "Keypad (2)",
-			"205": "Keypad (2)",
-			"206": "Keypad (2)",
-			"207": "Keypad (2)",
-			"208": "Keypad (3)",
-			"209": "Keypad (3)",
-			"210": "Keypad (3)",
-			"211": "Keypad (3)",
-			"212": "Keypad (3)",
-			"213": "Keypad (3)",
-			"214": "Keypad (3)",
-			"215": "Keypad (3)",
-			"216": "Keypad (4)",
-			"217": "Keypad (4)",
-			"218": "Keypad (4)",
-			"219": "Keypad (4)",
-			"220": "Keypad (4)",
-			"221": "Keypad (4)",
-			"222": "Keypad (4)",
-			"223": "Keypad (4)",
-			"224": "Keypad (5)",
-			"225": "Keypad (5)",
-			"226": "Keypad (5)",
-			"227": "Keypad (5)",
-			"228": "Keypad (5)",
-			"229": "Keypad (5)",
-			"230": "Keypad (5)",
-			"231": "Keypad (5)",
-			"232": "Keypad (6)",
-			"233": "Keypad (6)",
-			"234": "Keypad (6)",
-			"235": "Keypad (6)",
-			"236": "Keypad (6)",
-			"237": "Keypad (6)",
-			"238": "Keypad (6)",
-			"239": "Keypad (6)",
-			"240": "Keypad (7)",
-			"241": "Keypad (7)",
-			"242": "Keypad (7)",
-			"243": "Keypad (7)",
-			"244": "Keypad (7)",
-			"245": "Keypad (7)",
-			"246": "Keypad (7)",
-			"247": "Keypad (7)",
-			"248": "Keypad (8)",
-			"249": "Keypad (8)",
-			"250": "Keypad (8)",
-			"251": "Keypad (8)",
-			"252": "Keypad (8)",
-			"253": "Keypad (8)",
-			"254": "Keypad (8)",
-			"255": "Keypad (8)"
-		}
-		if deviceAddress in deviceDict:
-			device = deviceDict[deviceAddress]
-		else:
-			device = "Program Error: No such device"
-		self.plugin.debugLog("messageLogEventDict:        device: \"%s\" " % device)
-		return device		
+				dev = self.partitionList[partitionNumber]
+				self.updateDeviceStates(dev, partitionSnapshotBits[entry])
 
 	def addToStatesUpdateList(self, dev, key: str, value: int | str) -> None:
 		"""
@@ -3064,46 +4059,68 @@ class Caddx(object):
 		:param value: The value to which the device state is set.
 		:return: None
 		"""
-		devId = str(dev.id)
-		local = copy.copy(self.devStateChangeList)
-		if devId not in local:
-			local[devId] = {}
-		local[devId][key] = value
-		self.devStateChangeList = copy.copy(local)
+		with self.devStateChangeLock:
+			self.devStateChangeList.setdefault(dev.id, {})[key] = value
 
 	def executeUpdateStatesList(self) -> None:
-		if not self.devStateChangeList:
-			return
-		local = copy.copy(self.devStateChangeList)
-		self.devStateChangeList = {}
-		changedOnly = {}
-
-		for devId in local:
-			if local[devId]:
-				dev = indigo.devices[int(devId)]
-				for key in local[devId]:
-					if key not in dev.states:
-						indigo.server.log(f"device: {dev.name}  does not have state: {key}, value: {local[devId][key]}")
-						continue
-					if local[devId][key] != dev.states[key]:
-						if devId not in changedOnly:
-							changedOnly[devId] = []
-						changedOnly[devId].append({"key": key, "value": local[devId][key]})
+		"""
+		Write the collected state changes to the Indigo server.
+		Values are compared against publishedStates, the plugin's copy of what the server holds, so only devices with a
+		real change are fetched from indigo.devices and updated.  A state missing from the copy makes it re-read the device
+		once.  Other states changed outside the plugin are not seen until the device is restarted.
 
+		:return: None
+		"""
+		# take the collected changes and leave an empty list for other threads to collect into.  The swap is made under
+		# publishLock too, so batches are written in the order they were collected: a later batch cannot overtake an
+		# earlier one and leave the older value on the server.
+		with self.publishLock:
+			with self.devStateChangeLock:
+				if not self.devStateChangeList:
+					return
+				local, self.devStateChangeList = self.devStateChangeList, {}
+
+			for devId, pending in local.items():
+				if not pending:
+					continue
+				dev = None
+				published = self.publishedStates.get(devId)
+				if published is None:
+					dev = indigo.devices[devId]
+					published = self.publishedStates[devId] = dict(dev.states)
+				changedOnly = []
+				zoneState = None
+				for key, value in pending.items():
+					if key not in published and dev is None:
+						dev = indigo.devices[devId]					# the copy may be stale; re-read the device once
+						published.update(dev.states)
+					if key not in published:
+						indigo.server.log(f"device: {dev.name}  does not have state: {key}, value: {value}")
+						continue
+					if value != published[key]:
+						changedOnly.append({"key": key, "value": value})
 						if key == "zoneState":
-							self.plugin.triggerEvent("zoneChanged")
-							if local[devId][key].find(u"normal") > -1:
-								dev.updateStateImageOnServer(indigo.kStateImageSel.SensorOn)
-								changedOnly[devId].append(
-									{"key": "lastNormal", "value": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")})
-							elif local[devId][key].find(u"triggered") > -1:
-								dev.updateStateImageOnServer(indigo.kStateImageSel.SensorTripped)
-								changedOnly[devId].append(
-									{"key": "lastTriggered", "value": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")})
-							else:
-								dev.updateStateImageOnServer(indigo.kStateImageSel.SensorOff)
-							changedOnly[devId].append({u"key": "zoneDisplay", "value": self.plugin.padDisplay(
-								local[devId][key]) + datetime.datetime.now().strftime("%m-%d %H:%M:%S")})
-
-				if devId in changedOnly and changedOnly[devId] != []:
-					dev.updateStatesOnServer(changedOnly[devId])
+							zoneState = value
+				if not changedOnly:
+					continue
+
+				if dev is None:
+					dev = indigo.devices[devId]
+				if zoneState is not None:
+					self.plugin.triggerEvent("zoneChanged")
+					if zoneState.find(u"normal") > -1:
+						dev.updateStateImageOnServer(indigo.kStateImageSel.SensorOn)
+						changedOnly.append(
+							{"key": "lastNormal", "value": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")})
+					elif zoneState.find(u"triggered") > -1:
+						dev.updateStateImageOnServer(indigo.kStateImageSel.SensorTripped)
+						changedOnly.append(
+							{"key": "lastTriggered", "value": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")})
+					else:
+						dev.updateStateImageOnServer(indigo.kStateImageSel.SensorOff)
+					changedOnly.append({u"key": "zoneDisplay", "value": self.plugin.padDisplay(
+						zoneState) + datetime.datetime.now().strftime("%m-%d %H:%M:%S")})
+
+				dev.updateStatesOnServer(changedOnly)
+				for change in changedOnly:
+					published[change["key"]] = change["value"]
@@ -11,9 +11,11 @@
 ################################################################################
 import time
 import datetime
+import threading
+import concurrent.futures
 
 import indigo
-from caddx import Caddx
+from caddx import Caddx, CaddxException, CaddxSyncTracker
 
 ################################################################################
 # Globals
@@ -32,10 +34,16 @@ class Plugin(indigo.PluginBase):
         else:
             indigo.server.log("Debug logging is disabled")
         self.devicePort = self.getSerialPortUrl(pluginPrefs, 'devicePort')
+        self.transportType = pluginPrefs.get("transportType", "serial")
+        self.bridgeHost = pluginPrefs.get("bridgeHost", "")
+        self.bridgePort = int(pluginPrefs.get("bridgePort", 2000))
+        self.socketKeepAlive = int(pluginPrefs.get("socketKeepAlive", 30))
         self.watchdogTimerPeriod = float(pluginPrefs.get("watchdogTimerPeriod", 0))
+        self.watchdogPollMode = pluginPrefs.get("watchdogPollMode", "zoneStatus")
+        self.resyncOnFrameError = pluginPrefs.get("resyncOnFrameError", True)
+        self.commLoopMode = pluginPrefs.get("commLoopMode", "poll")
         self.sleepBetweenIdlePoll = float(pluginPrefs.get("sleepBetweenIdlePoll", 0.01))
         self.sleepBetweenComm = float(pluginPrefs.get("sleepBetweenComm", 0.3))
-        self.sleepBetweenCreateZone = float(pluginPrefs.get("sleepBetweenCreateZone", 1.0))
         self.enableSpeakPrompts = pluginPrefs.get("enableSpeak", False)
         self.alarmEventInfo = pluginPrefs.get("showAlarmEventInfo", False)
         self.commandActInfo = pluginPrefs.get("showCommandActInfo", False)
@@ -143,6 +151,7 @@ class Plugin(indigo.PluginBase):
 
     def shutdown(self):
         self.debugLog("shutdown:        process called for caddx plugin ")
+        self.caddx.panelCache.save()
 
     ########################################
     # Device Start and Stop methods
@@ -179,10 +188,12 @@ class Plugin(indigo.PluginBase):
         self.debugLog("runConcurrentThread:        entering process")
         self.initDevs = False
 
-        if self.devicePort is None:
+        if (self.transportType == "socket" and not self.bridgeHost) or (self.transportType != "socket" and self.devicePort is None):
             indigo.server.log("The Caddx communication parameters are not yet configured. Please configure in the plugin configuration.")
             pass
         else:
+            cacheKey = self.caddx.panelCache.load()
+            threading.Thread(target=self.warmStart, args=(cacheKey,), name="caddxWarmStart", daemon=True).start()
             self.caddx.startComm()
         self.debugLog("runConcurrentThread:        exiting process")
 
@@ -198,7 +209,13 @@ class Plugin(indigo.PluginBase):
     def validatePrefsConfigUi(self, valuesDict):
         self.debugLog("validatePrefsConfigUi:        entering process")
         errorsDict = indigo.Dict()
-        self.validateSerialPortUi(valuesDict, errorsDict, "devicePort")
+        if valuesDict.get("transportType", "serial") == "socket":
+            if not valuesDict.get("bridgeHost", "").strip():
+                errorsDict['bridgeHost'] = "Enter the host name or address of the serial bridge"
+            if not valuesDict.get("bridgePort", "").isdigit() or not 0 < int(valuesDict["bridgePort"]) < 65536:
+                errorsDict['bridgePort'] = "Enter a TCP port number between 1 and 65535"
+        else:
+            self.validateSerialPortUi(valuesDict, errorsDict, "devicePort")
         if valuesDict.get("masterCode", "") == "1234":
             # User has not changed default Master Code. Show an error.
             errorsDict = indigo.Dict()
@@ -237,10 +254,17 @@ class Plugin(indigo.PluginBase):
         if not userCancelled:
             indigo.server.log("Plugin configuration preferences were updated, reloading preferences .....")
             self.devicePort = self.getSerialPortUrl(valuesDict, 'devicePort')
+            self.transportType = valuesDict.get("transportType", "serial")
+            self.bridgeHost = valuesDict.get("bridgeHost", "")
+            self.bridgePort = int(valuesDict.get("bridgePort", 2000))
+            self.socketKeepAlive = int(valuesDict.get("socketKeepAlive", 30))
             self.watchdogTimerPeriod = float(valuesDict.get("watchdogTimerPeriod", 0))
+            self.watchdogPollMode = valuesDict.get("watchdogPollMode", "zoneStatus")
+            self.resyncOnFrameError = valuesDict.get("resyncOnFrameError", True)
+            self.caddx.frameDecoder.resync = self.resyncOnFrameError
+            self.commLoopMode = valuesDict.get("commLoopMode", "poll")
             self.sleepBetweenIdlePoll = float(valuesDict.get("sleepBetweenIdlePoll", 0.01))
             self.sleepBetweenComm = float(valuesDict.get("sleepBetweenComm", 0.3))
-            self.sleepBetweenCreateZone = float(valuesDict.get("sleepBetweenCreateZone", 1.0))
             self.enableSpeakPrompts = valuesDict.get("enableSpeak", False)
             self.alarmEventInfo = valuesDict.get("showAlarmEventInfo", False)
             self.commandActInfo = valuesDict.get("showCommandActInfo", False)
@@ -252,19 +276,25 @@ class Plugin(indigo.PluginBase):
 
             indigo.server.log(". . Loading new plugin preferences ...")
             indigo.server.log("")
-            indigo.server.log(". .       Communication:             interface: %s," % self.devicePort)
+            indigo.server.log(". .       Communication:             transport: %s," % self.transportType)
+            indigo.server.log(". .                                  interface: %s," % self.devicePort)
+            indigo.server.log(". .                              serial bridge: %s:%s," % (self.bridgeHost, self.bridgePort))
+            indigo.server.log(". .                                 keep-alive: %s seconds," % self.socketKeepAlive)
             indigo.server.log(". .                                  baud rate: %s," % (valuesDict.get("serialBaudRate", None)))
             indigo.server.log(". .                                    timeout: %s seconds," % (valuesDict.get("serialTimeout", None)))
             indigo.server.log("")
-            indigo.server.log(". .    	  Plugin Timers:   sleep between polls: %s seconds," % (valuesDict.get("sleepBetweenIdlePoll", None)))
-            indigo.server.log(". .                     sleep between commands: %s seconds," % (valuesDict.get("sleepBetweenComm", None)))
-            indigo.server.log(". .                  sleep between create zone: %s seconds," % (valuesDict.get("sleepBetweenCreateZone", None)))
+            indigo.server.log(". .    	  Plugin Timers:    communication loop: %s," % (valuesDict.get("commLoopMode", None)))
+            indigo.server.log(". .                        sleep between polls: %s seconds," % (valuesDict.get("sleepBetweenIdlePoll", None)))
+            indigo.server.log(". .                    max spacing of commands: %s seconds," % (valuesDict.get("sleepBetweenComm", None)))
             indigo.server.log("")
             indigo.server.log(". .      Base Transport:           port status: %s," % (valuesDict.get("portStatus", None)))
             indigo.server.log(". .                               comm failure: %s," % (valuesDict.get("communicationFailure", None)))
             indigo.server.log(". .                          last failure time: %s," % (valuesDict.get("lastFailureTime", None)))
             indigo.server.log(". .                            watch dog timer: %s seconds," % (valuesDict.get("watchdogTimerPeriod", None)))
+            indigo.server.log(". .                        watch dog poll mode: %s," % (valuesDict.get("watchdogPollMode", None)))
             indigo.server.log(". .                       active communication: %s," % (valuesDict.get("activeCommunication", None)))
+            indigo.server.log(". .                     resync on frame errors: %s," % (valuesDict.get("resyncOnFrameError", None)))
+            indigo.server.log(". .                    bytes skipped in resync: %s," % (valuesDict.get("framingBytesSkipped", None)))
             indigo.server.log("")
             indigo.server.log(". .        Caddx Object:            panel name: %s," % (valuesDict.get("panelName", None)))
             indigo.server.log(". .                                 panel type: %s," % (valuesDict.get("panelType", None)))
@@ -691,37 +721,60 @@ class Plugin(indigo.PluginBase):
 
     def _createAlarmZones(self):							# create indigo zone devices from 1 to the set value of "zonesSystem"
         zonesSystem = int(self.pluginPrefs['zonesSystem'])  # read plugin config preference limit parameter settings
+        zoneNameTimeout = 30								# seconds to wait for a Zone Name Message, retries included
+
+        # queue a Zone Name Request for every missing zone up front so the comm loop sends them back to back
+        nameReplies = {}
         for key in range(0, zonesSystem):					# create alarm zones from 1 to zonesSystem value
             key = (key + 1)
-            zone = str(key)
             if key in self.caddx.zoneList.keys():
                 indigo.server.log("createAlarmZones:        Alarm device zone %r already exists" % key)
             else:
-                zoneName = "Zone " + f"{key:03}"
-                # Fixme: Karl's version does the following. Bodge. Need to find a better way.
-                for ii in range(5):
-                    self.caddx.keypadDisplayName = ""
-                    self.caddx.singleZoneNameRequest(key - 1)
-                    if self.caddx.keypadDisplayName != "":
-                        break  # Got non-empty string
-                if self.caddx.keypadDisplayName == "":
-                    self.caddx.keypadDisplayName = "Unknown"
-                displayName = self.caddx.keypadDisplayName
-                # Fixme: End.
-                self.debugLog("createAlarmZones:        key: %r,  displayName: %s" % (key, displayName))
-                indigo.server.log("createAlarmZones:        Creating alarm device zone: %r" % key)		# create specific alarm zone device
-                # Todo:  Karl's version prefixed device name with Caddx_.  Is this really necessary if we use a folder?
-                deviceName = f"{zoneName} - {displayName.rstrip()}"
-                indigo.device.create(
-                    protocol=indigo.kProtocol.Plugin,
-                    address="",
-                    name=deviceName,
-                    folder=self.pluginPrefs['deviceFolderName'],
-                    description=f"Security {zoneName}",
-                    pluginId=self.pluginId,
-                    deviceTypeId="zone",
-                    props={"address": zone, "zoneName": deviceName, "zoneDisplayName": displayName}
-                )
+                nameReplies[key] = self.caddx.singleZoneNameRequest(key - 1)
+        if not nameReplies:
+            return
+
+        # create each device as soon as its name arrives, while the remaining requests are still on the wire; replies
+        # arrive in queue order, so each wait only covers one request.  The device folder is resolved once for the batch.
+        folderName = self.pluginPrefs['deviceFolderName']
+        if folderName not in indigo.devices.folders:
+            indigo.devices.folder.create(folderName)
+        folderId = indigo.devices.folders[folderName].id
+        timedOut = False
+        unnamedZones = []
+        for key, nameReply in nameReplies.items():
+            zone = str(key)
+            try:
+                # after one timeout the link is taken to be down: use names already received, don't wait for the rest
+                displayName = self.caddx.decodeZoneName(nameReply.result(0 if timedOut else zoneNameTimeout))
+            except CaddxException as err:
+                self.errorLog(f"createAlarmZones: No keypad display name for zone {key}: {err}")
+                displayName = ""
+            except concurrent.futures.TimeoutError:
+                if not timedOut:
+                    self.errorLog(f"createAlarmZones: No Zone Name Message for zone {key} within {zoneNameTimeout} seconds.  Not waiting for the remaining zones.")
+                timedOut = True
+                displayName = ""
+            if displayName == "":
+                unnamedZones.append(key)
+                displayName = "Unknown"
+            self.debugLog("createAlarmZones:        key: %r,  displayName: %s" % (key, displayName))
+            zoneName = "Zone " + f"{key:03}"
+            indigo.server.log("createAlarmZones:        Creating alarm device zone: %r" % key)		# create specific alarm zone device
+            # Todo:  Karl's version prefixed device name with Caddx_.  Is this really necessary if we use a folder?
+            deviceName = f"{zoneName} - {displayName.rstrip()}"
+            indigo.device.create(
+                protocol=indigo.kProtocol.Plugin,
+                address="",
+                name=deviceName,
+                folder=folderId,
+                description=f"Security {zoneName}",
+                pluginId=self.pluginId,
+                deviceTypeId="zone",
+                props={"address": zone, "zoneName": deviceName, "zoneDisplayName": displayName}
+            )
+        if unnamedZones:
+            self.errorLog(f"createAlarmZones: {len(unnamedZones)} zones created with the default name 'Unknown': {', '.join(str(key) for key in unnamedZones)}")
 
     ########################################
     # Menu - Synchronise  Database method
@@ -750,21 +803,83 @@ class Plugin(indigo.PluginBase):
         usersSystem = int(self.pluginPrefs['usersSystem'])
         zonesSystem = int(self.pluginPrefs['zonesSystem'])
 
-        # execute alarm panel request commands to sync configuration database
-        self.caddx.actionInterfaceConfigurationRequest(action)				# command action: --> Interface Configuration Request <--
-        self.caddx.actionZoneNameRequest(zonesSystem)						# command action: --> Zone Name Request <--
-        self.caddx.actionZoneStatusRequest(zonesSystem)						# command action: --> Zone Status Request <--
-        self.caddx.actionZonesSnapshotRequest(zonesSnapshotQuery)			# command action: --> Zones Snapshot Request <--
-        self.caddx.actionPartitionStatusRequest(partitionsSystem)			# command action: --> Partition Status Request <--
-        self.caddx.actionPartitionSnapshotRequest(action)					# command action: --> Partition Snapshot Request <--
-        self.caddx.actionSystemStatusRequest(action)						# command action: --> System Status Request <--
-        self.caddx.actionUserInformationRequestWithoutPin(usersSystem)		# command action: --> User Information Request without PIN <--"
-        time.sleep(int(0.75*zonesSystem))
-        indigo.server.log("syncDatabase:        Indigo database now successfully synchronised with the Caddx NetworX Security System database.")
+        # execute alarm panel request commands to sync configuration database, tracking each request until answered.
+        # Live state goes first; the configuration requests follow, mostly as low priority bulk requests.
+        tracker = CaddxSyncTracker()
+        self.caddx.syncTracker = tracker
+        try:
+            self.caddx.actionPartitionSnapshotRequest(action)					# command action: --> Partition Snapshot Request <--
+            self.caddx.actionZonesSnapshotRequest(zonesSnapshotQuery)			# command action: --> Zones Snapshot Request <--
+            self.caddx.actionSystemStatusRequest(action)						# command action: --> System Status Request <--
+            self.caddx.actionPartitionStatusRequest(partitionsSystem)			# command action: --> Partition Status Request <--
+            self.caddx.actionInterfaceConfigurationRequest(action)				# command action: --> Interface Configuration Request <--
+            self.caddx.actionZoneNameRequest(zonesSystem)						# command action: --> Zone Name Request <--
+            self.caddx.actionZoneStatusRequest(zonesSystem)						# command action: --> Zone Status Request <--
+            self.caddx.actionUserInformationRequestWithoutPin(usersSystem)		# command action: --> User Information Request without PIN <--"
+        finally:
+            self.caddx.syncTracker = None
+
+        # wait for the panel to answer, publishing progress; give up if nothing completes for syncStallTimeout seconds
+        syncStallTimeout = 30
+        while not tracker.wait(1.0):
+            self.caddx.updateSyncStatus(tracker)
+            if tracker.stalledFor() > syncStallTimeout:
+                self.errorLog(f"syncDatabase: No reply from panel for {syncStallTimeout} seconds.  {tracker.completed} of {tracker.total} requests completed.")
+                break
+        self.caddx.updateSyncStatus(tracker)
+        failedItems = tracker.failedItems()
+        if failedItems:
+            self.errorLog(f"syncDatabase: {len(failedItems)} of {tracker.total} requests failed: {', '.join(failedItems)}")
+        if tracker.completed < tracker.total or failedItems:
+            indigo.server.log("syncDatabase:        Indigo database synchronisation with the Caddx NetworX Security System database is incomplete.")
+        else:
+            indigo.server.log(f"syncDatabase:        Indigo database now successfully synchronised with the Caddx NetworX Security System database ({tracker.total} requests in {time.monotonic() - tracker.startTime:.1f} seconds).")
 
         # update sync database states in plugin preferences
         self.pluginPrefs["isSynchronising"] = False
+        self.pluginPrefs["synchronised"] = tracker.completed >= tracker.total and not failedItems
+        if self.pluginPrefs["synchronised"]:
+            self.caddx.panelCache.validated = True
+            self.caddx.panelCache.save()
+            self.pluginPrefs["panelStatus"] = "synchronise completed  ** %s " % self.caddx.timestamp()
+            # Todo:  Karl's version prefixed variable with Caddx_.  Is this really necessary if we use a folder?
+            self.caddx.updateVariable("panelStatus", f"Synchronise completed  ** {self.caddx.timestamp()}")
+        else:
+            self.pluginPrefs["panelStatus"] = "synchronise incomplete  ** %s " % self.caddx.timestamp()
+            self.caddx.updateVariable("panelStatus", f"Synchronise incomplete  ** {self.caddx.timestamp()}")
+
+    def warmStart(self, cacheKey):
+        """
+        Trust the panel configuration cache from the last run if a few entries re-read from the panel still match
+        it, otherwise fall back to a full database sync.
+
+        :param cacheKey: The (model, firmware) the cache was recorded for, or None if there is no cache.
+        :return: None
+        """
+        if cacheKey is None:
+            indigo.server.log("warmStart:        no panel configuration cache, running a full database sync.")
+            self.syncDatabase()
+            return
+        startTime = time.monotonic()
+        try:
+            mismatch = self.caddx.validatePanelCache(cacheKey)
+        except (CaddxException, concurrent.futures.TimeoutError) as err:
+            self.errorLog(f"warmStart: Could not validate the panel configuration cache: {err or 'timed out'}.  Running a full database sync.")
+            self.caddx.panelCache.reset()
+            self.syncDatabase()
+            return
+        if mismatch is not None:
+            indigo.server.log(f"warmStart:        panel configuration cache is stale ({mismatch}), running a full database sync.")
+            self.caddx.panelCache.reset()
+            self.syncDatabase()
+            return
+        self.caddx.panelCache.validated = True
+        updated = self.caddx.restorePanelCache()
         self.pluginPrefs["synchronised"] = True
+        indigo.server.log(f"warmStart:        panel configuration cache validated in {time.monotonic() - startTime:.1f} seconds, {updated} devices updated from it.")
+
+        # the Zones Snapshots sent at connect give each zone's trip state; the full zone conditions follow as bulk requests
+        self.caddx.actionZoneStatusRequest(int(self.pluginPrefs['zonesSystem']))
         self.pluginPrefs["panelStatus"] = "synchronise completed  ** %s " % self.caddx.timestamp()
         # Todo:  Karl's version prefixed variable with Caddx_.  Is this really necessary if we use a folder?
         self.caddx.updateVariable("panelStatus", f"Synchronise completed  ** {self.caddx.timestamp()}")
@@ -999,8 +1114,11 @@ class Plugin(indigo.PluginBase):
                 # noinspection PyUnusedLocal
                 zoneNumber = localPropsCopy["address"]
                 zoneDisplayName = localPropsCopy["zoneDisplayName"]
-                zoneGroupType = localPropsCopy["zoneGroupType"]
-                zoneGroupDescription = localPropsCopy["zoneGroupDescription"]
+                zoneGroupType = localPropsCopy.get("zoneGroupType", "value unassigned")
+                zoneGroupDescription = localPropsCopy.get("zoneGroupDescription", "value unassigned")
+                if zoneGroupType == "value unassigned":
+                    # no Zone Status Message processed for the zone yet; classify it from the cached panel configuration
+                    zoneGroupType, zoneGroupDescription = self.caddx.cachedZoneGroup(zone) or (zoneGroupType, zoneGroupDescription)
                 zoneState = dev.states["zoneState"]
                 indigo.server.log(". . %s   display name: {%s},   state: %s,   type: %s,   description: %s  " % (zoneName, zoneDisplayName, zoneState, zoneGroupType, zoneGroupDescription))
         indigo.server.log("")
@@ -1028,6 +1146,20 @@ class Plugin(indigo.PluginBase):
             entryNumber += 1
         indigo.server.log("")
 
+    ########################################
+    # Menu - Communication Statistics to Log method
+    ########################################
+
+    def commStatsToLog(self):					# copy command queue and link statistics to Indigo Event Log
+        indigo.server.log("")
+        indigo.server.log("Communication Statistics: . . .")
+        for name, waiting, dispatched, coalesced, averageWait, maxWait in self.caddx.commandQueue.stats():
+            indigo.server.log(f". . {name:>7} commands:   waiting: {waiting},   sent: {dispatched},   coalesced: {coalesced},   average wait: {averageWait * 1000:.0f} ms,   longest wait: {maxWait * 1000:.0f} ms")
+        roundTrip = self.caddx.pacing.roundTrip
+        indigo.server.log(f". . panel response time: {'n/a' if roundTrip is None else f'{roundTrip * 1000:.0f} ms'},   command spacing: {0.0 if roundTrip is None else min(roundTrip * self.caddx.pacing.fraction, self.sleepBetweenComm) * 1000:.0f} ms")
+        indigo.server.log(f". . link reconnects: {self.caddx.reconnectCount},   last downtime: {self.caddx.lastDowntime:.1f} s,   total downtime: {self.caddx.totalDowntime:.1f} s")
+        indigo.server.log("")
+
     ########################################
     # Menu - Set Date / Time method
     ########################################
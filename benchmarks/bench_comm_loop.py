@@ -0,0 +1,103 @@
+"""
+Idle CPU, event latency and command dispatch latency of each communication loop mode, over a pty with a stand-in
+panel on the far end (user-005).  "poll" is the loop as it was before the event-driven loop.
+
+    python benchmarks/bench_comm_loop.py [--idle SECONDS] [MODE ...]
+
+Event latency runs from the panel writing a Zone Status message to the plugin decoding it; dispatch latency from
+sendMsgToQueue() to sendMsg().
+"""
+import argparse
+import os
+import select
+import statistics
+import threading
+import time
+
+import common
+import caddx
+import test_asyncio_engine
+
+
+def quantiles(samples: list[float]) -> str:
+    return f"median {statistics.median(samples):.2f} ms, p95 {sorted(samples)[int(len(samples) * 0.95)]:.2f} ms"
+
+
+def acknowledgeEverything(port) -> None:
+    ack = caddx.encodeMessage("011d")
+    while True:
+        ready, _, _ = select.select([port.master], [], [], 0.5)
+        if ready:
+            data = os.read(port.master, 1000)
+            for _ in range(data.count(b"\x7e")):
+                os.write(port.master, ack)
+
+
+def measure(mode: str, idleSeconds: float) -> str:
+    panel = caddx.Caddx(common.indigo_stub.FakePlugin(mode))
+    panel.updateVariable = lambda *args: None
+    port = test_asyncio_engine.PtyPort()
+    panel.conn = port
+    decodedAt = {}
+    decodeReceivedData = panel.decodeReceivedData
+
+    def recordDecoded(messageDict, reqMessageType):
+        if messageDict[1] & 0x3f == 0x04:
+            decodedAt[messageDict[2]] = time.perf_counter()
+        decodeReceivedData(messageDict, reqMessageType)
+
+    panel.decodeReceivedData = recordDecoded
+    threading.Thread(target=acknowledgeEverything, args=(port,), daemon=True).start()
+    loop = threading.Thread(target=panel.activeCommLoop, args=("pty", port, panel.commandQueue), daemon=True)
+    loop.start()
+    time.sleep(1.0)
+    panel.commandQueue.join()
+
+    cpuStart, wallStart = time.process_time(), time.monotonic()
+    time.sleep(idleSeconds)
+    idleCpu = 100 * (time.process_time() - cpuStart) / (time.monotonic() - wallStart)
+
+    eventLatency = []
+    for zone in range(200):
+        sentAt = time.perf_counter()
+        os.write(port.master, caddx.encodeMessage(bytes([0x08, 0x04, zone, 0x01, 0, 0, 0, 0, 0]).hex()))
+        while zone not in decodedAt and time.perf_counter() - sentAt < 1:
+            time.sleep(0.0002)
+        eventLatency.append((decodedAt[zone] - sentAt) * 1000)
+        time.sleep(0.013)						# off the beat of the idle poll
+
+    dispatchLatency = []
+    sentAt = {}
+    sendMsg = panel.sendMsg
+
+    def recordSent(transmitDataHex):
+        sentAt.setdefault(transmitDataHex, time.perf_counter())
+        sendMsg(transmitDataHex)
+
+    panel.sendMsg = recordSent
+    for zone in range(50):
+        command = f"0324{zone:02x}"
+        queuedAt = time.perf_counter()
+        panel.sendMsgToQueue(command)
+        while command not in sentAt and time.perf_counter() - queuedAt < 1:
+            time.sleep(0.0002)
+        dispatchLatency.append((sentAt[command] - queuedAt) * 1000)
+        time.sleep(0.017)
+
+    panel.stopComm()
+    loop.join(5)
+    return f"{mode:7s}: idle CPU {idleCpu:.2f}%   event -> handler {quantiles(eventLatency)}   " \
+           f"enqueue -> send {quantiles(dispatchLatency)}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modes", nargs="*", default=["poll", "event", "asyncio"])
+    parser.add_argument("--idle", type=float, default=5.0, help="seconds of idle link to measure CPU over")
+    args = parser.parse_args()
+    for mode in args.modes:
+        print(measure(mode, args.idle))
+
+
+if __name__ == "__main__":
+    main()
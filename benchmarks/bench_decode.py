@@ -0,0 +1,112 @@
+"""
+Time per received message through decodeReceivedData(), by message type, before and after frames are passed through
+the decoders as bytes instead of lists of hex strings (user-004).  Checks first that both revisions collect the same
+state changes and plugin properties for every message.
+
+    python benchmarks/bench_decode.py [--before REV] [--after REV]
+
+Revisions whose decodeReceivedData() takes a list of hex strings are fed one, built per call as readMsg() did.  Against
+the working tree the zone messages are reported as different: later changes deliberately publish other zone states.
+"""
+import argparse
+import copy
+import inspect
+import random
+import timeit
+
+import common
+
+rng = random.Random(4)
+MESSAGES = {
+    "01 interface config": bytes([0x0b, 0x01]) + b"1.20" + rng.randbytes(6),
+    "03 zone name": bytes([0x12, 0x03, 0x02]) + b"Front Door      ",
+    "04 zone status": bytes([0x08, 0x04, 0x01, 0x01, 0x12, 0x34, 0x56, 0x03, 0x01]),
+    "05 zone snapshot": bytes([0x0a, 0x05, 0x00]) + rng.randbytes(8),
+    "06 partition status": bytes([0x09, 0x06, 0x00, 0x41, 0x12, 0x44, 0x80, 0x07, 0x91, 0x10]),
+    "07 partition snapshot": bytes([0x09, 0x07]) + rng.randbytes(8),
+    "08 system status": bytes([0x0c, 0x08, 0x04]) + rng.randbytes(10),
+    "0a log event": bytes([0x0a, 0x0a, 0x05, 0xc5, 0x00, 0x01, 0x00, 0x01, 0x01, 0x0c, 0x00]),
+    "0b keypad": bytes([0x03, 0x0b, 0x00, 0x0a]),
+    "12 user information": bytes([0x07, 0x12, 0x01, 0x21, 0x43, 0x65, 0x4c, 0x01]),
+}
+
+
+class States(dict):
+    def __missing__(self, key):
+        return "0"
+
+
+class Device(object):
+    def __init__(self, devId: int):
+        self.id = devId
+        self.name = f"dev{devId}"
+        self.pluginProps = {"associatedKeypad": "1", "zoneDisplayName": "z"}
+        self.states = States()
+
+    def replacePluginPropsOnServer(self, props) -> None:
+        self.pluginProps = dict(props)
+
+
+class Decoder(object):
+    """
+    A Caddx object of one revision with a few devices, collecting state changes instead of publishing them.
+    """
+
+    def __init__(self, caddx):
+        plugin = common.indigo_stub.FakePlugin()
+        for event in range(1, 26):
+            plugin.pluginPrefs[f"zlogEventHistory{event:02}"] = ""
+        self.panel = panel = caddx.Caddx(plugin)
+        panel.conn = common.MemoryPort()
+        panel.updateVariable = lambda *args, **kwargs: None
+        panel.zoneList = {zone: Device(100 + zone) for zone in range(1, 9)}
+        panel.partitionList = {1: Device(1)}
+        panel.keypadList = {1: Device(2)}
+        panel.userList = {1: Device(3)}
+        panel.systemStatusList = {int(panel.systemId): Device(4)}
+        self.collected = []
+        panel.executeUpdateStatesList = self.collect
+        hexList = inspect.signature(panel.decodeReceivedData).parameters["messageDict"].annotation != bytes
+        if hexList:
+            self.decode = lambda message: panel.decodeReceivedData([f"{byte:02x}" for byte in message], 0)
+        else:
+            self.decode = lambda message: panel.decodeReceivedData(message, 0)
+
+    def collect(self) -> None:
+        changes = self.panel.devStateChangeList
+        self.collected.append({str(devId): copy.deepcopy(states) for devId, states in changes.items()})
+        changes.clear()
+
+    def outcome(self) -> tuple:
+        panel = self.panel
+        devices = list(panel.zoneList.values()) + list(panel.userList.values())
+        return self.collected, [device.pluginProps for device in devices], panel.plugin.pluginPrefs
+
+    def microseconds(self, message: bytes, calls: int = 2000) -> float:
+        return min(timeit.repeat(lambda: self.decode(message), number=calls, repeat=5)) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--before", default="1918af8~1", help="revision to compare against (default: %(default)s)")
+    parser.add_argument(
+        "--after", default="1918af8", help="revision to measure, or 'worktree' (default: %(default)s, the change itself)")
+    args = parser.parse_args()
+    before = common.loadCaddx(args.before)
+    after = common.loadCaddx(None if args.after == "worktree" else args.after)
+    print(f"{args.before} -> {args.after}, us per message")
+    for name, message in MESSAGES.items():
+        old, new = Decoder(before), Decoder(after)
+        old.decode(message)
+        new.decode(message)
+        same = "" if old.outcome() == new.outcome() else "   DIFFERENT state changes or properties"
+        full = (old.microseconds(message), new.microseconds(message))
+        for decoder in (old, new):
+            decoder.panel.addToStatesUpdateList = lambda *args, **kwargs: None
+        decodeOnly = (old.microseconds(message), new.microseconds(message))
+        print(f"{name:24s} full {full[0]:6.1f} -> {full[1]:6.1f}   decode only {decodeOnly[0]:6.1f} -> {decodeOnly[1]:6.1f}"
+              f"{same}")
+
+
+if __name__ == "__main__":
+    main()
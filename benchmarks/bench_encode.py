@@ -0,0 +1,59 @@
+"""
+Fletcher-16 time and commands per second through sendMsg(), before and after the faster Fletcher-16 and the
+precomputed frames for fixed commands (user-003).  Checks first that the checksum and byte stuffing of the measured
+revision round-trip through its own frame decoder.
+
+    python benchmarks/bench_encode.py [--before REV] [--after REV] [--sends N]
+"""
+import argparse
+import random
+import timeit
+
+import common
+
+
+def checkEquivalence(caddx) -> None:
+    rng = random.Random(3)
+    for _ in range(20000):
+        data = rng.randbytes(rng.randrange(1, 60))
+        assert caddx.fletcher16(data) == common.fletcher16(data), data
+    decoder = caddx.CaddxFrameDecoder()
+    for _ in range(5000):
+        body = bytes(rng.choice((0x7d, 0x7e, rng.randrange(256))) for _ in range(rng.randrange(2, 20)))
+        message = bytes([len(body)]) + body
+        decoder.feed(caddx.encodeMessage(message.hex()))
+        assert decoder.nextFrame() == message, message
+
+
+def checksumMicroseconds(caddx, length: int) -> float:
+    data = random.Random(length).randbytes(length)
+    return min(timeit.repeat(lambda: caddx.fletcher16(data), number=100000, repeat=5)) / 100000 * 1e6
+
+
+def sendsPerSecond(caddx, command: str, sends: int) -> float:
+    panel = caddx.Caddx(common.indigo_stub.FakePlugin())
+    panel.conn = common.MemoryPort()
+    return sends / min(timeit.repeat(lambda: panel.sendMsg(command), number=sends, repeat=5))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--before", default="b54e791~1", help="revision to compare against (default: %(default)s)")
+    parser.add_argument("--after", default=None, help="revision to measure (default: the working tree)")
+    parser.add_argument("--sends", type=int, default=100000)
+    args = parser.parse_args()
+    after = common.loadCaddx(args.after)
+    checkEquivalence(after)
+    print("checksum and byte stuffing round-trip: ok")
+    commands = {"partition snapshot request (fixed)": after.cmdPartitionSnapshotRequest, "zone status request": "032405"}
+    for label, revision in (("before", args.before), ("after", args.after)):
+        caddx = common.loadCaddx(revision) if label == "before" else after
+        checksums = ", ".join(f"{length} bytes {checksumMicroseconds(caddx, length):.2f} us" for length in (3, 12, 40))
+        print(f"{label} ({revision or 'working tree'}): checksum {checksums}")
+        for name, command in commands.items():
+            rate = sendsPerSecond(caddx, command, args.sends)
+            print(f"{label} ({revision or 'working tree'}): {name} {rate:,.0f} sends/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Frames per second through readMsg() for a long stream of panel traffic held in memory, before and after the
+incremental frame decoder (user-001).
+
+    python benchmarks/bench_frame_decoder.py [--before REV] [--after REV] [--frames N]
+"""
+import argparse
+import time
+
+import common
+
+
+def framesPerSecond(caddx, stream: bytes) -> tuple[int, float]:
+    panel = caddx.Caddx(common.indigo_stub.FakePlugin())
+    port = common.MemoryPort(stream)
+    frames = 0
+    start = time.perf_counter()
+    while panel.readMsg(port, False) is not None:
+        frames += 1
+    return frames, frames / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--before", default="edabedb~1", help="revision to compare against (default: %(default)s)")
+    parser.add_argument("--after", default=None, help="revision to measure (default: the working tree)")
+    parser.add_argument("--frames", type=int, default=20000)
+    args = parser.parse_args()
+    stream = b"".join(common.encodeFrame(message) for message in common.sampleTraffic(args.frames))
+    for label, revision in (("before", args.before), ("after", args.after)):
+        frames, rate = framesPerSecond(common.loadCaddx(revision), stream)
+        print(f"{label} ({revision or 'working tree'}): {frames} frames, {rate:,.0f} frames/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Log event formatting and message description lookups, before and after the per-call lookup dictionaries were
+replaced by the module-level protocol catalog (user-021).  Checks first that every code gives the same text and that
+formatted log history entries are identical.
+
+    python benchmarks/bench_log_events.py [--before REV] [--after REV|worktree]
+"""
+import argparse
+import random
+import timeit
+
+import common
+
+
+class Device(object):
+    def __init__(self, devId: int):
+        self.id = devId
+        self.pluginProps = {"zoneDisplayName": f"Zone {devId}", "associatedKeypad": "1"}
+        self.states = {}
+
+
+def makePanel(caddx):
+    plugin = common.indigo_stub.FakePlugin()
+    plugin.alarmEventInfo = True
+    for event in range(1, 26):
+        plugin.pluginPrefs[f"zlogEventHistory{event:02}"] = ""
+    caddx.time.asctime = lambda *args: "asctime"			# identical text from both revisions
+    panel = caddx.Caddx(plugin)
+    panel.updateVariable = lambda *args, **kwargs: None
+    panel.timestamp = lambda: "timestamp"
+    panel.addToStatesUpdateList = lambda *args, **kwargs: None
+    panel.zoneList = {zone: Device(zone) for zone in range(1, 193)}
+    panel.partitionList = {partition: Device(1000 + partition) for partition in range(1, 9)}
+    return panel
+
+
+def catalogMismatches(oldPanel, new) -> int:
+    mismatches = 0
+    for code in range(256):
+        mismatches += oldPanel.messageAlarmDict(f"{code:02x}") != new.messageDescriptions[code]
+        mismatches += oldPanel.messageLogDeviceAddressDict(code) != new.logEventDevices[code]
+    for eventType in range(128):
+        description, byte5, byte6 = new.logEventTypes[eventType]
+        mismatches += (oldPanel.messageLogEventDict(eventType), oldPanel.messageLogByte6Dict(eventType)) != (description, byte6)
+        oldByte5 = oldPanel.messageLogByte5Dict(eventType)
+        mismatches += (oldByte5 if oldByte5 in ("zone", "user", "device", "none") else None) != byte5
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--before", default="da9987f~1", help="revision to compare against (default: %(default)s)")
+    parser.add_argument(
+        "--after", default="da9987f", help="revision to measure, or 'worktree' (default: %(default)s, the change itself)")
+    args = parser.parse_args()
+    before = common.loadCaddx(args.before)
+    after = common.loadCaddx(None if args.after == "worktree" else args.after)
+    oldPanel, newPanel = makePanel(before), makePanel(after)
+    print(f"catalog entries with different text: {catalogMismatches(oldPanel, after)}")
+
+    rng = random.Random(21)
+    frames = [
+        bytes([0x0a, 0x0a, rng.randrange(256), 0xff, eventType, rng.randrange(192), rng.randrange(8), 1, 2, 3, 4])
+        for eventType in list(range(256)) * 8]
+    mismatches = 0
+    for frame in frames:
+        oldPanel._logEventMessage(frame)
+        newPanel._logEventMessage(frame)
+        mismatches += \
+            oldPanel.plugin.pluginPrefs["zlogEventHistory25"] != newPanel.plugin.pluginPrefs["zlogEventHistory25"]
+    print(f"{len(frames)} log events, formatted history entries that differ: {mismatches}")
+
+    for label, panel in (("before", oldPanel), ("after", newPanel)):
+        perEvent = min(timeit.repeat(lambda: [panel._logEventMessage(frame) for frame in frames], number=5, repeat=5)) \
+            / (5 * len(frames))
+        print(f"{label}: {perEvent * 1e6:.1f} us per log event, {1 / perEvent:,.0f} events/s")
+    for label, lookup in (
+            ("before: messageAlarmDict()", lambda: oldPanel.messageAlarmDict("04")),
+            ("after: messageDescriptions[]", lambda: after.messageDescriptions[4])):
+        print(f"{label} {min(timeit.repeat(lookup, number=200000, repeat=5)) / 200000 * 1e9:.0f} ns per lookup")
+
+
+if __name__ == "__main__":
+    main()
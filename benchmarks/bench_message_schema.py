@@ -0,0 +1,133 @@
+"""
+Per message type decode time with the message schema and its compiled decoders (user-020).  Random frames of every
+fixed-layout type go through decodeReceivedData() of the revision before and of the change, which must collect the
+same state changes, prefs, props and replies; then the handlers and the compiled decoders are timed.
+
+    python benchmarks/bench_message_schema.py [--before REV] [--after REV|worktree]
+"""
+import argparse
+import random
+import timeit
+
+import common
+
+BODY_LENGTHS = {0x1d: 0, 0x1f: 0, 0x0b: 2, 0x01: 10, 0x04: 7, 0x05: 9, 0x06: 8, 0x07: 8, 0x08: 11, 0x12: 6}
+
+
+class States(dict):
+    def __missing__(self, key):
+        return "0"
+
+
+class Device(object):
+    def __init__(self, devId: int):
+        self.id = devId
+        self.name = f"dev{devId}"
+        self.pluginProps = {"zoneDisplayName": f"Zone {devId}", "associatedKeypad": "1"}
+        self.states = States(zoneState="normal")
+
+    def replacePluginPropsOnServer(self, props) -> None:
+        self.pluginProps = dict(props)
+
+    def updateStateImageOnServer(self, *args) -> None:
+        pass
+
+
+def randomFrames(perType: int = 400) -> list[bytes]:
+    rng = random.Random(19)
+    frames = []
+    for messageNumber, length in BODY_LENGTHS.items():
+        for _ in range(perType):
+            body = bytearray(rng.randbytes(length))
+            if messageNumber == 0x01:
+                body[0:4] = b"1.00"
+            elif messageNumber == 0x04:
+                body[0] = rng.randrange(192)
+            elif messageNumber == 0x05:
+                body[0] = rng.randrange(12)
+            elif messageNumber in (0x06, 0x08):
+                body[0] = rng.randrange(8)
+            elif messageNumber == 0x07 and rng.random() < 0.5:
+                body[0] = rng.choice((0x03, 0x01, 0x4f, 0x4d, 0x47, 0x45, 0x13, 0x1b, 0x0b))
+            elif messageNumber == 0x12:
+                body[0] = rng.randrange(1, 99)
+            frames.append(bytes([length + 1, messageNumber]) + bytes(body))
+    return frames
+
+
+def makePanel(caddx):
+    """
+    :return: (Caddx object with a full set of devices, list its state changes and sent commands are recorded in)
+    """
+    panel = caddx.Caddx(common.indigo_stub.FakePlugin())
+    recorded = []
+    panel.updateVariable = lambda *args, **kwargs: None
+    panel.sendMsg = lambda transmitDataHex: recorded.append(("sent", transmitDataHex))
+    panel.panelCache.record = lambda dataDict: None
+    panel.addToStatesUpdateList = lambda dev, key, value: recorded.append((dev.id, key, value))
+    panel.executeUpdateStatesList = lambda: None
+    panel.zoneList = {zone: Device(zone) for zone in range(1, 193)}
+    panel.partitionList = {partition: Device(1000 + partition) for partition in range(1, 9)}
+    panel.panelList = {1: Device(2000)}
+    panel.keypadList = {1: Device(4000)}
+    panel.userList = {user: Device(3000 + user) for user in range(1, 100)}
+    panel.systemStatusList = {1: Device(5000)}
+    panel.model = "NX-8E"
+    return panel, recorded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--before", default="f133205~1", help="revision to compare against (default: %(default)s)")
+    parser.add_argument(
+        "--after", default="f133205", help="revision to measure, or 'worktree' (default: %(default)s, the change itself)")
+    args = parser.parse_args()
+    before = common.loadCaddx(args.before)
+    after = common.loadCaddx(None if args.after == "worktree" else args.after)
+    (oldPanel, oldRecorded), (newPanel, newRecorded) = makePanel(before), makePanel(after)
+
+    frames = randomFrames()
+    mismatches = 0
+    for frame in frames:
+        for panel, recorded in ((oldPanel, oldRecorded), (newPanel, newRecorded)):
+            recorded.clear()
+            try:
+                panel.decodeReceivedData(frame, 0)
+            except Exception as err:			# e.g. an undefined keypad button code: must fail the same way
+                recorded.append(("raised", type(err).__name__))
+        if sorted(map(str, oldRecorded)) != sorted(map(str, newRecorded)) \
+                or oldPanel.plugin.pluginPrefs != newPanel.plugin.pluginPrefs:
+            mismatches += 1
+    sameProps = all(
+        oldDevice.pluginProps == newDevice.pluginProps
+        for devices in ("zoneList", "userList")
+        for oldDevice, newDevice in zip(getattr(oldPanel, devices).values(), getattr(newPanel, devices).values()))
+    print(f"{len(frames)} random frames, {mismatches} with different state changes, prefs or replies; "
+          f"same props: {sameProps}")
+
+    print(f"decodeReceivedData(), us per frame, {args.before} -> {args.after}")
+    for messageNumber in (0x01, 0x04, 0x05, 0x06, 0x07, 0x08, 0x12):
+        sample = [frame for frame in frames if frame[1] == messageNumber][:100]
+        times = [
+            min(timeit.repeat(lambda: [panel.decodeReceivedData(frame, 0) for frame in sample], number=20, repeat=5))
+            / (20 * len(sample)) * 1e6
+            for panel in (oldPanel, newPanel)]
+        print(f"  0x{messageNumber:02x} {after.messageSchema[messageNumber].name:34s} {times[0]:6.1f} -> {times[1]:6.1f}")
+
+    print("compiled decoders alone, ns per frame")
+    rng = random.Random(20)
+    for messageNumber, messageType in sorted(after.messageSchema.items()):
+        frame = bytes([messageType.length - 1, messageNumber]) + rng.randbytes(messageType.length - 2)
+        results = []
+        for target in ("Prefs", "States", "Props"):
+            decoder = getattr(messageType, "decode" + target)
+            values = len(decoder(frame))
+            if values:
+                took = min(timeit.repeat(lambda: decoder(frame), number=100000, repeat=5)) / 100000 * 1e9
+                results.append(f"{target.lower()} {values} values {took:.0f} ns")
+        if results:
+            print(f"  0x{messageNumber:02x} {messageType.name:34s} {';  '.join(results)}")
+
+
+if __name__ == "__main__":
+    main()
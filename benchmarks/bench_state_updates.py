@@ -0,0 +1,121 @@
+"""
+Collecting and publishing device state changes, before and after they were collected in place under a lock
+(user-024): a full System Status Message decoded and collected, with and without executeUpdateStatesList(), and two
+threads collecting while a third drains.  The race before the change depends on thread timing, so its losses vary
+from round to round.  Checks that both revisions publish the same states.
+
+    python benchmarks/bench_state_updates.py [--before REV] [--after REV]
+"""
+import argparse
+import sys
+import threading
+import timeit
+
+import common
+
+SYSTEM_STATUS = bytes([0x0c, 0x08, 0x04, 0x41, 0x02, 0x00, 0x80, 0x02, 0x00, 0x00, 0x08, 0x01, 0x00])
+
+
+class Device(object):
+    def __init__(self, devId: int):
+        self.id = devId
+        self.name = f"dev{devId}"
+        self.pluginProps = {}
+        self.states = {}
+
+    def updateStatesOnServer(self, changes: list[dict]) -> None:
+        for change in changes:
+            self.states[change["key"]] = change["value"]
+
+
+def makePanel(caddx):
+    """
+    :return: (Caddx object with a System Status device holding every state the message sets, the device)
+    """
+    panel = caddx.Caddx(common.indigo_stub.FakePlugin())
+    panel.sendMsg = lambda transmitDataHex: None
+    panel.panelCache.record = lambda dataDict: None
+    dev = Device(7)
+    common.indigo.devices[dev.id] = dev
+    panel.systemStatusList = {1: dev}
+    panel._systemStatusMessage(SYSTEM_STATUS)
+    for states in panel.devStateChangeList.values():
+        dev.states.update(dict.fromkeys(states, "0"))
+    panel.devStateChangeList.clear()
+    return panel, dev
+
+
+def concurrentCollect(panel, changesPerThread: int = 50000) -> tuple[int, int]:
+    """
+    Two threads collect changes for two devices while a third keeps taking the collected list, the way
+    executeUpdateStatesList() does in the revision measured.
+
+    :return: (Number of distinct changes the drainer received, times a taken list was still being changed)
+    """
+    drained = []
+    collisions = [0]
+    stop = threading.Event()
+
+    def drain():
+        while not stop.is_set() or panel.devStateChangeList:
+            if hasattr(panel, "devStateChangeLock"):
+                with panel.devStateChangeLock:
+                    local, panel.devStateChangeList = panel.devStateChangeList, {}
+            else:
+                local, panel.devStateChangeList = panel.devStateChangeList, {}
+            try:
+                drained.extend((devId, key) for devId, states in local.items() for key in states)
+            except RuntimeError:					# dictionary changed size during iteration
+                collisions[0] += 1
+
+    def collect(dev):
+        for change in range(changesPerThread):
+            panel.addToStatesUpdateList(dev, f"key{change}", change)
+
+    collectors = [threading.Thread(target=collect, args=(Device(devId),)) for devId in (1, 2)]
+    drainer = threading.Thread(target=drain)
+    switchInterval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)						# switch threads often enough to expose a race
+    try:
+        drainer.start()
+        for collector in collectors:
+            collector.start()
+        for collector in collectors:
+            collector.join()
+        stop.set()
+        drainer.join()
+    finally:
+        sys.setswitchinterval(switchInterval)
+    return len(set(drained)), collisions[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--before", default="bafd131~1", help="revision to compare against (default: %(default)s)")
+    parser.add_argument("--after", default=None, help="revision to measure (default: the working tree)")
+    parser.add_argument("--rounds", type=int, default=3, help="rounds of the concurrent collect (default: %(default)s)")
+    args = parser.parse_args()
+    published = {}
+    calls = 20000
+    for label, revision in (("before", args.before), ("after", args.after)):
+        panel, dev = makePanel(common.loadCaddx(revision))
+        panel.decodeReceivedData(SYSTEM_STATUS, 0x28)
+        published[label] = dict(dev.states)
+
+        def collectOnly():
+            panel._systemStatusMessage(SYSTEM_STATUS)
+            panel.devStateChangeList.clear()
+
+        collect = min(timeit.repeat(collectOnly, number=calls, repeat=5)) / calls
+        full = min(timeit.repeat(lambda: panel.decodeReceivedData(SYSTEM_STATUS, 0x28), number=calls, repeat=5)) / calls
+        print(f"{label} ({revision or 'working tree'}): decode + collect {collect * 1e6:.1f} us; "
+              f"with executeUpdateStatesList (no state changed) {full * 1e6:.1f} us; {len(dev.states)} states")
+        for _ in range(args.rounds):
+            delivered, collisions = concurrentCollect(panel)
+            print(f"  concurrent collect: {delivered} of 100000 state changes delivered, "
+                  f"{collisions} taken lists changed while being read")
+    print("same published states:", published["before"] == published["after"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Wall time for "Create Caddx Alarm System Devices" to create 192 zone devices, before and after zone name discovery
+was pipelined with device creation (user-016).  The Zone Name Requests go over a pty to a stand-in panel that takes
+50 ms per reply; indigo.device.create() is simulated with a fixed cost.
+
+    python benchmarks/bench_zone_creation.py [--before REV] [--after REV] [--zones N] [CREATE_COST_SECONDS ...]
+
+Both revisions of plugin.py drive the working tree's caddx.py.
+"""
+import argparse
+import os
+import select
+import threading
+import time
+import types
+
+import common
+import caddx
+import test_asyncio_engine
+
+indigo = common.indigo
+
+
+def namingPanel(port) -> None:
+    decoder = caddx.CaddxFrameDecoder()
+    while True:
+        ready, _, _ = select.select([port.master], [], [], 0.5)
+        if not ready:
+            continue
+        decoder.feed(os.read(port.master, 1000))
+        while (frame := decoder.nextFrame()) is not None:
+            messageNumber = frame[1] & 0x3f
+            if messageNumber == 0x1d:
+                continue
+            time.sleep(0.05)
+            if messageNumber == 0x23:
+                name = f"Zone name {frame[2] + 1:<6}".encode()
+                os.write(port.master, caddx.encodeMessage((bytes([0x12, 0x03, frame[2]]) + name).hex()))
+            else:
+                os.write(port.master, caddx.encodeMessage("011d"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("createCosts", nargs="*", type=float, default=[0.005, 0.05])
+    parser.add_argument("--before", default="d65f420~1", help="revision to compare against (default: %(default)s)")
+    parser.add_argument("--after", default=None, help="revision to measure (default: the working tree)")
+    parser.add_argument("--zones", type=int, default=192)
+    args = parser.parse_args()
+
+    fakePlugin = common.indigo_stub.FakePlugin()
+    panel = caddx.Caddx(fakePlugin)
+    panel.updateVariable = lambda *args: None
+    panel.partitionList = {}
+    port = test_asyncio_engine.PtyPort(timeout=0.5)
+    panel.conn = port
+    threading.Thread(target=namingPanel, args=(port,), daemon=True).start()
+    loop = threading.Thread(target=panel.activeCommLoop, args=("pty", port, panel.commandQueue), daemon=True)
+    loop.start()
+    time.sleep(0.5)
+    panel.commandQueue.join()
+
+    created = []
+    indigo.kProtocol = types.SimpleNamespace(Plugin=1)
+    indigo.devices.folders = {"Alarm": types.SimpleNamespace(id=42)}
+    versions = [(label, revision, common.loadSource("plugin.py", revision))
+                for label, revision in (("before", args.before), ("after", args.after))]
+    for createCost in args.createCosts:
+        indigo.device = types.SimpleNamespace(create=lambda **kwargs: (time.sleep(createCost), created.append(kwargs)))
+        for label, revision, plugin in versions:
+            created.clear()
+            panel.zoneList = {}
+            fakeSelf = types.SimpleNamespace(
+                pluginPrefs={"zonesSystem": str(args.zones), "deviceFolderName": "Alarm"}, caddx=panel,
+                errorLog=fakePlugin.errorLog, debugLog=fakePlugin.debugLog, pluginId=fakePlugin.pluginId)
+            start = time.monotonic()
+            plugin.Plugin._createAlarmZones(fakeSelf)
+            took = time.monotonic() - start
+            print(f"create cost {createCost * 1000:.0f} ms, {label} ({revision or 'working tree'}): "
+                  f"{len(created)} zones created in {took:.2f} s, first named {created[0]['name']!r}")
+    if fakePlugin.errors:
+        print("errors:", fakePlugin.errors[:3])
+    panel.stopComm()
+    loop.join(3)
+
+
+if __name__ == "__main__":
+    main()
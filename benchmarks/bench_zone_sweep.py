@@ -0,0 +1,77 @@
+"""
+A 192-zone Zone Status sweep over a pty, before and after command pacing moved from sleeps in the action methods into
+the communication loop (user-013): how long the caller is blocked and when the last reply arrives.  The stand-in
+panel takes 50 ms to answer each command, about what a 9600 bps link and the panel's own processing cost.
+
+    python benchmarks/bench_zone_sweep.py [--before REV] [--after REV] [--zones N] [MODE ...]
+"""
+import argparse
+import os
+import select
+import threading
+import time
+
+import common
+import test_asyncio_engine
+
+
+def slowPanel(caddx, port, zones: int, replies: list, done: threading.Event) -> None:
+    decoder = caddx.CaddxFrameDecoder()
+    while True:
+        ready, _, _ = select.select([port.master], [], [], 0.5)
+        if not ready:
+            continue
+        decoder.feed(os.read(port.master, 1000))
+        while (frame := decoder.nextFrame()) is not None:
+            messageNumber = frame[1] & 0x3f
+            if messageNumber == 0x1d:
+                continue
+            time.sleep(0.05)
+            if messageNumber == 0x24:
+                os.write(port.master, common.encodeFrame(bytes([0x08, 0x04, frame[2], 1, 0, 0, 0, 0, 0])))
+                replies.append(frame[2])
+                if frame[2] == zones - 1:
+                    done.set()
+            else:
+                os.write(port.master, common.encodeFrame(bytes([1, 0x1d])))
+
+
+def sweep(caddx, mode: str, zones: int) -> str:
+    panel = caddx.Caddx(common.indigo_stub.FakePlugin(mode))
+    panel.updateVariable = lambda *args: None
+    panel.partitionList = {}
+    panel._zoneStatusMessage = lambda messageDict: None
+    port = test_asyncio_engine.PtyPort(timeout=0.5)
+    panel.conn = port
+    replies = []
+    done = threading.Event()
+    threading.Thread(target=slowPanel, args=(caddx, port, zones, replies, done), daemon=True).start()
+    loop = threading.Thread(target=panel.activeCommLoop, args=("pty", port, panel.commandQueue), daemon=True)
+    loop.start()
+    time.sleep(0.5)
+    panel.commandQueue.join()
+    start = time.monotonic()
+    panel.actionZoneStatusRequest(zones)
+    blocked = time.monotonic() - start
+    done.wait(zones)
+    total = time.monotonic() - start
+    panel.stopComm()
+    loop.join(3)
+    return f"caller blocked {blocked:.2f} s, sweep complete after {total:.2f} s ({len(replies)} replies)"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modes", nargs="*", default=["poll", "event"])
+    parser.add_argument("--before", default="f19ff67~1", help="revision to compare against (default: %(default)s)")
+    parser.add_argument("--after", default=None, help="revision to measure (default: the working tree)")
+    parser.add_argument("--zones", type=int, default=192)
+    args = parser.parse_args()
+    for label, revision in (("before", args.before), ("after", args.after)):
+        caddx = common.loadCaddx(revision)
+        for mode in args.modes:
+            print(f"{label} ({revision or 'working tree'}) {mode}: {sweep(caddx, mode, args.zones)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Shared setup for the benchmarks: the stand-in indigo module from tests/, plugin sources from the working tree or from
+an earlier revision for before/after runs, an in-memory port, and sample panel traffic.
+"""
+import importlib.util
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"))
+
+import indigo_stub  # noqa: E402
+
+indigo = indigo_stub.install()
+
+
+def loadSource(fileName: str, revision: str | None = None):
+    """
+    Import a plugin source file under its own module name, so two versions can be timed side by side.  Imports
+    inside it, such as plugin.py's "from caddx import ...", resolve to the working tree.
+
+    :param fileName: File in the Server Plugin folder, e.g. "caddx.py".
+    :param revision: Git revision to take the file from, e.g. "edabedb~1".  The working tree if None.
+    :return: The module.
+    """
+    stem = os.path.splitext(fileName)[0]
+    if revision is None:
+        path = os.path.join(indigo_stub.PLUGIN_DIR, fileName)
+        name = f"{stem}_worktree"
+    else:
+        gitPath = os.path.relpath(os.path.join(indigo_stub.PLUGIN_DIR, fileName), indigo_stub.REPO_DIR)
+        source = subprocess.run(
+            ["git", "show", f"{revision}:{gitPath}"], cwd=indigo_stub.REPO_DIR, check=True, capture_output=True
+        ).stdout
+        path = os.path.join(tempfile.mkdtemp(prefix=f"{stem}-"), fileName)
+        with open(path, "wb") as file:
+            file.write(source)
+        name = f"{stem}_" + "".join(c if c.isalnum() else "_" for c in revision)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def loadCaddx(revision: str | None = None):
+    """
+    :param revision: Git revision to take caddx.py from.  The working tree if None.
+    :return: caddx.py as a module, see loadSource().
+    """
+    return loadSource("caddx.py", revision)
+
+
+class MemoryPort(object):
+    """
+    Port holding a fixed byte stream, with the part of the pySerial API readMsg() and sendMsg() use.
+    """
+
+    def __init__(self, data: bytes = b"", timeout: float = 0.0):
+        self.data = bytearray(data)
+        self.timeout = timeout
+        self.written = bytearray()
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.data)
+
+    def read(self, size: int = 1) -> bytes:
+        chunk = bytes(self.data[:size])
+        del self.data[:size]
+        return chunk
+
+    def write(self, data: bytes) -> int:
+        self.written += data
+        return len(data)
+
+    def reset_input_buffer(self) -> None:
+        self.data.clear()
+
+    def cancel_read(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def fletcher16(data: bytes) -> int:
+    first = second = 0
+    for byte in data:
+        first = (first + byte) % 255
+        second = (second + first) % 255
+    return (second << 8) | first
+
+
+def encodeFrame(message: bytes) -> bytes:
+    """
+    Frame a message the way the panel does: checksum, byte stuffing and start byte.  Independent of caddx.py so that
+    old revisions can be fed the same stream.
+    """
+    checksum = fletcher16(message)
+    body = bytes(message) + bytes([checksum & 0xff, checksum >> 8])
+    return b"\x7e" + body.replace(b"\x7d", b"\x7d\x5d").replace(b"\x7e", b"\x7d\x5e")
+
+
+def sampleTraffic(count: int, seed: int = 1) -> list[bytes]:
+    """
+    :return: *count* messages in the mix a busy panel sends unprompted: zone, partition and system status, and log
+        events.  Zone status messages carry bytes that need stuffing.
+    """
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(count):
+        kind = rng.choice(("zone", "partition", "system", "log"))
+        if kind == "zone":
+            message = bytes([0x08, 0x84, rng.randrange(192), 0x01, 0x00, 0x7e, 0x7d, rng.randrange(4), 0x00])
+        elif kind == "partition":
+            message = bytes([0x09, 0x86, 0]) + rng.randbytes(7)
+        elif kind == "system":
+            message = bytes([0x0b, 0x88, 4]) + rng.randbytes(9)
+        else:
+            message = bytes([0x0a, 0x8a, rng.randrange(256), 0xc5, rng.randrange(128), rng.randrange(192), 0, 1, 1, 1, 1])
+        messages.append(message)
+    return messages
@@ -0,0 +1,36 @@
+"""
+pytest setup: install the stand-in indigo module before caddx is imported, and give each test a fresh Caddx object.
+"""
+import pytest
+
+import indigo_stub
+
+indigo = indigo_stub.install()
+
+import caddx  # noqa: E402  (needs the stand-in indigo module)
+
+
+@pytest.fixture
+def fakeIndigo():
+    indigo.devices.clear()
+    indigo.variables.clear()
+    indigo.server.logged.clear()
+    indigo.plugin.errors.clear()
+    return indigo
+
+
+@pytest.fixture
+def makeCaddx(fakeIndigo):
+    """
+    :return: Factory making a Caddx object on a FakePlugin with the given communication loop mode.
+    """
+    made = []
+
+    def make(commLoopMode: str = "event") -> caddx.Caddx:
+        panel = caddx.Caddx(indigo_stub.FakePlugin(commLoopMode))
+        made.append(panel)
+        return panel
+
+    yield make
+    for panel in made:
+        panel.stopComm()
@@ -0,0 +1,145 @@
+"""
+Stand-in for the parts of the Indigo runtime the plugin uses, so caddx.py can be imported and driven outside the
+Indigo server.  The real indigo module only exists inside the server; install() registers this one in sys.modules
+in its place.  Shared by the tests and the benchmarks, and never shipped in the plugin bundle.
+"""
+import os
+import sys
+import tempfile
+import types
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PLUGIN_DIR = os.path.join(REPO_DIR, "Caddx Security System.indigoPlugin", "Contents", "Server Plugin")
+
+
+class Server(object):
+    def __init__(self, installFolder: str):
+        self.installFolder = installFolder
+        self.logged = []
+
+    def log(self, message, *args, **kwargs):
+        self.logged.append(str(message))
+
+    def speak(self, *args, **kwargs):
+        pass
+
+    def getInstallFolderPath(self) -> str:
+        return self.installFolder
+
+
+class Plugin(object):
+    def __init__(self):
+        self.errors = []
+
+    def errorLog(self, message, *args, **kwargs):
+        self.errors.append(str(message))
+
+
+class Folders(dict):
+    def create(self, name: str) -> str:
+        self[name] = name
+        return name
+
+
+class Devices(dict):
+    """
+    indigo.devices: device id -> device.  Tests put their fake devices in it.
+    """
+    def __init__(self):
+        super().__init__()
+        self.folders = Folders()
+        self.folder = self.folders
+
+    def iter(self, *args):
+        return iter(self.values())
+
+
+class Variables(dict):
+    """
+    indigo.variables: variable name -> value.
+    """
+    def __init__(self):
+        super().__init__()
+        self.folders = Folders()
+        self.folder = self.folders
+
+
+class Variable(object):
+    def __init__(self, variables: Variables):
+        self.variables = variables
+
+    def create(self, name: str, value="", folder=None) -> str:
+        self.variables[name] = value
+        return name
+
+    def updateValue(self, name: str, value=None) -> None:
+        self.variables[name] = value
+
+
+class StateImageSel(object):
+    SensorOn = "SensorOn"
+    SensorOff = "SensorOff"
+    SensorTripped = "SensorTripped"
+
+
+def install(installFolder: str | None = None) -> types.ModuleType:
+    """
+    Register a fresh stand-in indigo module and make the plugin sources importable.
+
+    :param installFolder: What indigo.server.getInstallFolderPath() returns.  A new temporary folder if None.
+    :return: The module.
+    """
+    if installFolder is None:
+        installFolder = tempfile.mkdtemp(prefix="indigo-")
+    os.makedirs(os.path.join(installFolder, "Preferences", "Plugins"), exist_ok=True)
+    indigo = types.ModuleType("indigo")
+    indigo.server = Server(installFolder)
+    indigo.plugin = Plugin()
+    indigo.devices = Devices()
+    indigo.variables = Variables()
+    indigo.variable = Variable(indigo.variables)
+    indigo.kStateImageSel = StateImageSel
+    indigo.PluginBase = object
+    indigo.Dict = dict
+    sys.modules["indigo"] = indigo
+    if PLUGIN_DIR not in sys.path:
+        sys.path.insert(0, PLUGIN_DIR)
+    return indigo
+
+
+class FakePlugin(object):
+    """
+    The attributes and methods of plugin.Plugin that the Caddx object reads, with the defaults of a fresh install.
+    """
+    pluginId = "com.ians.caddx"
+    debug = False
+    messageActInfo = messageProcessInfo = commandActInfo = zoneActInfo = partitionActInfo = alarmEventInfo = False
+    enableSpeakPrompts = False
+    sleepBetweenComm = 0.3
+    sleepBetweenIdlePoll = 0.01
+    watchdogTimerPeriod = 0
+    watchdogPollMode = "zoneStatus"
+    resyncOnFrameError = True
+    transportType = "serial"
+    socketKeepAlive = 30
+
+    def __init__(self, commLoopMode: str = "event"):
+        self.commLoopMode = commLoopMode
+        self.pluginPrefs = {
+            "variableFolderName": "Caddx", "codeLength": "4", "isSynchronising": False, "firmware": "",
+            "synchronised": False
+        }
+        self.errors = []
+        self.events = []
+
+    def debugLog(self, *args):
+        pass
+
+    def errorLog(self, message, *args):
+        self.errors.append(str(message))
+
+    def triggerEvent(self, event: str):
+        self.events.append(event)
+
+    def padDisplay(self, text: str) -> str:
+        return text.ljust(11)
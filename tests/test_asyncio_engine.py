@@ -0,0 +1,207 @@
+"""
+The asyncio engine driven over a pty: the plugin holds one end like a serial port, a stand-in panel the other.
+"""
+import os
+import pty
+import select
+import statistics
+import sys
+import termios
+import threading
+import time
+import tty
+
+import pytest
+
+import caddx
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="needs a pty")
+
+
+class PtyPort(object):
+    """
+    The plugin's end of a pty, with the part of the pySerial API activeCommLoop uses.
+    """
+
+    def __init__(self, timeout: float = 0.2):
+        self.master, self.slave = pty.openpty()
+        tty.setraw(self.master)
+        tty.setraw(self.slave)
+        os.set_blocking(self.slave, False)
+        self.timeout = timeout
+        self.cancelReceive, self.cancelSend = os.pipe()
+
+    @property
+    def in_waiting(self) -> int:
+        ready, _, _ = select.select([self.slave], [], [], 0)
+        return 1 if ready else 0
+
+    def read(self, size: int = 1) -> bytes:
+        ready, _, _ = select.select([self.slave, self.cancelReceive], [], [], self.timeout)
+        if self.slave not in ready:
+            return b""
+        return os.read(self.slave, size)
+
+    def write(self, data: bytes) -> int:
+        return os.write(self.slave, data)
+
+    def cancel_read(self) -> None:
+        os.write(self.cancelSend, b"x")
+
+    def reset_input_buffer(self) -> None:
+        termios.tcflush(self.slave, termios.TCIFLUSH)
+
+    def fileno(self) -> int:
+        return self.slave
+
+    def close(self) -> None:
+        pass
+
+
+class PtyPanel(object):
+    """
+    Stand-in panel on the far end of a PtyPort.  Every frame is acknowledged unless a behaviour is scripted for its
+    message number: "ignore", "nak", "reject" or "zone" (an unrelated Partition Status event, then the Zone Status
+    reply).
+    """
+
+    def __init__(self, port: PtyPort):
+        self.port = port
+        self.received = []						# message numbers received, in order
+        self.receivedAt = []					# time.perf_counter() when each frame arrived
+        self.script = {}						# message number -> behaviours, one per attempt
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def send(self, message: bytes) -> None:
+        os.write(self.port.master, caddx.encodeMessage(message.hex()))
+
+    def serve(self) -> None:
+        decoder = caddx.CaddxFrameDecoder()
+        while not self.stopped.is_set():
+            try:
+                ready, _, _ = select.select([self.port.master], [], [], 0.1)
+                if not ready:
+                    continue
+                decoder.feed(os.read(self.port.master, 1000))
+            except OSError:
+                return							# the plugin end has been closed
+            while (frame := decoder.nextFrame()) is not None:
+                messageNumber = frame[1] & 0x3f
+                self.received.append(messageNumber)
+                self.receivedAt.append(time.perf_counter())
+                if messageNumber == 0x1d:
+                    continue
+                behaviours = self.script.get(messageNumber)
+                behaviour = behaviours.pop(0) if behaviours else "ack"
+                if behaviour == "ack":
+                    self.send(bytes([1, 0x1d]))
+                elif behaviour == "nak":
+                    self.send(bytes([1, 0x1e]))
+                elif behaviour == "reject":
+                    self.send(bytes([1, 0x1f]))
+                elif behaviour == "zone":
+                    self.send(bytes([0x09, 0x86, 0, 0, 0, 0, 0, 0, 0, 0]))
+                    self.send(bytes([0x08, 0x04, frame[2], 1, 0, 0, 0, 0, 0]))
+
+
+@pytest.fixture
+def engine(makeCaddx):
+    """
+    :return: (Caddx object running the asyncio engine on a pty, stand-in panel, frames decoded by the plugin)
+    """
+    panel = makeCaddx("asyncio")
+    panel.updateVariable = lambda *args: None
+    port = PtyPort()
+    panel.conn = port
+    farEnd = PtyPanel(port)
+    decoded = []
+    decodeReceivedData = panel.decodeReceivedData
+
+    def recordDecoded(messageDict, reqMessageType):
+        decoded.append(messageDict[1] & 0x3f)
+        decodeReceivedData(messageDict, reqMessageType)
+
+    panel.decodeReceivedData = recordDecoded
+    loop = threading.Thread(target=panel.activeCommLoop, args=("pty", port, panel.commandQueue), daemon=True)
+    loop.start()
+    panel.commandQueue.join()					# startup requests
+    time.sleep(0.1)
+    assert panel.asyncEngine is not None
+    farEnd.received.clear()
+    decoded.clear()
+    yield panel, farEnd, decoded
+    panel.stopComm()
+    loop.join(3)
+    farEnd.stopped.set()
+
+
+def test_command_resent_until_answered_and_events_decoded_meanwhile(engine):
+    panel, farEnd, decoded = engine
+    farEnd.script[0x24] = ["ignore", "nak", "zone"]
+    panel.sendMsgToQueue("022405")
+    panel.commandQueue.join()
+    assert farEnd.received.count(0x24) == 3
+    assert 0x06 in decoded					# the unrelated partition event
+    assert 0x04 in decoded					# the reply
+
+
+def test_rejected_command_fails_without_retry(engine):
+    panel, farEnd, decoded = engine
+    farEnd.script[0x3d] = ["reject"]
+    reply = panel.sendMsgToQueue("03bd0101", wantReply=True)
+    panel.commandQueue.join()
+    assert farEnd.received.count(0x3d) == 1
+    with pytest.raises(caddx.CaddxCommandFailed):
+        reply.result(1)
+
+
+def test_event_dispatch_is_sub_millisecond(engine):
+    panel, farEnd, decoded = engine
+    latencies = []
+    handled = threading.Event()
+    partitionStatusMessage = panel.messageHandlers[0x06]
+    panel.messageHandlers[0x06] = (partitionStatusMessage[0], lambda messageDict: handled.set())
+    for _ in range(100):
+        handled.clear()
+        sentAt = time.perf_counter()
+        farEnd.send(bytes([0x09, 0x06, 0, 0, 0, 0, 0, 0, 0, 0]))
+        assert handled.wait(1)
+        latencies.append(time.perf_counter() - sentAt)
+    assert statistics.median(latencies) < 0.001
+
+
+def test_stop_ends_the_loop(makeCaddx):
+    panel = makeCaddx("asyncio")
+    panel.updateVariable = lambda *args: None
+    port = PtyPort()
+    farEnd = PtyPanel(port)
+    loop = threading.Thread(target=panel.activeCommLoop, args=("pty", port, panel.commandQueue), daemon=True)
+    loop.start()
+    time.sleep(0.2)
+    panel.stopComm()
+    loop.join(3)
+    farEnd.stopped.set()
+    assert not loop.is_alive()
+
+
+def test_far_end_closing_raises_out_of_the_loop(makeCaddx):
+    panel = makeCaddx("asyncio")
+    panel.updateVariable = lambda *args: None
+    port = PtyPort()
+    errors = []
+
+    def run():
+        try:
+            panel.activeCommLoop("pty", port, panel.commandQueue)
+        except Exception as err:
+            errors.append(err)
+
+    loop = threading.Thread(target=run, daemon=True)
+    loop.start()
+    time.sleep(0.2)
+    os.close(port.master)
+    loop.join(3)
+    assert not loop.is_alive()
+    assert errors and isinstance(errors[0], OSError)
@@ -0,0 +1,212 @@
+"""
+CaddxSocketTransport against a local socket server standing in for a ser2net style serial bridge.
+"""
+import socket
+import threading
+import time
+
+import pytest
+
+import caddx
+import indigo_stub
+
+
+class Bridge(object):
+    """
+    Local TCP server standing in for the bridge and the panel behind it: every frame received is recorded and, unless
+    it is an ACK, acknowledged.
+    """
+
+    def __init__(self):
+        self.server = socket.socket()
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen()
+        self.port = self.server.getsockname()[1]
+        self.clients = []
+        self.received = []						# frames received, hex
+        threading.Thread(target=self.accept, daemon=True).start()
+
+    def accept(self) -> None:
+        while True:
+            try:
+                client, _ = self.server.accept()
+            except OSError:
+                return							# server closed
+            self.clients.append(client)
+            threading.Thread(target=self.serve, args=(client,), daemon=True).start()
+
+    def serve(self, client: socket.socket) -> None:
+        decoder = caddx.CaddxFrameDecoder()
+        while True:
+            try:
+                data = client.recv(1000)
+            except OSError:
+                return
+            if not data:
+                return
+            decoder.feed(data)
+            while (frame := decoder.nextFrame()) is not None:
+                self.received.append(frame.hex())
+                if frame[1] & 0x3f != 0x1d:
+                    try:
+                        client.sendall(caddx.encodeMessage("011d"))
+                    except OSError:
+                        return
+
+    def send(self, message: bytes) -> None:
+        self.clients[-1].sendall(caddx.encodeMessage(message.hex()))
+
+    def dropClient(self) -> None:
+        client = self.clients[-1]
+        client.shutdown(socket.SHUT_RDWR)
+        client.close()
+
+    def close(self) -> None:
+        for sock in [self.server] + self.clients:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)		# wakes accept() and recv(); close() alone leaves them waiting
+            except OSError:
+                pass							# already closed
+            sock.close()
+
+    def waitFor(self, frameHex: str, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while frameHex not in self.received:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+
+@pytest.fixture
+def bridge():
+    server = Bridge()
+    yield server
+    server.close()
+
+
+def runLoop(panel: caddx.Caddx, conn: caddx.CaddxSocketTransport, bridge: Bridge) -> threading.Thread:
+    """
+    Start the communication loop on *conn* and let the startup requests it queues be answered.
+    """
+    panel.updateVariable = lambda *args: None
+    panel.conn = conn
+    loop = threading.Thread(target=panel.activeCommLoop, args=(str(conn), conn, panel.commandQueue), daemon=True)
+    loop.start()
+    deadline = time.monotonic() + 2
+    while not bridge.received and time.monotonic() < deadline:
+        time.sleep(0.01)
+    panel.commandQueue.join()
+    time.sleep(0.2)							# the last ACK
+    return loop
+
+
+def test_socket_options(makeCaddx, bridge):
+    panel = makeCaddx()
+    conn = caddx.CaddxSocketTransport(panel.plugin, "127.0.0.1", bridge.port, timeout=0.5)
+    conn.open()
+    assert conn.sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+    assert conn.sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+    assert not conn.sock.getblocking()
+    conn.close()
+
+
+@pytest.mark.parametrize("commLoopMode", ["poll", "event"])
+def test_queued_command_sent_after_reconnect(makeCaddx, bridge, commLoopMode):
+    panel = makeCaddx(commLoopMode)
+    conn = caddx.CaddxSocketTransport(panel.plugin, "127.0.0.1", bridge.port, timeout=0.5)
+    conn.open()
+    loop = runLoop(panel, conn, bridge)
+    decoded = []
+    decodeReceivedData = panel.decodeReceivedData
+
+    def recordDecoded(messageDict, reqMessageType):
+        decoded.append(messageDict[1] & 0x3f)
+        decodeReceivedData(messageDict, reqMessageType)
+
+    panel.decodeReceivedData = recordDecoded
+    bridge.send(bytes([0x08, 0x04, 2, 1, 0, 0, 0, 1, 0]))
+    deadline = time.monotonic() + 2
+    while 0x04 not in decoded and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert 0x04 in decoded
+
+    # the bridge drops the connection; a command queued meanwhile goes out once the link is back
+    bridge.dropClient()
+    panel.sendMsgToQueue("022407")
+    assert bridge.waitFor("022407", 5)
+    assert conn.reconnectCount >= 1
+    assert len(bridge.clients) >= 2
+    panel.stopComm()
+    loop.join(5)
+    assert not loop.is_alive()
+
+
+def test_reconnect_backs_off_while_bridge_is_gone(makeCaddx, bridge):
+    panel = makeCaddx()
+    conn = caddx.CaddxSocketTransport(panel.plugin, "127.0.0.1", bridge.port, timeout=0.5)
+    conn.open()
+    loop = runLoop(panel, conn, bridge)
+    bridge.close()
+    time.sleep(3)
+    retries = [error for error in panel.plugin.errors if "Retrying in" in error]
+    panel.stopComm()
+    loop.join(5)
+    assert not loop.is_alive()
+    assert 2 <= len(retries) <= 6				# about 0.5, 1, 2 seconds apart, not a tight loop
+
+
+def test_backoff_delays_double_with_jitter():
+    delays = caddx.backoffDelays(0.5, 8.0)
+    ceiling = 0.5
+    for _ in range(10):
+        delay = next(delays)
+        assert ceiling / 2 <= delay <= ceiling
+        ceiling = min(ceiling * 2, 8.0)
+
+
+def test_slow_write_does_not_drop_the_link(fakeIndigo):
+    # a bridge slow to take a large frame, sending a byte while the plugin's send waits: the reader thread shares
+    # the socket with write(), so the wait must not change how it receives
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    plugin = indigo_stub.FakePlugin()
+    conn = caddx.CaddxSocketTransport(plugin, "127.0.0.1", server.getsockname()[1], timeout=3)
+    conn.open()
+    peer, _ = server.accept()
+    stop = threading.Event()
+
+    def reader():
+        while not stop.is_set():
+            conn.read(1)
+
+    def drainLater():
+        time.sleep(0.3)
+        peer.sendall(b"\x7e")
+        time.sleep(0.3)							# still within writeTimeout
+        peer.setblocking(False)
+        end = time.monotonic() + 2
+        while time.monotonic() < end:
+            try:
+                peer.recv(1 << 20)
+            except BlockingIOError:
+                time.sleep(0.01)
+            except OSError:
+                return
+
+    readerThread = threading.Thread(target=reader, daemon=True)
+    readerThread.start()
+    threading.Thread(target=drainLater, daemon=True).start()
+    sent = conn.write(b"\x00" * (4 << 20))		# fills both socket buffers, so the send has to wait
+    time.sleep(1.5)
+    stop.set()
+    conn.cancel_read()
+    readerThread.join(5)
+    conn.close()
+    peer.close()
+    server.close()
+    assert sent == 4 << 20
+    assert conn.reconnectCount == 0
+    assert not [error for error in plugin.errors if "Lost connection" in error]